@@ -1,3 +1,4 @@
+from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
@@ -5,6 +6,73 @@ class Settings(BaseSettings):
     VERSION: str = "1.0.0"
     ENVIRONMENT: str = "development"
     DATABASE_URL: str = "sqlite:///.test.db"
+    DATABASE_ASYNC: bool = False
+    ASYNC_DATABASE_URL: Optional[str] = None
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_AUTO_MIGRATE: bool = True
+    DB_REPLICA_URLS: str = ""
+    DB_REPLICA_HEALTH_CHECK_SECONDS: float = 5.0
+    DB_READ_YOUR_WRITES_SECONDS: float = 5.0
+    SQLITE_PROFILE_ENABLED: bool = False
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_CACHE_SIZE_KB: int = 65536
+    SQLITE_MMAP_SIZE_MB: int = 256
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: Optional[int] = None
+    SERVER_BACKLOG: int = 2048
+    SERVER_KEEPALIVE_SECONDS: int = 5
+    TASK_CACHE_ENABLED: bool = False
+    TASK_CACHE_BACKEND: str = "memory"
+    TASK_CACHE_TTL_SECONDS: float = 30.0
+    TASK_CACHE_MAX_ENTRIES: int = 10000
+    TASK_CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+    TASK_EVENTS_BACKEND: str = "local"
+    TASK_EVENTS_REDIS_URL: str = "redis://localhost:6379/0"
+    TASK_EVENTS_CHANNEL: str = "epidata:task-events"
+    TASK_EVENTS_QUEUE_SIZE: int = 100
+    TASK_EVENTS_DROP_POLICY: str = "drop_oldest"
+    TASK_EVENTS_HEARTBEAT_SECONDS: float = 15.0
+    ADMISSION_CONTROL_ENABLED: bool = False
+    ADMISSION_MAX_CONCURRENCY: int = 15
+    ADMISSION_ROUTE_LIMITS: str = "lookup:15,write:10,list:6,bulk:2,export:2"
+    ADMISSION_QUEUE_SIZE: int = 100
+    ADMISSION_QUEUE_TIMEOUT_MS: float = 2000.0
+    ADMISSION_RETRY_AFTER_SECONDS: int = 1
+    SERVER_TIMING_ENABLED: bool = True
+    SLOW_QUERY_LOG_ENABLED: bool = False
+    SLOW_QUERY_THRESHOLD_MS: float = 100.0
+    SLOW_REQUEST_THRESHOLD_MS: float = 1000.0
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_ENCODINGS: str = "zstd,br,gzip"
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 1
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_ZSTD_LEVEL: int = 3
+    IDEMPOTENCY_TTL_SECONDS: float = 86400.0
+    IDEMPOTENCY_PURGE_INTERVAL_SECONDS: float = 3600.0
+    IDEMPOTENCY_PURGE_BATCH_SIZE: int = 1000
+    TASKS_PAGE_DEFAULT_LIMIT: int = 100
+    TASKS_PAGE_MAX_LIMIT: int = 1000
+    TASKS_EXPORT_BATCH_SIZE: int = 1000
+    TASKS_BULK_MAX_ITEMS: int = 10000
+    TASKS_BULK_CHUNK_SIZE: int = 1000
+    TASKS_STATS_COUNTER_ENABLED: bool = True
+    TASKS_ARCHIVE_ENABLED: bool = False
+    TASKS_ARCHIVE_AFTER_DAYS: float = 30.0
+    TASKS_ARCHIVE_INTERVAL_SECONDS: float = 600.0
+    TASKS_ARCHIVE_BATCH_SIZE: int = 500
+    TASK_TOMBSTONES_RETENTION_DAYS: float = 30.0
+    TASK_TOMBSTONES_PRUNE_INTERVAL_SECONDS: float = 3600.0
+    TASK_TOMBSTONES_PRUNE_BATCH_SIZE: int = 1000
+    TASK_WRITE_COALESCING_ENABLED: bool = False
+    TASK_WRITE_BATCH_MAX_SIZE: int = 100
+    TASK_WRITE_BATCH_MAX_DELAY_MS: float = 5.0
     
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
     
@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+from app.domain.models.task_event import TaskEvent
+
+class TaskEventPublisher(ABC):
+    
+    @abstractmethod
+    def publish(self, task_event: TaskEvent) -> None:
+        pass
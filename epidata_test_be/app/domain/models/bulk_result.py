@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from typing import Optional
+from app.domain.models.task_entity import Task
+
+@dataclass
+class BulkItemResult:
+    index: int
+    id: Optional[int]
+    ok: bool
+    task: Optional[Task] = None
+    error: Optional[str] = None
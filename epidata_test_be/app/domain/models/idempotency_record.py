@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+@dataclass
+class IdempotencyRecord:
+    scope: str
+    key: str
+    request_hash: str
+    expires_at: datetime
+    # Both unset while the first request holding the key is still running
+    status_code: Optional[int] = None
+    body: Optional[bytes] = None
@@ -0,0 +1,20 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+from app.domain.models.task_entity import Task
+
+@dataclass
+class TaskTombstone:
+    id: int
+    version: int
+    deleted_at: Optional[datetime] = None
+
+@dataclass
+class TaskChanges:
+    tasks: List[Task] = field(default_factory=lambda: [])
+    deleted: List[TaskTombstone] = field(default_factory=lambda: [])
+    # Pass back as `since` to continue; equals the requested version when nothing changed
+    next_since: int = 0
+    has_more: bool = False
+    # Deletes at or below `since` were pruned: reload the full list, then resume from `next_since`
+    full_resync: bool = False
@@ -1,8 +1,11 @@
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     id: Optional[int]
     title: str
-    completed: bool = False
\ No newline at end of file
+    completed: bool = False
+    version: Optional[int] = None
+    updated_at: Optional[datetime] = None
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from typing import Optional
+from app.domain.models.task_entity import Task
+
+TASK_CREATED = "created"
+TASK_UPDATED = "updated"
+TASK_COMPLETED = "completed"
+TASK_DELETED = "deleted"
+
+@dataclass
+class TaskEvent:
+    type: str
+    task_id: Optional[int]
+    task: Optional[Task] = None
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+@dataclass
+class TaskListFingerprint:
+    max_version: int
+    count: int
+    last_modified: Optional[datetime] = None
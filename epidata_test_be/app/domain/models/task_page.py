@@ -0,0 +1,8 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+from app.domain.models.task_entity import Task
+
+@dataclass
+class TaskPage:
+    items: List[Task] = field(default_factory=lambda: [])
+    next_cursor: Optional[int] = None
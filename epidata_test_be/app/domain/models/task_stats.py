@@ -0,0 +1,7 @@
+from dataclasses import dataclass
+
+@dataclass
+class TaskStats:
+    total: int
+    completed: int
+    pending: int
@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from app.domain.models.idempotency_record import IdempotencyRecord
+
+class AsyncIdempotencyRepository(ABC):
+    
+    @abstractmethod
+    async def find(self, scope: str, key: str) -> Optional[IdempotencyRecord]:
+        pass
+    
+    @abstractmethod
+    async def reserve(self, scope: str, key: str, request_hash: str, ttl_seconds: float) -> bool:
+        pass
+    
+    @abstractmethod
+    async def complete(self, scope: str, key: str, status_code: int, body: bytes) -> None:
+        pass
+    
+    @abstractmethod
+    async def release(self, scope: str, key: str) -> None:
+        pass
@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from app.domain.models.task_entity import Task
+from app.domain.models.task_page import TaskPage
+from app.domain.models.task_list_fingerprint import TaskListFingerprint
+
+class AsyncTaskRepository(ABC):
+    
+    @abstractmethod
+    async def get_all(self) -> List[Task]:
+        pass
+    
+    @abstractmethod
+    async def list_page(
+        self,
+        limit: int,
+        after: Optional[int] = None,
+        completed: Optional[bool] = None,
+        title_prefix: Optional[str] = None
+    ) -> TaskPage:
+        pass
+    
+    @abstractmethod
+    async def get_by_id(self, task_id: int) -> Optional[Task]:
+        pass
+    
+    @abstractmethod
+    async def list_fingerprint(self) -> TaskListFingerprint:
+        pass
+    
+    @abstractmethod
+    async def create(self, task_title: str) -> Task:
+        pass
+    
+    @abstractmethod
+    async def update(self, task_id: int, updated_task: Task) -> Task:
+        pass
+    
+    @abstractmethod
+    async def delete(self, task_id: int) -> None:
+        pass
+    
+    @abstractmethod
+    async def mark_complete(self, task_id: int) -> Task:
+        pass
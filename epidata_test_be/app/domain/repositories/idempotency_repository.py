@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from app.domain.models.idempotency_record import IdempotencyRecord
+
+class IdempotencyRepository(ABC):
+    
+    @abstractmethod
+    def find(self, scope: str, key: str) -> Optional[IdempotencyRecord]:
+        pass
+    
+    @abstractmethod
+    def reserve(self, scope: str, key: str, request_hash: str, ttl_seconds: float) -> bool:
+        pass
+    
+    @abstractmethod
+    def complete(self, scope: str, key: str, status_code: int, body: bytes) -> None:
+        pass
+    
+    @abstractmethod
+    def release(self, scope: str, key: str) -> None:
+        pass
+    
+    @abstractmethod
+    def purge_expired(self, batch_size: int) -> int:
+        pass
@@ -1,6 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from app.domain.models.task_entity import Task
+from app.domain.models.task_page import TaskPage
+from app.domain.models.bulk_result import BulkItemResult
+from app.domain.models.task_list_fingerprint import TaskListFingerprint
+from app.domain.models.task_changes import TaskChanges
+from app.domain.models.task_stats import TaskStats
 
 class TaskRepository(ABC):
     
@@ -8,10 +13,40 @@ class TaskRepository(ABC):
     def get_all(self) -> List[Task]:
         pass
     
+    @abstractmethod
+    def list_page(
+        self,
+        limit: int,
+        after: Optional[int] = None,
+        completed: Optional[bool] = None,
+        title_prefix: Optional[str] = None
+    ) -> TaskPage:
+        pass
+    
+    @abstractmethod
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Task]:
+        pass
+    
     @abstractmethod
     def get_by_id(self, task_id: int) -> Optional[Task]:
         pass
     
+    @abstractmethod
+    def list_fingerprint(self) -> TaskListFingerprint:
+        pass
+    
+    @abstractmethod
+    def stats(self) -> TaskStats:
+        pass
+    
+    @abstractmethod
+    def changes_since(self, since: int, limit: int) -> TaskChanges:
+        pass
+    
+    @abstractmethod
+    def search(self, query: str, limit: int, offset: int = 0) -> TaskPage:
+        pass
+    
     @abstractmethod
     def create(self, task_title: str) -> Task:
         pass
@@ -26,4 +61,16 @@ class TaskRepository(ABC):
     
     @abstractmethod
     def mark_complete(self, task_id: int) -> Task:
+        pass
+    
+    @abstractmethod
+    def create_many(self, task_titles: List[str]) -> List[BulkItemResult]:
+        pass
+    
+    @abstractmethod
+    def update_many(self, updated_tasks: List[Task]) -> List[BulkItemResult]:
+        pass
+    
+    @abstractmethod
+    def delete_many(self, task_ids: List[int]) -> List[BulkItemResult]:
         pass
\ No newline at end of file
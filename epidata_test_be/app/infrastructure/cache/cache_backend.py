@@ -0,0 +1,99 @@
+import importlib
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+class CacheBackend(ABC):
+    
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        pass
+    
+    @abstractmethod
+    def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        pass
+    
+    @abstractmethod
+    def delete(self, *keys: str) -> None:
+        pass
+    
+    @abstractmethod
+    def incr(self, key: str) -> int:
+        pass
+
+class InMemoryCacheBackend(CacheBackend):
+    """Process-local LRU cache whose entries also expire after their TTL."""
+    
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            if key in self._counters:
+                return str(self._counters[key])
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+        
+    def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+                
+    def incr(self, key: str) -> int:
+        # Counters never expire or get evicted, a lost version would serve stale lists
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+class RedisCacheBackend(CacheBackend):
+    """Backend for any client exposing the redis-py get/set/delete/incr API."""
+    
+    def __init__(self, client: Any, key_prefix: str = "epidata:"):
+        self.client = client
+        self.key_prefix = key_prefix
+        
+    def get(self, key: str) -> Optional[str]:
+        value = self.client.get(self.key_prefix + key)
+        if value is None:
+            return None
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+    
+    def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        self.client.set(self.key_prefix + key, value, px=max(int(ttl_seconds * 1000), 1))
+        
+    def delete(self, *keys: str) -> None:
+        if keys:
+            self.client.delete(*[self.key_prefix + key for key in keys])
+            
+    def incr(self, key: str) -> int:
+        return int(self.client.incr(self.key_prefix + key))
+
+def create_cache_backend(backend: str, max_entries: int, redis_url: str) -> CacheBackend:
+    if backend == "memory":
+        return InMemoryCacheBackend(max_entries)
+    if backend == "redis":
+        try:
+            redis = importlib.import_module("redis")
+        except ImportError as e:
+            raise RuntimeError("TASK_CACHE_BACKEND=redis requires the 'redis' package") from e
+        return RedisCacheBackend(redis.Redis.from_url(redis_url))
+    raise ValueError(f"Unknown cache backend: {backend}")
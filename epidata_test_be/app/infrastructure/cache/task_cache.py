@@ -0,0 +1,28 @@
+from typing import Callable, Optional
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app.config.settings import settings
+from app.domain.repositories.task_repository import TaskRepository
+from app.infrastructure.cache.cache_backend import CacheBackend, create_cache_backend
+from app.infrastructure.repositories.cached_task_repo import CachedTaskRepository, CacheStats
+
+# Shared by every request of this worker
+task_cache_backend: Optional[CacheBackend] = (
+    create_cache_backend(settings.TASK_CACHE_BACKEND, settings.TASK_CACHE_MAX_ENTRIES, settings.TASK_CACHE_REDIS_URL)
+    if settings.TASK_CACHE_ENABLED else None
+)
+task_cache_stats = CacheStats()
+
+def with_task_cache(repo: TaskRepository, session: Optional[Session] = None) -> TaskRepository:
+    if task_cache_backend is None:
+        return repo
+    
+    def after_commit(invalidate: Callable[[], None]) -> None:
+        def on_commit(_: Session) -> None:
+            invalidate()
+        event.listen(session, "after_commit", on_commit, once=True)
+        
+    return CachedTaskRepository(
+        repo, task_cache_backend, settings.TASK_CACHE_TTL_SECONDS, task_cache_stats,
+        after_commit if session is not None else None
+    )
@@ -0,0 +1,31 @@
+"""Creates the database schema.
+
+Run once per deploy, before the workers start:
+
+    python -m app.infrastructure.db.migrate
+"""
+import logging
+import time
+from sqlalchemy.engine import Engine
+from app.infrastructure.db.models.base import Base
+# Imported for their side effect of registering tables and DDL hooks on Base
+import app.infrastructure.db.models.task_model  # noqa: F401  # pyright: ignore[reportUnusedImport]
+import app.infrastructure.db.models.task_version_model  # noqa: F401  # pyright: ignore[reportUnusedImport]
+import app.infrastructure.db.models.task_tombstone_model  # noqa: F401  # pyright: ignore[reportUnusedImport]
+import app.infrastructure.db.models.task_search_index  # noqa: F401  # pyright: ignore[reportUnusedImport]
+import app.infrastructure.db.models.task_stats_model  # noqa: F401  # pyright: ignore[reportUnusedImport]
+import app.infrastructure.db.models.task_archive_model  # noqa: F401  # pyright: ignore[reportUnusedImport]
+import app.infrastructure.db.models.idempotency_key_model  # noqa: F401  # pyright: ignore[reportUnusedImport]
+
+logger = logging.getLogger(__name__)
+
+def run_migrations(engine: Engine) -> None:
+    started = time.perf_counter()
+    Base.metadata.create_all(bind=engine)
+    logger.info(f'Schema ready in {(time.perf_counter() - started) * 1000:.1f} ms')
+
+if __name__ == "__main__":
+    from app.infrastructure.db.models.session import get_engine, dispose_engine
+    logging.basicConfig(level=logging.INFO)
+    run_migrations(get_engine())
+    dispose_engine()
@@ -0,0 +1,105 @@
+import threading
+import time
+from typing import Any, AsyncIterator, Optional, Tuple
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
+from app.config.settings import settings
+from app.infrastructure.db.models.session import engine_options, sqlite_profile
+from app.infrastructure.db.pool_metrics import PoolMetrics
+from app.infrastructure.db.query_metrics import QueryMetrics
+from app.infrastructure.metrics.request_timings import record_phase
+
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "mysql": "mysql+aiomysql",
+}
+
+def to_async_url(database_url: str) -> str:
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS or url.get_driver_name() in ("aiosqlite", "aiomysql", "asyncmy"):
+        return database_url
+    return url.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+def create_async_primary_engines(database_url: str) -> Tuple[AsyncEngine, Optional[AsyncEngine]]:
+    """Async counterpart of create_primary_engines.
+    
+    Async writes read before they write (the Idempotency-Key lookup before its
+    INSERT), and a deferred BEGIN that upgrades to a write can fail with
+    SQLITE_BUSY while another writer holds the lock. Under the SQLite profile
+    they get the same one-connection writer that begins IMMEDIATE.
+    """
+    options = engine_options(database_url)
+    profile = sqlite_profile(database_url)
+    if profile is None:
+        return create_async_engine(database_url, **options), None
+    writer = create_async_engine(database_url, **{**options, "pool_size": 1, "max_overflow": 0})
+    reader = create_async_engine(database_url, **options)
+    profile.attach(writer.sync_engine, writer=True)
+    profile.attach(reader.sync_engine, writer=False)
+    return writer, reader
+
+ASYNC_DATABASE_URL = settings.ASYNC_DATABASE_URL or to_async_url(settings.DATABASE_URL)
+# Created on first use, like the sync engine
+async_engine: Optional[AsyncEngine] = None
+# Set under the SQLite profile only
+async_read_engine: Optional[AsyncEngine] = None
+
+class LazyAsyncSessionMaker(async_sessionmaker[AsyncSession]):
+    def __call__(self, **local_kw: Any) -> AsyncSession:
+        get_async_engine()
+        return super().__call__(**local_kw)
+
+AsyncSessionLocal = LazyAsyncSessionMaker(expire_on_commit=False)
+async_pool_metrics = PoolMetrics()
+async_query_metrics = QueryMetrics(None, settings.SLOW_QUERY_LOG_ENABLED, settings.SLOW_QUERY_THRESHOLD_MS)
+_engine_lock = threading.Lock()
+
+def get_async_engine() -> AsyncEngine:
+    global async_engine, async_read_engine
+    if async_engine is None:
+        with _engine_lock:
+            if async_engine is None:
+                created, reader = create_async_primary_engines(ASYNC_DATABASE_URL)
+                AsyncSessionLocal.configure(bind=created)
+                async_pool_metrics.attach(created.sync_engine.pool)
+                async_query_metrics.attach(created.sync_engine)
+                if reader is not None:
+                    async_query_metrics.attach(reader.sync_engine)
+                    async_read_engine = reader
+                async_engine = created
+    return async_engine
+
+async def dispose_async_engine() -> None:
+    if async_engine is not None:
+        await async_engine.dispose()
+    if async_read_engine is not None:
+        await async_read_engine.dispose()
+
+async def get_async_db_session() -> AsyncIterator[AsyncSession]:
+    """Async counterpart of get_db_session."""
+    async with AsyncSessionLocal() as db:
+        started = time.perf_counter()
+        await db.connection()
+        waited = time.perf_counter() - started
+        async_pool_metrics.record_wait(waited)
+        record_phase("pool", waited)
+        try:
+            yield db
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
+async def get_async_read_db_session() -> AsyncIterator[AsyncSession]:
+    """Session for an async request that only reads, on the read engine if there is one."""
+    get_async_engine()
+    async with AsyncSessionLocal() if async_read_engine is None else AsyncSessionLocal(bind=async_read_engine) as db:
+        started = time.perf_counter()
+        await db.connection()
+        waited = time.perf_counter() - started
+        if async_read_engine is None:
+            async_pool_metrics.record_wait(waited)
+        record_phase("pool", waited)
+        # Nothing to commit: closing rolls the read transaction back
+        yield db
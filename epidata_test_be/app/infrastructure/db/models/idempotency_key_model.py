@@ -0,0 +1,23 @@
+from app.infrastructure.db.models.base import Base
+from sqlalchemy import Column, DateTime, Integer, LargeBinary, String, UniqueConstraint
+
+class IdempotencyKeyModel(Base):
+    """Responses of requests sent with an Idempotency-Key, replayed on retries.
+    
+    The unique (scope, key) pair is what serializes concurrent duplicates: the
+    second insert waits for the first transaction and then fails.
+    """
+    __tablename__ = "idempotency_keys"
+    __table_args__ = (
+        UniqueConstraint("scope", "idempotency_key", name="uq_idempotency_keys_scope_key"),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    scope = Column(String(64), nullable=False)
+    idempotency_key = Column(String(255), nullable=False)
+    request_hash = Column(String(64), nullable=False)
+    status_code = Column(Integer, nullable=True)
+    # LONGBLOB on MySQL: a bulk response can exceed the 64 KB of a plain BLOB
+    response_body = Column(LargeBinary(length=2**32 - 1), nullable=True)
+    created_at = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
@@ -1,6 +1,173 @@
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import Session, sessionmaker
 from app.config.settings import settings
+from app.infrastructure.db.pool_metrics import PoolMetrics
+from app.infrastructure.db.query_metrics import QueryMetrics
+from app.infrastructure.db.replica_router import ReplicaRouter
+from app.infrastructure.db.sqlite_profile import SQLiteProfile, is_sqlite_file
+from app.infrastructure.metrics.request_timings import record_phase
 
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(bind=engine)
\ No newline at end of file
+def engine_options(database_url: str) -> Dict[str, Any]:
+    options: Dict[str, Any] = {
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+    url = make_url(database_url)
+    # In-memory SQLite uses a per-thread connection pool that has no size limits
+    if not (url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")):
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+        )
+    return options
+
+def sqlite_profile(database_url: str) -> Optional[SQLiteProfile]:
+    if not (settings.SQLITE_PROFILE_ENABLED and is_sqlite_file(database_url)):
+        return None
+    return SQLiteProfile(
+        settings.SQLITE_SYNCHRONOUS,
+        settings.SQLITE_BUSY_TIMEOUT_MS,
+        settings.SQLITE_CACHE_SIZE_KB,
+        settings.SQLITE_MMAP_SIZE_MB
+    )
+
+def create_primary_engines(database_url: str) -> Tuple[Engine, Optional[Engine]]:
+    """The engine writes go through and, under the SQLite profile, one for reads.
+    
+    SQLite runs one writer at a time, so the profile's write engine holds a single
+    connection and its pool is the queue writers wait in (up to DB_POOL_TIMEOUT),
+    while reads run side by side on the read engine's pool.
+    """
+    options = engine_options(database_url)
+    profile = sqlite_profile(database_url)
+    if profile is None:
+        return create_engine(database_url, **options), None
+    writer = create_engine(database_url, **{**options, "pool_size": 1, "max_overflow": 0})
+    reader = create_engine(database_url, **options)
+    profile.attach(writer, writer=True)
+    profile.attach(reader, writer=False)
+    return writer, reader
+
+# The engine is created on first use (normally by the app lifespan) rather than at
+# import, so importing the app stays cheap and never touches the database
+engine: Optional[Engine] = None
+# Set under the SQLite profile only
+read_engine: Optional[Engine] = None
+
+class LazySessionMaker(sessionmaker[Session]):
+    def __call__(self, **local_kw: Any) -> Session:
+        get_engine()
+        return super().__call__(**local_kw)
+
+SessionLocal = LazySessionMaker()
+pool_metrics = PoolMetrics()
+query_metrics = QueryMetrics(None, settings.SLOW_QUERY_LOG_ENABLED, settings.SLOW_QUERY_THRESHOLD_MS)
+replica_router = ReplicaRouter()
+_engine_lock = threading.Lock()
+
+def replica_urls() -> List[str]:
+    return [url.strip() for url in settings.DB_REPLICA_URLS.split(",") if url.strip()]
+
+def get_engine() -> Engine:
+    global engine, read_engine
+    if engine is None:
+        with _engine_lock:
+            if engine is None:
+                created, reader = create_primary_engines(settings.DATABASE_URL)
+                SessionLocal.configure(bind=created)
+                pool_metrics.attach(created.pool)
+                query_metrics.attach(created)
+                if reader is not None:
+                    query_metrics.attach(reader)
+                    read_engine = reader
+                for url in replica_urls():
+                    replica = create_engine(url, **engine_options(url))
+                    query_metrics.attach(replica)
+                    replica_router.add(replica)
+                engine = created
+    return engine
+
+def create_dedicated_engine() -> Engine:
+    """A one-connection engine on the primary for a background writer.
+    
+    Requests hold their pooled connection while they wait on such a writer, so it
+    must never queue for a connection from that same pool.
+    """
+    options = engine_options(settings.DATABASE_URL)
+    if "pool_size" in options:
+        options.update(pool_size=1, max_overflow=0)
+    dedicated = create_engine(settings.DATABASE_URL, **options)
+    profile = sqlite_profile(settings.DATABASE_URL)
+    if profile is not None:
+        profile.attach(dedicated, writer=True)
+    query_metrics.attach(dedicated)
+    return dedicated
+
+def dispose_engine() -> None:
+    if engine is not None:
+        engine.dispose()
+    if read_engine is not None:
+        read_engine.dispose()
+    replica_router.dispose()
+
+def get_db_session() -> Iterator[Session]:
+    """One session, one connection checkout and one transaction per request."""
+    with SessionLocal() as db:
+        started = time.perf_counter()
+        db.connection()
+        waited = time.perf_counter() - started
+        pool_metrics.record_wait(waited)
+        record_phase("pool", waited)
+        try:
+            yield db
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+def get_read_db_session(pinned_to_primary: bool = False) -> Iterator[Session]:
+    """Session for a request that only reads: a healthy replica, else the primary.
+    
+    Replicas are tried in round-robin order; one whose connection fails is taken
+    out of rotation and the next is tried. `pinned_to_primary` skips replicas for
+    clients that must see their own recent writes.
+    """
+    get_engine()
+    for replica in [] if pinned_to_primary else replica_router.candidates():
+        db = SessionLocal(bind=replica)
+        started = time.perf_counter()
+        try:
+            # pool_pre_ping makes the checkout itself fail on a dead replica
+            db.connection()
+        except SQLAlchemyError as e:
+            db.close()
+            replica_router.mark_down(replica, e)
+            continue
+        record_phase("pool", time.perf_counter() - started)
+        replica_router.record_read(replica)
+        with db:
+            # Nothing to commit: closing rolls the read transaction back
+            yield db
+        return
+    if read_engine is not None:
+        # A WAL reader sees every committed write, pinned or not
+        with SessionLocal(bind=read_engine) as db:
+            started = time.perf_counter()
+            db.connection()
+            record_phase("pool", time.perf_counter() - started)
+            yield db
+        return
+    yield from get_db_session()
+
+def open_read_session() -> Session:
+    """A session for reads made outside a request, on the read engine if there is one."""
+    return SessionLocal(bind=read_engine) if read_engine is not None else SessionLocal()
+
+def is_replica_session(db: Session) -> bool:
+    return db.get_bind() in replica_router.engines
@@ -0,0 +1,117 @@
+from app.infrastructure.db.models.base import Base
+from sqlalchemy import Boolean, Column, DateTime, Integer, MetaData, String, delete, event, func, insert, inspect, literal, select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.schema import CreateTable
+from sqlalchemy.sql import Delete, Insert, Select
+from datetime import datetime
+from typing import Any, List, Tuple
+from app.infrastructure.db.models.task_model import TaskModel
+from app.infrastructure.db.models.task_tombstone_model import TaskTombstoneModel
+# Registers the version column upgrade first, the rebuild below copies those columns
+import app.infrastructure.db.models.task_version_model  # noqa: F401  # pyright: ignore[reportUnusedImport]
+
+_TASK_COLUMNS = ("title", "completed", "version", "updated_at")
+
+class TaskArchiveModel(Base):
+    """Completed tasks moved out of `tasks` by the archival job.
+    
+    Rows keep the task's id and columns, so an archived task is still found by
+    id. Keyed by its own id, like the tombstones.
+    """
+    __tablename__ = "tasks_archive"
+    
+    id = Column(Integer, primary_key=True)
+    task_id = Column(Integer, nullable=False, index=True)
+    title = Column(String(255), nullable=False)
+    completed = Column(Boolean, nullable=False)
+    version = Column(Integer, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+    archived_at = Column(DateTime, nullable=False)
+
+def ensure_task_ids_not_reused(_: Any, connection: Connection, **__: Any) -> None:
+    """Rebuilds a SQLite `tasks` table created without AUTOINCREMENT.
+    
+    Without it SQLite hands out max(id) + 1, so the id of an archived or deleted
+    task comes back once it is the highest. Follows SQLite's table rebuild
+    recipe, keeping the table's indexes and triggers, and starts the sequence
+    past every id the archive and the tombstones still hold.
+    """
+    if connection.dialect.name != "sqlite" or not inspect(connection).has_table("tasks"):
+        return
+    schema = connection.execute(text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'tasks'")).scalar_one()
+    if "AUTOINCREMENT" in schema.upper():
+        return
+    tasks = TaskModel.__table__
+    rebuilt = tasks.to_metadata(MetaData(), name="tasks_rebuild")
+    dependents = connection.execute(text(
+        "SELECT sql FROM sqlite_master WHERE tbl_name = 'tasks' AND type IN ('index', 'trigger') AND sql IS NOT NULL"
+    )).scalars().all()
+    connection.execute(CreateTable(rebuilt))
+    connection.execute(insert(rebuilt).from_select([c.name for c in tasks.c], select(*tasks.c)))
+    connection.execute(text("DROP TABLE tasks"))
+    connection.execute(text("ALTER TABLE tasks_rebuild RENAME TO tasks"))
+    for statement in dependents:
+        connection.execute(text(statement))
+    ids = (tasks.c.id, TaskArchiveModel.__table__.c.task_id, TaskTombstoneModel.__table__.c.task_id)
+    highest = connection.execute(
+        select(func.max(*(func.coalesce(select(func.max(c)).scalar_subquery(), 0) for c in ids)))
+    ).scalar_one()
+    connection.execute(text("DELETE FROM sqlite_sequence WHERE name = 'tasks'"))
+    connection.execute(text("INSERT INTO sqlite_sequence (name, seq) VALUES ('tasks', :seq)").bindparams(seq=highest))
+
+event.listen(Base.metadata, "after_create", ensure_task_ids_not_reused)
+
+def archivable_ids_statement(completed_before: datetime, batch_size: int) -> Select[Any]:
+    """Ids of the oldest completed tasks last written before `completed_before`.
+    
+    Range-scans ix_tasks_completed_id.
+    """
+    tasks = TaskModel.__table__
+    return (
+        select(tasks.c.id)
+        .where(tasks.c.completed == True, tasks.c.updated_at <= completed_before)  # noqa: E712
+        .order_by(tasks.c.id)
+        .limit(batch_size)
+    )
+
+def archive_statements(task_ids: List[int], now: datetime) -> Tuple[Insert, Delete]:
+    """Copy into the archive, then delete from `tasks`, the given tasks."""
+    tasks = TaskModel.__table__
+    archive = TaskArchiveModel.__table__
+    copy = insert(archive).from_select(
+        ["task_id", *_TASK_COLUMNS, "archived_at"],
+        select(tasks.c.id, *(tasks.c[name] for name in _TASK_COLUMNS), literal(now)).where(tasks.c.id.in_(task_ids))
+    )
+    return copy, delete(tasks).where(tasks.c.id.in_(task_ids))
+
+def archived_task_statement(task_id: int) -> Select[Any]:
+    # Labelled like the `tasks` columns so rows map to Task the same way
+    archive = TaskArchiveModel.__table__
+    return (
+        select(archive.c.task_id.label("id"), *(archive.c[name] for name in _TASK_COLUMNS))
+        .where(archive.c.task_id == task_id)
+        .order_by(archive.c.id.desc())
+        .limit(1)
+    )
+
+def archived_ids_statement(task_ids: List[int]) -> Select[Any]:
+    archive = TaskArchiveModel.__table__
+    return select(archive.c.task_id).where(archive.c.task_id.in_(task_ids)).distinct()
+
+def restore_statements(task_ids: List[int]) -> Tuple[Insert, Delete]:
+    """Move archived tasks back into `tasks`, keeping their ids.
+    
+    Only for ids missing from `tasks`; the latest copy of each id is restored.
+    """
+    tasks = TaskModel.__table__
+    archive = TaskArchiveModel.__table__
+    latest = select(func.max(archive.c.id)).where(archive.c.task_id.in_(task_ids)).group_by(archive.c.task_id)
+    copy = insert(tasks).from_select(
+        ["id", *_TASK_COLUMNS],
+        select(archive.c.task_id, *(archive.c[name] for name in _TASK_COLUMNS)).where(archive.c.id.in_(latest))
+    )
+    return copy, remove_archived_statement(task_ids)
+
+def remove_archived_statement(task_ids: List[int]) -> Delete:
+    archive = TaskArchiveModel.__table__
+    return delete(archive).where(archive.c.task_id.in_(task_ids))
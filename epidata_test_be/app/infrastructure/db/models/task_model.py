@@ -1,13 +1,30 @@
 from app.infrastructure.db.models.base import Base
-from sqlalchemy import Column, Integer, String, Boolean
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Index
+from datetime import datetime, timezone
 from typing import cast
 
+def utcnow() -> datetime:
+    # Stored naive, always UTC
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+def as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc)
+
 class TaskModel(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Serves the keyset pagination filtered by completion state
+        Index("ix_tasks_completed_id", "completed", "id"),
+        # Ids of deleted and archived tasks are never handed out again
+        {"sqlite_autoincrement": True},
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255), nullable=False)
     completed = Column(Boolean, default=False)
+    # Taken from task_version_counter on every write, so it grows across the whole table
+    version = Column(Integer, nullable=False, default=0, index=True)
+    updated_at = Column(DateTime, nullable=False, default=utcnow)
     
     @property
     def id_value(self) -> int:
@@ -19,4 +36,12 @@ class TaskModel(Base):
     
     @property
     def completed_value(self) -> bool:
-        return cast(bool, self.completed)
\ No newline at end of file
+        return cast(bool, self.completed)
+    
+    @property
+    def version_value(self) -> int:
+        return cast(int, self.version)
+    
+    @property
+    def updated_at_value(self) -> datetime:
+        return as_utc(cast(datetime, self.updated_at))
@@ -0,0 +1,86 @@
+import re
+from typing import Any, List, Tuple
+from sqlalchemy import Column, Select, and_, column, event, inspect, select, table, text
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.engine import Connection
+from app.infrastructure.db.models.base import Base
+from app.infrastructure.db.models.task_model import TaskModel
+
+TITLE_INDEX = "ix_tasks_title"
+FULLTEXT_INDEX = "ix_tasks_title_fulltext"
+FTS_TABLE = "tasks_fts"
+LIKE_ESCAPE = "/"
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+# External-content FTS5 table: stores only the index, kept in sync with `tasks`
+# by triggers. Updates that leave the title alone (complete, version bumps) skip it.
+_SQLITE_FTS_DDL = (
+    f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+    f"title, content='tasks', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+    f"CREATE TRIGGER {FTS_TABLE}_ai AFTER INSERT ON tasks BEGIN "
+    f"INSERT INTO {FTS_TABLE}(rowid, title) VALUES (new.id, new.title); END",
+    f"CREATE TRIGGER {FTS_TABLE}_ad AFTER DELETE ON tasks BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title) VALUES ('delete', old.id, old.title); END",
+    f"CREATE TRIGGER {FTS_TABLE}_au AFTER UPDATE OF title ON tasks BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title) VALUES ('delete', old.id, old.title); "
+    f"INSERT INTO {FTS_TABLE}(rowid, title) VALUES (new.id, new.title); END",
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+)
+
+def ensure_title_indexes(_: Any, connection: Connection, **__: Any) -> None:
+    """Creates the title search indexes that are missing, including on existing databases.
+    
+    Runs after every create_all, since create_all skips tables that already exist.
+    """
+    inspector = inspect(connection)
+    dialect = connection.dialect.name
+    if not inspector.has_table("tasks"):
+        return
+    if not inspector.has_index("tasks", TITLE_INDEX):
+        # SQLite's LIKE is case-insensitive and only range-scans a NOCASE index
+        collate = " COLLATE NOCASE" if dialect == "sqlite" else ""
+        connection.execute(text(f"CREATE INDEX {TITLE_INDEX} ON tasks (title{collate})"))
+    if dialect == "mysql" and not inspector.has_index("tasks", FULLTEXT_INDEX):
+        connection.execute(text(f"CREATE FULLTEXT INDEX {FULLTEXT_INDEX} ON tasks (title)"))
+    if dialect == "sqlite" and not inspector.has_table(FTS_TABLE):
+        for statement in _SQLITE_FTS_DDL:
+            connection.execute(text(statement))
+            
+def drop_fts_table(_: Any, connection: Connection, **__: Any) -> None:
+    if connection.dialect.name == "sqlite":
+        connection.execute(text(f"DROP TABLE IF EXISTS {FTS_TABLE}"))
+
+event.listen(Base.metadata, "after_create", ensure_title_indexes)
+event.listen(Base.metadata, "before_drop", drop_fts_table)
+
+def title_prefix_pattern(prefix: str) -> str:
+    # A fully bound pattern (not `:p || '%'`) lets both databases range-scan the B-tree index
+    escaped = prefix.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2).replace("%", LIKE_ESCAPE + "%").replace("_", LIKE_ESCAPE + "_")
+    return escaped + "%"
+
+def search_terms(query: str) -> List[str]:
+    return _TOKEN.findall(query.lower())
+
+def search_statement(dialect: str, terms: List[str], columns: Tuple[Column[Any], ...]) -> Select[Any]:
+    """Tasks matching every term as a word prefix, best matches first.
+    
+    Uses FTS5 on SQLite and the FULLTEXT index on MySQL; other databases fall
+    back to an unranked LIKE scan.
+    """
+    tasks = TaskModel.__table__
+    if dialect == "sqlite":
+        fts = table(FTS_TABLE, column("rowid"), column("rank"))
+        fts_query = " ".join(f'"{term}"*' for term in terms)
+        return (
+            select(*columns)
+            .select_from(tasks.join(fts, fts.c.rowid == tasks.c.id))
+            .where(text(f"{FTS_TABLE} MATCH :fts_query").bindparams(fts_query=fts_query))
+            .order_by(fts.c.rank, tasks.c.id)
+        )
+    if dialect == "mysql":
+        score = match(tasks.c.title, against=" ".join(f"+{term}*" for term in terms)).in_boolean_mode()
+        return select(*columns).where(score).order_by(score.desc(), tasks.c.id)
+    return select(*columns).where(and_(*(
+        tasks.c.title.ilike("%" + title_prefix_pattern(term), escape=LIKE_ESCAPE) for term in terms
+    ))).order_by(tasks.c.id)
@@ -0,0 +1,115 @@
+from typing import Any
+from sqlalchemy import BigInteger, Column, Integer, case, event, func, inspect, literal, select, text, union_all
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql import Select, Subquery
+from app.infrastructure.db.models.base import Base
+from app.infrastructure.db.models.task_model import TaskModel
+from app.infrastructure.db.models.task_archive_model import TaskArchiveModel
+
+TASK_STATS_ROW_ID = 1
+
+class TaskStatsModel(Base):
+    """Single-row running totals of all tasks, read by the stats endpoint in O(1).
+
+    Kept by triggers on `tasks` and `tasks_archive`, so every write path (ORM,
+    Core, bulk, async) updates it in its own transaction and moving a task to
+    or from the archive leaves it unchanged. Databases without the triggers
+    never get the row, and stats fall back to the GROUP BY aggregate.
+    """
+    __tablename__ = "task_stats_counter"
+
+    id = Column(Integer, primary_key=True)
+    total = Column(BigInteger, nullable=False, default=0)
+    completed = Column(BigInteger, nullable=False, default=0)
+
+_COUNTER = f"UPDATE task_stats_counter SET {{}} WHERE id = {TASK_STATS_ROW_ID}"
+_IS_COMPLETED = "(CASE WHEN {}.completed THEN 1 ELSE 0 END)"
+_NEW, _OLD = _IS_COMPLETED.format("NEW"), _IS_COMPLETED.format("OLD")
+
+_TRIGGERS = ("task_stats_ai", "task_stats_ad", "task_stats_au", "task_stats_archive_ai", "task_stats_archive_ad")
+
+_TRIGGER_DDL = {
+    "sqlite": (
+        f"CREATE TRIGGER task_stats_ai AFTER INSERT ON tasks BEGIN "
+        f"{_COUNTER.format(f'total = total + 1, completed = completed + {_NEW}')}; END",
+        f"CREATE TRIGGER task_stats_ad AFTER DELETE ON tasks BEGIN "
+        f"{_COUNTER.format(f'total = total - 1, completed = completed - {_OLD}')}; END",
+        f"CREATE TRIGGER task_stats_au AFTER UPDATE OF completed ON tasks "
+        f"WHEN NEW.completed IS NOT OLD.completed BEGIN "
+        f"{_COUNTER.format(f'completed = completed + {_NEW} - {_OLD}')}; END",
+        f"CREATE TRIGGER task_stats_archive_ai AFTER INSERT ON tasks_archive BEGIN "
+        f"{_COUNTER.format(f'total = total + 1, completed = completed + {_NEW}')}; END",
+        f"CREATE TRIGGER task_stats_archive_ad AFTER DELETE ON tasks_archive BEGIN "
+        f"{_COUNTER.format(f'total = total - 1, completed = completed - {_OLD}')}; END",
+    ),
+    "mysql": (
+        f"CREATE TRIGGER task_stats_ai AFTER INSERT ON tasks FOR EACH ROW "
+        f"{_COUNTER.format(f'total = total + 1, completed = completed + {_NEW}')}",
+        f"CREATE TRIGGER task_stats_ad AFTER DELETE ON tasks FOR EACH ROW "
+        f"{_COUNTER.format(f'total = total - 1, completed = completed - {_OLD}')}",
+        # Updates that leave `completed` alone must not queue on the counter row lock
+        f"CREATE TRIGGER task_stats_au AFTER UPDATE ON tasks FOR EACH ROW BEGIN "
+        f"IF NOT (NEW.completed <=> OLD.completed) THEN "
+        f"{_COUNTER.format(f'completed = completed + {_NEW} - {_OLD}')}; END IF; END",
+        f"CREATE TRIGGER task_stats_archive_ai AFTER INSERT ON tasks_archive FOR EACH ROW "
+        f"{_COUNTER.format(f'total = total + 1, completed = completed + {_NEW}')}",
+        f"CREATE TRIGGER task_stats_archive_ad AFTER DELETE ON tasks_archive FOR EACH ROW "
+        f"{_COUNTER.format(f'total = total - 1, completed = completed - {_OLD}')}",
+    ),
+}
+
+# The last trigger added: counters set up before it are seeded again
+_TRIGGER_EXISTS = {
+    "sqlite": "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'task_stats_archive_ad'",
+    "mysql": (
+        "SELECT 1 FROM information_schema.triggers "
+        "WHERE trigger_schema = DATABASE() AND trigger_name = 'task_stats_archive_ad'"
+    ),
+}
+
+def ensure_stats_counter(_: Any, connection: Connection, **__: Any) -> None:
+    """Installs the counter triggers and seeds the counter row from the tables.
+
+    A missing row or trigger marks a database where the counter was never set
+    up, or set up before it counted the archive; the steps run together so the
+    seed and the triggers start from the same snapshot.
+    """
+    ddl = _TRIGGER_DDL.get(connection.dialect.name)
+    if ddl is None or not inspect(connection).has_table("tasks"):
+        return
+    counter = TaskStatsModel.__table__
+    if (
+        connection.execute(select(counter.c.id).where(counter.c.id == TASK_STATS_ROW_ID)).first()
+        and connection.execute(text(_TRIGGER_EXISTS[connection.dialect.name])).first()
+    ):
+        return
+    connection.execute(counter.delete())
+    for trigger in _TRIGGERS:
+        connection.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+    for statement in ddl:
+        connection.execute(text(statement))
+    rows = _all_tasks()
+    connection.execute(counter.insert().from_select(
+        ["id", "total", "completed"],
+        select(
+            literal(TASK_STATS_ROW_ID),
+            func.count(),
+            func.coalesce(func.sum(case((rows.c.completed, 1), else_=0)), 0)
+        ).select_from(rows)
+    ))
+
+event.listen(Base.metadata, "after_create", ensure_stats_counter)
+
+def current_stats_statement() -> Select[Any]:
+    counter = TaskStatsModel.__table__
+    return select(counter.c.total, counter.c.completed).where(counter.c.id == TASK_STATS_ROW_ID)
+
+def stats_aggregate_statement() -> Select[Any]:
+    rows = _all_tasks()
+    return select(rows.c.completed, func.count()).group_by(rows.c.completed)
+
+def _all_tasks() -> Subquery:
+    # Archived tasks still count, the archive only moves them off the hot table
+    tasks = TaskModel.__table__
+    archive = TaskArchiveModel.__table__
+    return union_all(select(tasks.c.completed), select(archive.c.completed)).subquery()
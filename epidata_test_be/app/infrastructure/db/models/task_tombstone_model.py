@@ -0,0 +1,57 @@
+from app.infrastructure.db.models.base import Base
+from sqlalchemy import BigInteger, Column, DateTime, Integer, DDL, event, select, update
+from sqlalchemy.sql import Select, Update
+from datetime import datetime
+from typing import Any
+
+TOMBSTONE_WATERMARK_ROW_ID = 1
+
+class TaskTombstoneModel(Base):
+    """Deleted task ids kept so incremental syncs can see deletes.
+    
+    Pruned after TASK_TOMBSTONES_RETENTION_DAYS, raising the watermark below.
+    """
+    __tablename__ = "task_tombstones"
+    
+    id = Column(Integer, primary_key=True)
+    task_id = Column(Integer, nullable=False, index=True)
+    version = Column(BigInteger, nullable=False, index=True)
+    deleted_at = Column(DateTime, nullable=False)
+
+class TaskTombstoneWatermarkModel(Base):
+    """Single row holding the highest version whose tombstones were pruned.
+    
+    A sync resuming from below it may have missed deletes and has to start over.
+    """
+    __tablename__ = "task_tombstone_watermark"
+    
+    id = Column(Integer, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+
+event.listen(
+    TaskTombstoneWatermarkModel.__table__,
+    "after_create",
+    DDL(f"INSERT INTO task_tombstone_watermark (id, version) VALUES ({TOMBSTONE_WATERMARK_ROW_ID}, 0)")
+)
+
+def prunable_tombstones_statement(deleted_before: datetime, batch_size: int) -> Select[Any]:
+    # Oldest versions first, so the watermark only ever passes pruned tombstones
+    tombstones = TaskTombstoneModel.__table__
+    return (
+        select(tombstones.c.id, tombstones.c.version)
+        .where(tombstones.c.deleted_at <= deleted_before)
+        .order_by(tombstones.c.version, tombstones.c.id)
+        .limit(batch_size)
+    )
+
+def raise_watermark_statement(version: int) -> Update:
+    watermark = TaskTombstoneWatermarkModel.__table__
+    return (
+        update(watermark)
+        .where(watermark.c.id == TOMBSTONE_WATERMARK_ROW_ID, watermark.c.version < version)
+        .values(version=version)
+    )
+
+def tombstone_watermark_statement() -> Select[Any]:
+    watermark = TaskTombstoneWatermarkModel.__table__
+    return select(watermark.c.version).where(watermark.c.id == TOMBSTONE_WATERMARK_ROW_ID)
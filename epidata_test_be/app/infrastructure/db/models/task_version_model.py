@@ -0,0 +1,78 @@
+from app.infrastructure.db.models.base import Base
+from app.infrastructure.db.models.task_model import TaskModel, utcnow
+from sqlalchemy import BigInteger, Column, DateTime, Integer, DDL, event, func, inspect, select, text, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql import Select, Update
+from datetime import datetime
+from typing import Any, Dict
+
+TASK_VERSION_ROW_ID = 1
+VERSION_INDEX = "ix_tasks_version"
+
+class TaskVersionModel(Base):
+    """Single-row counter handing out the next task version.
+    
+    Incrementing it takes the row lock, so versions follow commit order of the
+    writers that bumped it. Deletes bump it as well, which makes `updated_at` the
+    last time anything in `tasks` changed.
+    """
+    __tablename__ = "task_version_counter"
+    
+    id = Column(Integer, primary_key=True)
+    value = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False)
+
+event.listen(
+    TaskVersionModel.__table__,
+    "after_create",
+    DDL(f"INSERT INTO task_version_counter (id, value, updated_at) VALUES ({TASK_VERSION_ROW_ID}, 0, CURRENT_TIMESTAMP)")
+)
+
+def ensure_task_versions(_: Any, connection: Connection, **__: Any) -> None:
+    """Adds `version` and `updated_at` to a `tasks` table created before them.
+    
+    Runs after every create_all, since create_all never alters an existing table.
+    Existing tasks take their id as version, so a delta sync from 0 still returns
+    every one of them, and the counter moves past the highest.
+    """
+    inspector = inspect(connection)
+    if not inspector.has_table("tasks"):
+        return
+    columns = {column["name"] for column in inspector.get_columns("tasks")}
+    if "version" not in columns:
+        connection.execute(text("ALTER TABLE tasks ADD COLUMN version INTEGER NOT NULL DEFAULT 0"))
+    if "updated_at" not in columns:
+        # SQLite only adds a NOT NULL column with a constant default, the backfill replaces it
+        connection.execute(text("ALTER TABLE tasks ADD COLUMN updated_at DATETIME NOT NULL DEFAULT '1970-01-01 00:00:00'"))
+    if not inspector.has_index("tasks", VERSION_INDEX):
+        connection.execute(text(f"CREATE INDEX {VERSION_INDEX} ON tasks (version)"))
+    tasks = TaskModel.__table__
+    counter = TaskVersionModel.__table__
+    now = utcnow()
+    backfill: Dict[str, Any] = {}
+    if "version" not in columns:
+        backfill["version"] = tasks.c.id
+    if "updated_at" not in columns:
+        backfill["updated_at"] = now
+    if not backfill:
+        return
+    connection.execute(update(tasks).values(**backfill))
+    connection.execute(
+        update(counter)
+        .where(counter.c.id == TASK_VERSION_ROW_ID)
+        .values(value=select(func.coalesce(func.max(tasks.c.version), 0)).scalar_subquery(), updated_at=now)
+    )
+
+event.listen(Base.metadata, "after_create", ensure_task_versions)
+
+def bump_version_statement(now: datetime) -> Update:
+    counter = TaskVersionModel.__table__
+    return (
+        update(counter)
+        .where(counter.c.id == TASK_VERSION_ROW_ID)
+        .values(value=counter.c.value + 1, updated_at=now)
+    )
+
+def current_version_statement() -> Select[Any]:
+    counter = TaskVersionModel.__table__
+    return select(counter.c.value, counter.c.updated_at).where(counter.c.id == TASK_VERSION_ROW_ID)
@@ -0,0 +1,50 @@
+import threading
+from typing import Any, Dict, Optional
+from sqlalchemy import event
+from sqlalchemy.pool import Pool, QueuePool
+
+class PoolMetrics:
+    """Counters describing how requests use an engine's connection pool."""
+    
+    def __init__(self, pool: Optional[Pool] = None):
+        self.pool: Optional[Pool] = None
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.wait_count = 0
+        self.wait_total_seconds = 0.0
+        self.wait_max_seconds = 0.0
+        if pool is not None:
+            self.attach(pool)
+            
+    def attach(self, pool: Pool) -> None:
+        self.pool = pool
+        event.listen(pool, "checkout", self._on_checkout)
+        
+    def _on_checkout(self, *_: Any) -> None:
+        with self._lock:
+            self.checkouts += 1
+            
+    def record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.wait_count += 1
+            self.wait_total_seconds += seconds
+            self.wait_max_seconds = max(self.wait_max_seconds, seconds)
+            
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            data: Dict[str, Any] = {
+                "pool_class": type(self.pool).__name__ if self.pool is not None else None,
+                "checkouts": self.checkouts,
+                "wait_count": self.wait_count,
+                "wait_avg_ms": round(self.wait_total_seconds * 1000 / self.wait_count, 3) if self.wait_count else 0.0,
+                "wait_max_ms": round(self.wait_max_seconds * 1000, 3)
+            }
+        # Only queue pools track size and overflow; singleton/static pools have no such limits
+        if isinstance(self.pool, QueuePool):
+            data.update(
+                size=self.pool.size(),
+                checked_out=self.pool.checkedout(),
+                overflow=max(self.pool.overflow(), 0),
+                checked_in=self.pool.checkedin()
+            )
+        return data
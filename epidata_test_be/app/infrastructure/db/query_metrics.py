@@ -0,0 +1,43 @@
+import logging
+import time
+from typing import Any, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.infrastructure.metrics.app_metrics import db_query_duration, db_slow_queries
+from app.infrastructure.metrics.request_timings import current_timings
+
+logger = logging.getLogger("app.slow_query")
+
+_STARTED_KEY = "query_started"
+
+class QueryMetrics:
+    """Times every statement run on an engine and logs the slow ones.
+    
+    Durations go to the process-wide histogram and to the current request's
+    timings, which the middleware turns into a Server-Timing header.
+    """
+    
+    def __init__(self, engine: Optional[Engine], slow_query_enabled: bool, slow_query_threshold_ms: float):
+        self.slow_query_enabled = slow_query_enabled
+        self.slow_query_threshold = slow_query_threshold_ms / 1000
+        if engine is not None:
+            self.attach(engine)
+            
+    def attach(self, engine: Engine) -> None:
+        event.listen(engine, "before_cursor_execute", self._before)
+        event.listen(engine, "after_cursor_execute", self._after)
+        
+    def _before(self, conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        conn.info.setdefault(_STARTED_KEY, []).append(time.perf_counter())
+        
+    def _after(self, conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        elapsed = time.perf_counter() - conn.info[_STARTED_KEY].pop()
+        db_query_duration.observe(elapsed, statement=statement.lstrip().split(None, 1)[0].upper())
+        timings = current_timings()
+        if timings is not None:
+            timings.add_sql(elapsed)
+        if self.slow_query_enabled and elapsed >= self.slow_query_threshold:
+            db_slow_queries.inc()
+            logger.warning(
+                f'Slow query ({elapsed * 1000:.1f} ms, executemany={executemany}): {" ".join(statement.split())}'
+            )
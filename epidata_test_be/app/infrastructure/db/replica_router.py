@@ -0,0 +1,87 @@
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+class ReplicaRouter:
+    """Spreads read-only sessions over the healthy read replicas in turn.
+    
+    A replica is taken out of rotation when a connection to it fails and put
+    back by the next health check that reaches it. With no healthy replica left
+    callers read from the primary.
+    """
+    
+    def __init__(self, engines: Optional[List[Engine]] = None):
+        self.engines: List[Engine] = []
+        self._lock = threading.Lock()
+        self._next = 0
+        self._healthy: Dict[Engine, bool] = {}
+        self._reads: Dict[Engine, int] = {}
+        self._failures: Dict[Engine, int] = {}
+        for engine in engines or []:
+            self.add(engine)
+            
+    def add(self, engine: Engine) -> None:
+        with self._lock:
+            self.engines.append(engine)
+            self._healthy[engine] = True
+            self._reads[engine] = 0
+            self._failures[engine] = 0
+            
+    def candidates(self) -> List[Engine]:
+        """Healthy replicas to try in order, starting one further each call."""
+        with self._lock:
+            if not self.engines:
+                return []
+            start = self._next
+            self._next = (self._next + 1) % len(self.engines)
+            rotated = self.engines[start:] + self.engines[:start]
+            return [engine for engine in rotated if self._healthy[engine]]
+            
+    def record_read(self, engine: Engine) -> None:
+        with self._lock:
+            self._reads[engine] += 1
+            
+    def mark_down(self, engine: Engine, error: Exception) -> None:
+        with self._lock:
+            was_healthy = self._healthy[engine]
+            self._healthy[engine] = False
+            self._failures[engine] += 1
+        if was_healthy:
+            logger.warning(f'Read replica {self._name(engine)} is down, reads fall back: {error}')
+            
+    def check_health(self) -> None:
+        for engine in list(self.engines):
+            try:
+                with engine.connect() as conn:
+                    conn.execute(text("SELECT 1"))
+            except Exception as e:
+                self.mark_down(engine, e)
+                continue
+            with self._lock:
+                was_healthy = self._healthy[engine]
+                self._healthy[engine] = True
+            if not was_healthy:
+                logger.info(f'Read replica {self._name(engine)} is back in rotation')
+                
+    def dispose(self) -> None:
+        for engine in self.engines:
+            engine.dispose()
+            
+    def snapshot(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [
+                {
+                    "url": self._name(engine),
+                    "healthy": self._healthy[engine],
+                    "reads": self._reads[engine],
+                    "failures": self._failures[engine]
+                }
+                for engine in self.engines
+            ]
+            
+    def _name(self, engine: Engine) -> str:
+        return engine.url.render_as_string(hide_password=True)
@@ -0,0 +1,53 @@
+from typing import Any, Dict
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine, make_url
+
+SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+def is_sqlite_file(database_url: str) -> bool:
+    url = make_url(database_url)
+    return url.get_backend_name() == "sqlite" and url.database not in (None, "", ":memory:")
+
+class SQLiteProfile:
+    """Connection settings for serving the API from a local SQLite file.
+    
+    WAL lets readers run alongside the writer and never block its commits;
+    `synchronous=NORMAL` syncs the WAL at checkpoints rather than on every commit,
+    which can lose the last transactions on power loss but never corrupts the file.
+    
+    pysqlite's own transaction handling is switched off: it opens no transaction
+    before a SAVEPOINT and begins DEFERRED, so a transaction that reads before it
+    writes can fail with "database is locked" without waiting. Engines attached
+    as writers begin IMMEDIATE instead, taking the write lock up front and waiting
+    up to `busy_timeout_ms` for it.
+    """
+    
+    def __init__(self, synchronous: str, busy_timeout_ms: int, cache_size_kb: int, mmap_size_mb: int):
+        synchronous = synchronous.upper()
+        if synchronous not in SYNCHRONOUS_MODES:
+            raise ValueError(f"Unknown SQLite synchronous mode: {synchronous}")
+        self.pragmas: Dict[str, Any] = {
+            "journal_mode": "WAL",
+            "synchronous": synchronous,
+            "busy_timeout": busy_timeout_ms,
+            # Negative means KiB rather than pages
+            "cache_size": -cache_size_kb,
+            "mmap_size": mmap_size_mb * 1024 * 1024,
+            "temp_store": "MEMORY",
+        }
+        
+    def attach(self, engine: Engine, writer: bool) -> None:
+        begin = "BEGIN IMMEDIATE" if writer else "BEGIN"
+        
+        def on_connect(dbapi_connection: Any, _: Any) -> None:
+            dbapi_connection.isolation_level = None
+            cursor = dbapi_connection.cursor()
+            for name, value in self.pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+            cursor.close()
+            
+        def on_begin(conn: Connection) -> None:
+            conn.exec_driver_sql(begin)
+            
+        event.listen(engine, "connect", on_connect)
+        event.listen(engine, "begin", on_begin)
@@ -0,0 +1,88 @@
+import importlib
+import logging
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+Deliver = Callable[[bytes], None]
+
+class EventBackend(ABC):
+    """Transport carrying serialized task events to every worker's broker."""
+    
+    @abstractmethod
+    def start(self, deliver: Deliver) -> None:
+        pass
+    
+    @abstractmethod
+    def publish(self, payload: bytes) -> None:
+        pass
+    
+    @abstractmethod
+    def stop(self) -> None:
+        pass
+
+class LocalEventBackend(EventBackend):
+    """Single-process transport: events only reach subscribers of this worker."""
+    
+    def __init__(self):
+        self._deliver: Optional[Deliver] = None
+        
+    def start(self, deliver: Deliver) -> None:
+        self._deliver = deliver
+        
+    def publish(self, payload: bytes) -> None:
+        if self._deliver is not None:
+            self._deliver(payload)
+            
+    def stop(self) -> None:
+        self._deliver = None
+
+class RedisEventBackend(EventBackend):
+    """Fans events out across workers through a Redis pub/sub channel.
+    
+    Works with any client exposing redis-py's publish() and pubsub(). Every
+    worker, including the publisher, receives its own events from the channel.
+    """
+    
+    def __init__(self, client: Any, channel: str):
+        self.client = client
+        self.channel = channel
+        self._pubsub: Any = None
+        self._thread: Optional[threading.Thread] = None
+        
+    def start(self, deliver: Deliver) -> None:
+        self._pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.subscribe(self.channel)
+        self._thread = threading.Thread(target=self._listen, args=(deliver,), name="task-events", daemon=True)
+        self._thread.start()
+        
+    def _listen(self, deliver: Deliver) -> None:
+        try:
+            for message in self._pubsub.listen():
+                if message.get("type") == "message":
+                    deliver(message["data"])
+        except Exception as e:
+            # Raised when stop() closes the connection under the listener
+            if self._pubsub is not None:
+                logger.exception(f'Error in RedisEventBackend listener: {e}')
+                
+    def publish(self, payload: bytes) -> None:
+        self.client.publish(self.channel, payload)
+        
+    def stop(self) -> None:
+        pubsub, self._pubsub = self._pubsub, None
+        if pubsub is not None:
+            pubsub.close()
+
+def create_event_backend(backend: str, redis_url: str, channel: str) -> EventBackend:
+    if backend == "local":
+        return LocalEventBackend()
+    if backend == "redis":
+        try:
+            redis = importlib.import_module("redis")
+        except ImportError as e:
+            raise RuntimeError("TASK_EVENTS_BACKEND=redis requires the 'redis' package") from e
+        return RedisEventBackend(redis.Redis.from_url(redis_url), channel)
+    raise ValueError(f"Unknown event backend: {backend}")
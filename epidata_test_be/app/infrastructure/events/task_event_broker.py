@@ -0,0 +1,131 @@
+import asyncio
+import logging
+import threading
+from typing import Dict, Optional, Set
+from app.domain.events.task_event_publisher import TaskEventPublisher
+from app.domain.models.task_event import TaskEvent
+from app.infrastructure.events.event_backend import EventBackend
+from app.presentation.schemas.response_utils import dumps
+
+logger = logging.getLogger(__name__)
+
+DROP_OLDEST = "drop_oldest"
+DISCONNECT = "disconnect"
+
+class Subscription:
+    """Bounded per-client queue living on the subscriber's event loop.
+    
+    When a slow client's queue is full, `drop_oldest` discards its oldest pending
+    event, while `disconnect` closes the subscription so the client can resync.
+    """
+    
+    def __init__(self, loop: asyncio.AbstractEventLoop, queue_size: int, drop_policy: str):
+        self.loop = loop
+        self.queue: "asyncio.Queue[bytes]" = asyncio.Queue(maxsize=queue_size)
+        self.drop_policy = drop_policy
+        self.dropped = 0
+        self.closed = False
+        self._closed_event = asyncio.Event()
+        
+    def offer(self, payload: bytes) -> None:
+        # Safe from any thread: the queue is only touched on its own loop
+        self.loop.call_soon_threadsafe(self._put, payload)
+        
+    def _put(self, payload: bytes) -> None:
+        if self.closed:
+            return
+        if self.queue.full():
+            self.dropped += 1
+            if self.drop_policy == DISCONNECT:
+                self.close()
+                return
+            self.queue.get_nowait()
+        self.queue.put_nowait(payload)
+        
+    def close(self) -> None:
+        self.closed = True
+        self._closed_event.set()
+        
+    async def get(self, timeout: Optional[float] = None) -> Optional[bytes]:
+        """Next event, or None on timeout or once the subscription is closed."""
+        if self.closed:
+            return None
+        get_task = asyncio.ensure_future(self.queue.get())
+        closed_task = asyncio.ensure_future(self._closed_event.wait())
+        done, pending = await asyncio.wait({get_task, closed_task}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+        if get_task in done and not self.closed:
+            return get_task.result()
+        return None
+
+class TaskEventBroker(TaskEventPublisher):
+    """In-process fan-out of task events to stream subscribers.
+    
+    Events go out through the backend and come back via `_deliver`, so with a
+    cross-worker backend every worker's subscribers see every worker's events.
+    """
+    
+    def __init__(self, backend: EventBackend, queue_size: int, drop_policy: str):
+        self.backend = backend
+        self.queue_size = queue_size
+        self.drop_policy = drop_policy
+        self._subscribers: Set[Subscription] = set()
+        self._lock = threading.Lock()
+        self.published = 0
+        self.delivered = 0
+        self.started = False
+        
+    def start(self) -> None:
+        if not self.started:
+            self.backend.start(self._deliver)
+            self.started = True
+            
+    def stop(self) -> None:
+        if self.started:
+            self.backend.stop()
+            self.started = False
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            subscription.loop.call_soon_threadsafe(subscription.close)
+            
+    def publish(self, task_event: TaskEvent) -> None:
+        try:
+            self.backend.publish(dumps(task_event))
+            self.published += 1
+        except Exception as e:
+            # Streaming is best effort, a broken transport must not fail the write
+            logger.exception(f'Error in TaskEventBroker.publish: {e}')
+            
+    def subscribe(self) -> Subscription:
+        subscription = Subscription(asyncio.get_running_loop(), self.queue_size, self.drop_policy)
+        with self._lock:
+            self._subscribers.add(subscription)
+        return subscription
+    
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscription.close()
+        with self._lock:
+            self._subscribers.discard(subscription)
+            
+    def _deliver(self, payload: bytes) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            try:
+                subscription.offer(payload)
+                self.delivered += 1
+            except RuntimeError:
+                # The subscriber's loop is gone
+                self.unsubscribe(subscription)
+                
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        return {
+            "subscribers": len(subscribers),
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped": sum(s.dropped for s in subscribers)
+        }
@@ -0,0 +1,35 @@
+from typing import List
+from sqlalchemy import event
+from sqlalchemy.orm import Session, SessionTransaction
+from app.config.settings import settings
+from app.domain.events.task_event_publisher import TaskEventPublisher
+from app.domain.models.task_event import TaskEvent
+from app.infrastructure.events.event_backend import create_event_backend
+from app.infrastructure.events.task_event_broker import TaskEventBroker
+
+# Shared by every request of this worker, started and stopped by the app lifespan
+task_event_broker = TaskEventBroker(
+    create_event_backend(settings.TASK_EVENTS_BACKEND, settings.TASK_EVENTS_REDIS_URL, settings.TASK_EVENTS_CHANNEL),
+    settings.TASK_EVENTS_QUEUE_SIZE,
+    settings.TASK_EVENTS_DROP_POLICY
+)
+
+class SessionBoundPublisher(TaskEventPublisher):
+    """Holds a request's events until its session commits; a rollback discards them."""
+    
+    def __init__(self, publisher: TaskEventPublisher, session: Session):
+        self.publisher = publisher
+        self.pending: List[TaskEvent] = []
+        event.listen(session, "after_commit", self._flush)
+        event.listen(session, "after_soft_rollback", self._discard)
+        
+    def publish(self, task_event: TaskEvent) -> None:
+        self.pending.append(task_event)
+        
+    def _flush(self, _: Session) -> None:
+        pending, self.pending = self.pending, []
+        for task_event in pending:
+            self.publisher.publish(task_event)
+            
+    def _discard(self, _: Session, __: SessionTransaction) -> None:
+        self.pending = []
@@ -0,0 +1,18 @@
+import asyncio
+import logging
+from typing import Any, Callable
+from starlette.concurrency import run_in_threadpool
+
+logger = logging.getLogger(__name__)
+
+async def run_periodically(interval_seconds: float, job: Callable[..., Any], *args: Any) -> None:
+    """Runs a blocking job in the threadpool every interval until cancelled.
+    
+    Failures are logged and retried on the next tick.
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await run_in_threadpool(job, *args)
+        except Exception as e:
+            logger.exception(f'Error in periodic job {job.__name__}: {e}')
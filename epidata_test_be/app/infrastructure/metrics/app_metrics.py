@@ -0,0 +1,29 @@
+from app.infrastructure.metrics.prometheus import Counter, Histogram
+
+http_request_duration = Histogram(
+    "http_request_duration_seconds", "Time from request start to the response headers, per route"
+)
+db_query_duration = Histogram(
+    "db_query_duration_seconds", "SQL statement execution time, per statement kind"
+)
+db_slow_queries = Counter(
+    "db_slow_queries_total", "SQL statements slower than SLOW_QUERY_THRESHOLD_MS"
+)
+rows_hydrated = Counter(
+    "task_rows_hydrated_total", "Database rows mapped to Task entities, per route"
+)
+compression_input_bytes = Counter(
+    "http_compression_input_bytes_total", "Response bytes fed to the compressor, per encoding"
+)
+compression_output_bytes = Counter(
+    "http_compression_output_bytes_total", "Compressed response bytes sent, per encoding"
+)
+http_requests_shed = Counter(
+    "http_requests_shed_total", "Requests answered 503 by admission control, per route class and reason"
+)
+tasks_archived = Counter(
+    "tasks_archived_total", "Completed tasks moved from tasks to tasks_archive"
+)
+task_tombstones_pruned = Counter(
+    "task_tombstones_pruned_total", "Task tombstones deleted past the retention period"
+)
@@ -0,0 +1,67 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Generator, Optional
+
+class RequestTimings:
+    """Where one request spent its time.
+    
+    Bound to a context variable by the timing middleware. Sync routes run in a
+    threadpool that copies the context, so they mutate this same object.
+    """
+    
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self.sql_count = 0
+        self.sql_seconds = 0.0
+        self.rows = 0
+        
+    def add_phase(self, name: str, seconds: float) -> None:
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+        
+    def add_sql(self, seconds: float) -> None:
+        self.sql_count += 1
+        self.sql_seconds += seconds
+        
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+    
+    def server_timing(self) -> str:
+        metrics = [f"app;dur={self.elapsed() * 1000:.3f}"]
+        metrics.extend(f"{name};dur={seconds * 1000:.3f}" for name, seconds in self.phases.items())
+        metrics.append(f'sql;dur={self.sql_seconds * 1000:.3f};desc="{self.sql_count} statements"')
+        metrics.append(f'hydrate;desc="{self.rows} rows"')
+        return ", ".join(metrics)
+
+_current: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+def start_request() -> RequestTimings:
+    timings = RequestTimings()
+    _current.set(timings)
+    return timings
+
+def current_timings() -> Optional[RequestTimings]:
+    return _current.get()
+
+def record_phase(phase: str, seconds: float) -> None:
+    timings = _current.get()
+    if timings is not None:
+        timings.add_phase(phase, seconds)
+
+@contextmanager
+def timed(phase: str) -> Generator[None, None, None]:
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add_phase(phase, time.perf_counter() - started)
+        
+def count_hydrated(rows: int = 1) -> None:
+    timings = _current.get()
+    if timings is not None:
+        timings.rows += rows
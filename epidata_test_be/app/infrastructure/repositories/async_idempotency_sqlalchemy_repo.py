@@ -0,0 +1,83 @@
+from datetime import timedelta
+from typing import Any, Optional
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.domain.models.idempotency_record import IdempotencyRecord
+from app.domain.repositories.async_idempotency_repository import AsyncIdempotencyRepository
+from app.infrastructure.db.models.idempotency_key_model import IdempotencyKeyModel
+from app.infrastructure.db.models.task_model import utcnow, as_utc
+import logging
+
+logger = logging.getLogger(__name__)
+
+class AsyncIdempotencySQLAlchemyRepo(AsyncIdempotencyRepository):
+    """Async counterpart of IdempotencySQLAlchemyRepo, with the same transaction rules."""
+    
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        
+    async def find(self, scope: str, key: str) -> Optional[IdempotencyRecord]:
+        try:
+            keys = IdempotencyKeyModel.__table__
+            row = (await self.session.execute(
+                select(keys).where(keys.c.scope == scope, keys.c.idempotency_key == key)
+            )).first()
+            if row is None:
+                return None
+            if row.expires_at <= utcnow():
+                await self.session.execute(delete(keys).where(keys.c.id == row.id))
+                return None
+            return self._row_to_record(row)
+        except Exception as e:
+            logger.exception((f'Error in AsyncIdempotencyRepository.find: {e}'))
+            raise RuntimeError(f"Failed to read idempotency key: {e}")
+        
+    async def reserve(self, scope: str, key: str, request_hash: str, ttl_seconds: float) -> bool:
+        now = utcnow()
+        try:
+            await self.session.execute(insert(IdempotencyKeyModel.__table__).values(
+                scope=scope,
+                idempotency_key=key,
+                request_hash=request_hash,
+                created_at=now,
+                expires_at=now + timedelta(seconds=ttl_seconds)
+            ))
+            return True
+        except IntegrityError:
+            await self.session.rollback()
+            return False
+        except Exception as e:
+            logger.exception((f'Error in AsyncIdempotencyRepository.reserve: {e}'))
+            raise RuntimeError(f"Failed to reserve idempotency key: {e}")
+        
+    async def complete(self, scope: str, key: str, status_code: int, body: bytes) -> None:
+        try:
+            keys = IdempotencyKeyModel.__table__
+            await self.session.execute(
+                update(keys)
+                .where(keys.c.scope == scope, keys.c.idempotency_key == key)
+                .values(status_code=status_code, response_body=body)
+            )
+        except Exception as e:
+            logger.exception((f'Error in AsyncIdempotencyRepository.complete: {e}'))
+            raise RuntimeError(f"Failed to store idempotent response: {e}")
+        
+    async def release(self, scope: str, key: str) -> None:
+        try:
+            keys = IdempotencyKeyModel.__table__
+            await self.session.execute(delete(keys).where(keys.c.scope == scope, keys.c.idempotency_key == key))
+        except Exception as e:
+            logger.exception((f'Error in AsyncIdempotencyRepository.release: {e}'))
+            raise RuntimeError(f"Failed to release idempotency key: {e}")
+        
+    def _row_to_record(self, row: Row[Any]) -> IdempotencyRecord:
+        return IdempotencyRecord(
+            scope=row.scope,
+            key=row.idempotency_key,
+            request_hash=row.request_hash,
+            expires_at=as_utc(row.expires_at),
+            status_code=row.status_code,
+            body=row.response_body
+        )
@@ -0,0 +1,243 @@
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, Iterable, List, Optional, Tuple
+from datetime import datetime
+from sqlalchemy import Column, delete, func, insert, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.domain.models.task_entity import Task
+from app.domain.models.task_page import TaskPage
+from app.domain.repositories.async_task_repository import AsyncTaskRepository
+from app.domain.models.task_list_fingerprint import TaskListFingerprint
+from app.infrastructure.db.models.task_model import TaskModel, utcnow, as_utc
+from app.infrastructure.db.models.task_tombstone_model import TaskTombstoneModel
+from app.infrastructure.db.models.task_archive_model import (
+    archived_ids_statement, archived_task_statement, remove_archived_statement, restore_statements
+)
+from app.infrastructure.db.models.task_search_index import LIKE_ESCAPE, title_prefix_pattern
+from app.infrastructure.db.models.task_version_model import TaskVersionModel, bump_version_statement, current_version_statement
+from app.infrastructure.db.models.async_session import AsyncSessionLocal
+from app.infrastructure.metrics.request_timings import count_hydrated
+import logging
+
+logger = logging.getLogger(__name__)
+
+class AsyncTaskSQLAlchemyRepo(AsyncTaskRepository):
+    def __init__(self, session: Optional[AsyncSession] = None):
+        # Same ownership rules as TaskSQLAlchemyRepo
+        self.session = session
+        
+    async def get_all(self) -> List[Task]:
+        try:
+            async with self._session() as db:
+                return self._rows_to_entities(await db.execute(select(*self._columns())))
+        except Exception as e:
+            logger.exception((f'Error in AsyncTaskRepository.get_all: {e}'))
+            raise RuntimeError(f"Failed to retrieve tasks: {e}")
+    
+    async def list_page(
+        self,
+        limit: int,
+        after: Optional[int] = None,
+        completed: Optional[bool] = None,
+        title_prefix: Optional[str] = None
+    ) -> TaskPage:
+        try:
+            async with self._session() as db:
+                stmt = select(*self._columns())
+                if after is not None:
+                    stmt = stmt.where(TaskModel.id > after)
+                if completed is not None:
+                    stmt = stmt.where(TaskModel.completed == completed)
+                if title_prefix:
+                    stmt = stmt.where(TaskModel.title.like(title_prefix_pattern(title_prefix), escape=LIKE_ESCAPE))
+                # Fetch one extra row to know whether another page exists
+                tasks = self._rows_to_entities(await db.execute(stmt.order_by(TaskModel.id).limit(limit + 1)))
+                next_cursor = tasks[limit - 1].id if len(tasks) > limit else None
+                return TaskPage(items=tasks[:limit], next_cursor=next_cursor)
+        except Exception as e:
+            logger.exception((f'Error in AsyncTaskRepository.list_page: {e}'))
+            raise RuntimeError(f"Failed to retrieve tasks page: {e}")
+    
+    async def get_by_id(self, task_id: int) -> Optional[Task]:
+        try:
+            async with self._session() as db:
+                row = (await db.execute(select(*self._columns()).where(TaskModel.id == task_id))).first()
+                if not row:
+                    row = (await db.execute(archived_task_statement(task_id))).first()
+                if not row:
+                    raise ValueError(f"Task with ID {task_id} not found")
+                return self._row_to_entity(row)
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.exception((f'Error in AsyncTaskRepository.get_by_id: {e}'))
+            raise RuntimeError(f"Failed to retrieve task with ID {task_id}: {e}")
+        
+    async def list_fingerprint(self) -> TaskListFingerprint:
+        try:
+            async with self._session() as db:
+                tasks_table = TaskModel.__table__
+                counter = TaskVersionModel.__table__
+                row = (await db.execute(select(
+                    select(func.max(tasks_table.c.version)).scalar_subquery(),
+                    select(func.count()).select_from(tasks_table).scalar_subquery(),
+                    current_version_statement().with_only_columns(counter.c.updated_at).scalar_subquery()
+                ))).one()
+                return TaskListFingerprint(
+                    max_version=row[0] or 0,
+                    count=row[1],
+                    last_modified=as_utc(row[2]) if row[2] else None
+                )
+        except Exception as e:
+            logger.exception((f'Error in AsyncTaskRepository.list_fingerprint: {e}'))
+            raise RuntimeError(f"Failed to retrieve tasks fingerprint: {e}")
+        
+    async def create(self, task_title: str) -> Task:
+        try:
+            async with self._session() as db:
+                now = utcnow()
+                db_task = TaskModel(title=task_title, completed=False, version=await self._next_version(db, now), updated_at=now)
+                db.add(db_task)
+                await db.flush()
+                task = self._to_entity(db_task)
+                await self._commit(db)
+                return task
+        except Exception as e:
+            logger.exception((f'Error in AsyncTaskRepository.create: {e}'))
+            raise RuntimeError(f"Failed to create task: {e}")
+    
+    async def update(self, task_id: int, updated_task: Task) -> Task:
+        try:
+            async with self._session() as db:
+                values = {"title": updated_task.title, "completed": updated_task.completed}
+                task = await self._update_returning(db, task_id, **values)
+                if not task and await self._restore_archived(db, task_id):
+                    task = await self._update_returning(db, task_id, **values)
+                if not task:
+                    raise ValueError(f"Task with ID {task_id} not found")
+                await self._commit(db)
+                return task
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.exception((f'Error in AsyncTaskRepository.update: {e}'))
+            raise RuntimeError(f"Failed to update task with ID {task_id}: {e}")
+        
+    async def mark_complete(self, task_id: int) -> Task:
+        try:
+            async with self._session() as db:
+                task = await self._update_returning(db, task_id, completed=True)
+                if not task and await self._restore_archived(db, task_id):
+                    task = await self._update_returning(db, task_id, completed=True)
+                if not task:
+                    raise ValueError(f"Task with ID {task_id} not found")
+                await self._commit(db)
+                return task
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.exception((f'Error in AsyncTaskRepository.mark_complete: {e}'))
+            raise RuntimeError(f"Failed to mark task as completed with ID {task_id}: {e}")
+        
+    async def delete(self, task_id: int) -> None:
+        try:
+            async with self._session() as db:
+                tasks_table = TaskModel.__table__
+                now = utcnow()
+                # Counter first, in the same lock order as every other write
+                version = await self._next_version(db, now)
+                # Both tables, so no archived copy of the id outlives the delete
+                result = await db.execute(delete(tasks_table).where(tasks_table.c.id == task_id))
+                archived = await db.execute(remove_archived_statement([task_id]))
+                if not result.rowcount and not archived.rowcount:
+                    raise ValueError(f"Task with ID {task_id} not found")
+                await db.execute(insert(TaskTombstoneModel.__table__).values(
+                    task_id=task_id, version=version, deleted_at=now
+                ))
+                await self._commit(db)
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.exception((f'Error in AsyncTaskRepository.delete: {e}'))
+            raise RuntimeError(f"Failed to delete task with ID {task_id}: {e}")
+        
+    async def _update_returning(self, db: AsyncSession, task_id: int, **values: Any) -> Optional[Task]:
+        tasks_table = TaskModel.__table__
+        columns = self._columns()
+        now = utcnow()
+        stmt = update(tasks_table).where(tasks_table.c.id == task_id).values(
+            **values, version=await self._next_version(db, now), updated_at=now
+        )
+        if db.get_bind().dialect.update_returning:
+            row = (await db.execute(stmt.returning(*columns))).first()
+        else:
+            # Same MySQL fallback as TaskSQLAlchemyRepo._update_returning
+            result = await db.execute(stmt)
+            row = (await db.execute(select(*columns).where(tasks_table.c.id == task_id))).first() if result.rowcount else None
+        return self._row_to_entity(row) if row else None
+    
+    async def _restore_archived(self, db: AsyncSession, task_id: int) -> bool:
+        # Same as TaskSQLAlchemyRepo._restore_archived, for a single task
+        if not (await db.execute(archived_ids_statement([task_id]))).first():
+            return False
+        for stmt in restore_statements([task_id]):
+            await db.execute(stmt)
+        return True
+        
+    async def _next_version(self, db: AsyncSession, now: datetime) -> int:
+        stmt = bump_version_statement(now)
+        if db.get_bind().dialect.update_returning:
+            return (await db.execute(stmt.returning(TaskVersionModel.__table__.c.value))).scalar_one()
+        await db.execute(stmt)
+        return (await db.execute(current_version_statement())).scalar_one()
+        
+    @asynccontextmanager
+    async def _session(self) -> AsyncGenerator[AsyncSession, None]:
+        if self.session is None:
+            async with AsyncSessionLocal() as db:
+                yield db
+            return
+        try:
+            yield self.session
+        except Exception:
+            await self.session.rollback()
+            raise
+        
+    async def _commit(self, db: AsyncSession) -> None:
+        if self.session is None:
+            await db.commit()
+        else:
+            await db.flush()
+    
+    def _columns(self) -> Tuple[Column[Any], ...]:
+        tasks_table = TaskModel.__table__
+        return (tasks_table.c.id, tasks_table.c.title, tasks_table.c.completed, tasks_table.c.version, tasks_table.c.updated_at)
+    
+    def _row_to_entity(self, row: Row[Any]) -> Task:
+        count_hydrated()
+        return Task(
+            id=row.id,
+            title=row.title,
+            completed=row.completed,
+            version=row.version,
+            updated_at=as_utc(row.updated_at)
+        )
+    
+    def _rows_to_entities(self, rows: Iterable[Row[Any]]) -> List[Task]:
+        # Same hot path as TaskSQLAlchemyRepo._rows_to_entities
+        tasks = [
+            Task(task_id, title, completed, version, as_utc(updated_at))
+            for task_id, title, completed, version, updated_at in rows
+        ]
+        count_hydrated(len(tasks))
+        return tasks
+    
+    def _to_entity(self, model: TaskModel) -> Task:
+        count_hydrated()
+        return Task(
+            id=model.id_value,
+            title=model.title_value,
+            completed=model.completed_value,
+            version=model.version_value,
+            updated_at=model.updated_at_value
+        )
@@ -0,0 +1,172 @@
+import json
+import threading
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from app.domain.models.task_entity import Task
+from app.domain.models.task_page import TaskPage
+from app.domain.models.bulk_result import BulkItemResult
+from app.domain.models.task_list_fingerprint import TaskListFingerprint
+from app.domain.models.task_changes import TaskChanges
+from app.domain.models.task_stats import TaskStats
+from app.domain.repositories.task_repository import TaskRepository
+from app.infrastructure.cache.cache_backend import CacheBackend
+
+LIST_VERSION_KEY = "tasks:version"
+
+class CacheStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters: Dict[str, int] = {}
+        
+    def record(self, kind: str, hit: bool) -> None:
+        key = f"{kind}_{'hits' if hit else 'misses'}"
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + 1
+            
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.counters)
+
+class CachedTaskRepository(TaskRepository):
+    """Read-through cache in front of another TaskRepository.
+    
+    Tasks are cached by id and list pages under the current list version, which
+    every write bumps so no stale page can be read again. `after_commit` lets the
+    caller run the invalidation a second time once the write transaction commits,
+    dropping anything a concurrent reader cached from the pre-commit state.
+    
+    List pages are also keyed on the database's list fingerprint: with a
+    per-worker backend, writes handled by another worker never bump this
+    worker's list version, and a page must not be older than the ETag sent
+    with it.
+    """
+    
+    def __init__(
+        self,
+        repo: TaskRepository,
+        backend: CacheBackend,
+        ttl_seconds: float,
+        cache_stats: Optional[CacheStats] = None,
+        after_commit: Optional[Callable[[Callable[[], None]], None]] = None
+    ):
+        self.repo = repo
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.cache_stats = cache_stats or CacheStats()
+        self.after_commit = after_commit
+        self._list_fingerprint: Optional[TaskListFingerprint] = None
+        
+    def get_all(self) -> List[Task]:
+        return self.repo.get_all()
+    
+    def list_page(
+        self,
+        limit: int,
+        after: Optional[int] = None,
+        completed: Optional[bool] = None,
+        title_prefix: Optional[str] = None
+    ) -> TaskPage:
+        version = self.backend.get(LIST_VERSION_KEY) or "0"
+        # Reuses the fingerprint the request already read for its validators
+        fingerprint = self._list_fingerprint or self.list_fingerprint()
+        key = (
+            f"tasks:v{version}:f{fingerprint.max_version}.{fingerprint.count}"
+            f":page:{json.dumps([limit, after, completed, title_prefix])}"
+        )
+        cached = self.backend.get(key)
+        self.cache_stats.record("list", cached is not None)
+        if cached is not None:
+            data = json.loads(cached)
+            return TaskPage(items=[self._load_task(t) for t in data["items"]], next_cursor=data["next_cursor"])
+        page = self.repo.list_page(limit, after, completed, title_prefix)
+        self.backend.set(key, json.dumps({
+            "items": [self._dump_task(t) for t in page.items],
+            "next_cursor": page.next_cursor
+        }), self.ttl_seconds)
+        return page
+    
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Task]:
+        return self.repo.iter_all(batch_size)
+    
+    def get_by_id(self, task_id: int) -> Optional[Task]:
+        cached = self.backend.get(self._task_key(task_id))
+        self.cache_stats.record("task", cached is not None)
+        if cached is not None:
+            return self._load_task(json.loads(cached))
+        task = self.repo.get_by_id(task_id)
+        if task is not None:
+            self.backend.set(self._task_key(task_id), json.dumps(self._dump_task(task)), self.ttl_seconds)
+        return task
+    
+    def list_fingerprint(self) -> TaskListFingerprint:
+        # Conditional requests must see the database, never a cached view of it
+        self._list_fingerprint = self.repo.list_fingerprint()
+        return self._list_fingerprint
+    
+    def stats(self) -> TaskStats:
+        # Already O(1) from the counter row; caching it would only add staleness
+        return self.repo.stats()
+    
+    def changes_since(self, since: int, limit: int) -> TaskChanges:
+        return self.repo.changes_since(since, limit)
+    
+    def search(self, query: str, limit: int, offset: int = 0) -> TaskPage:
+        return self.repo.search(query, limit, offset)
+    
+    def create(self, task_title: str) -> Task:
+        task = self.repo.create(task_title)
+        self._invalidate([])
+        return task
+    
+    def update(self, task_id: int, updated_task: Task) -> Task:
+        task = self.repo.update(task_id, updated_task)
+        self._invalidate([task_id])
+        return task
+    
+    def delete(self, task_id: int) -> None:
+        self.repo.delete(task_id)
+        self._invalidate([task_id])
+        
+    def mark_complete(self, task_id: int) -> Task:
+        task = self.repo.mark_complete(task_id)
+        self._invalidate([task_id])
+        return task
+    
+    def create_many(self, task_titles: List[str]) -> List[BulkItemResult]:
+        results = self.repo.create_many(task_titles)
+        self._invalidate([])
+        return results
+    
+    def update_many(self, updated_tasks: List[Task]) -> List[BulkItemResult]:
+        results = self.repo.update_many(updated_tasks)
+        self._invalidate([r.id for r in results if r.ok and r.id is not None])
+        return results
+    
+    def delete_many(self, task_ids: List[int]) -> List[BulkItemResult]:
+        results = self.repo.delete_many(task_ids)
+        self._invalidate([r.id for r in results if r.ok and r.id is not None])
+        return results
+    
+    def _invalidate(self, task_ids: List[int]) -> None:
+        keys = [self._task_key(task_id) for task_id in task_ids]
+        self._list_fingerprint = None
+        
+        def invalidate() -> None:
+            self.backend.delete(*keys)
+            self.backend.incr(LIST_VERSION_KEY)
+        invalidate()
+        if self.after_commit is not None:
+            self.after_commit(invalidate)
+            
+    def _task_key(self, task_id: int) -> str:
+        return f"task:{task_id}"
+    
+    def _dump_task(self, task: Task) -> Dict[str, Any]:
+        data = asdict(task)
+        data["updated_at"] = task.updated_at.isoformat() if task.updated_at else None
+        return data
+    
+    def _load_task(self, data: Dict[str, Any]) -> Task:
+        updated_at = data.pop("updated_at", None)
+        return Task(**data, updated_at=datetime.fromisoformat(updated_at) if updated_at else None)
@@ -0,0 +1,73 @@
+from typing import Iterator, List, Optional
+from app.domain.models.task_entity import Task
+from app.domain.models.task_page import TaskPage
+from app.domain.models.bulk_result import BulkItemResult
+from app.domain.models.task_list_fingerprint import TaskListFingerprint
+from app.domain.models.task_changes import TaskChanges
+from app.domain.models.task_stats import TaskStats
+from app.domain.repositories.task_repository import TaskRepository
+from app.infrastructure.repositories.task_write_pipeline import TaskWritePipeline
+
+class CoalescingTaskRepository(TaskRepository):
+    """Sends single-task writes through the group-commit pipeline.
+    
+    Each call still returns its own task or raises its own error (ValueError for
+    a missing id), but is committed together with the writes other requests made
+    in the same few milliseconds. Reads and bulk writes, which already amortise
+    their commit, go to the wrapped repository.
+    """
+    
+    def __init__(self, repo: TaskRepository, pipeline: TaskWritePipeline):
+        self.repo = repo
+        self.pipeline = pipeline
+        
+    def get_all(self) -> List[Task]:
+        return self.repo.get_all()
+        
+    def list_page(
+        self,
+        limit: int,
+        after: Optional[int] = None,
+        completed: Optional[bool] = None,
+        title_prefix: Optional[str] = None
+    ) -> TaskPage:
+        return self.repo.list_page(limit, after, completed, title_prefix)
+        
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Task]:
+        return self.repo.iter_all(batch_size)
+        
+    def get_by_id(self, task_id: int) -> Optional[Task]:
+        return self.repo.get_by_id(task_id)
+        
+    def list_fingerprint(self) -> TaskListFingerprint:
+        return self.repo.list_fingerprint()
+        
+    def stats(self) -> TaskStats:
+        return self.repo.stats()
+        
+    def changes_since(self, since: int, limit: int) -> TaskChanges:
+        return self.repo.changes_since(since, limit)
+        
+    def search(self, query: str, limit: int, offset: int = 0) -> TaskPage:
+        return self.repo.search(query, limit, offset)
+        
+    def create(self, task_title: str) -> Task:
+        return self.pipeline.submit(lambda repo: repo.create(task_title))
+        
+    def update(self, task_id: int, updated_task: Task) -> Task:
+        return self.pipeline.submit(lambda repo: repo.update(task_id, updated_task))
+        
+    def delete(self, task_id: int) -> None:
+        self.pipeline.submit(lambda repo: repo.delete(task_id))
+        
+    def mark_complete(self, task_id: int) -> Task:
+        return self.pipeline.submit(lambda repo: repo.mark_complete(task_id))
+        
+    def create_many(self, task_titles: List[str]) -> List[BulkItemResult]:
+        return self.repo.create_many(task_titles)
+        
+    def update_many(self, updated_tasks: List[Task]) -> List[BulkItemResult]:
+        return self.repo.update_many(updated_tasks)
+        
+    def delete_many(self, task_ids: List[int]) -> List[BulkItemResult]:
+        return self.repo.delete_many(task_ids)
@@ -0,0 +1,120 @@
+from datetime import timedelta
+from typing import Any, Optional
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.domain.models.idempotency_record import IdempotencyRecord
+from app.domain.repositories.idempotency_repository import IdempotencyRepository
+from app.infrastructure.db.models.idempotency_key_model import IdempotencyKeyModel
+from app.infrastructure.db.models.task_model import utcnow, as_utc
+from app.infrastructure.db.models.session import SessionLocal
+import logging
+
+logger = logging.getLogger(__name__)
+
+class IdempotencySQLAlchemyRepo(IdempotencyRepository):
+    """Idempotency keys stored in the caller's transaction.
+    
+    Needs the request-scoped session so the key and the write it guards are
+    committed, or rolled back, together.
+    """
+    
+    def __init__(self, session: Session):
+        self.session = session
+        
+    def find(self, scope: str, key: str) -> Optional[IdempotencyRecord]:
+        try:
+            keys = IdempotencyKeyModel.__table__
+            row = self.session.execute(
+                select(keys).where(keys.c.scope == scope, keys.c.idempotency_key == key)
+            ).first()
+            if row is None:
+                return None
+            if row.expires_at <= utcnow():
+                # Free the key for reuse; only ever deletes a row that exists, so
+                # concurrent first requests do not take gap locks here
+                self.session.execute(delete(keys).where(keys.c.id == row.id))
+                return None
+            return self._row_to_record(row)
+        except Exception as e:
+            logger.exception((f'Error in IdempotencyRepository.find: {e}'))
+            raise RuntimeError(f"Failed to read idempotency key: {e}")
+        
+    def reserve(self, scope: str, key: str, request_hash: str, ttl_seconds: float) -> bool:
+        """Claims the key; False when another request already holds it.
+        
+        On a duplicate the session is rolled back, so reserve must be the
+        request's first write.
+        """
+        now = utcnow()
+        try:
+            self.session.execute(insert(IdempotencyKeyModel.__table__).values(
+                scope=scope,
+                idempotency_key=key,
+                request_hash=request_hash,
+                created_at=now,
+                expires_at=now + timedelta(seconds=ttl_seconds)
+            ))
+            return True
+        except IntegrityError:
+            self.session.rollback()
+            return False
+        except Exception as e:
+            logger.exception((f'Error in IdempotencyRepository.reserve: {e}'))
+            raise RuntimeError(f"Failed to reserve idempotency key: {e}")
+        
+    def complete(self, scope: str, key: str, status_code: int, body: bytes) -> None:
+        try:
+            keys = IdempotencyKeyModel.__table__
+            self.session.execute(
+                update(keys)
+                .where(keys.c.scope == scope, keys.c.idempotency_key == key)
+                .values(status_code=status_code, response_body=body)
+            )
+        except Exception as e:
+            logger.exception((f'Error in IdempotencyRepository.complete: {e}'))
+            raise RuntimeError(f"Failed to store idempotent response: {e}")
+        
+    def release(self, scope: str, key: str) -> None:
+        try:
+            keys = IdempotencyKeyModel.__table__
+            self.session.execute(delete(keys).where(keys.c.scope == scope, keys.c.idempotency_key == key))
+        except Exception as e:
+            logger.exception((f'Error in IdempotencyRepository.release: {e}'))
+            raise RuntimeError(f"Failed to release idempotency key: {e}")
+        
+    def purge_expired(self, batch_size: int) -> int:
+        try:
+            keys = IdempotencyKeyModel.__table__
+            # Small batches by primary key keep each delete's locks short
+            ids = list(self.session.scalars(
+                select(keys.c.id).where(keys.c.expires_at <= utcnow()).limit(batch_size)
+            ))
+            if ids:
+                self.session.execute(delete(keys).where(keys.c.id.in_(ids)))
+            return len(ids)
+        except Exception as e:
+            logger.exception((f'Error in IdempotencyRepository.purge_expired: {e}'))
+            raise RuntimeError(f"Failed to purge idempotency keys: {e}")
+        
+    def _row_to_record(self, row: Row[Any]) -> IdempotencyRecord:
+        return IdempotencyRecord(
+            scope=row.scope,
+            key=row.idempotency_key,
+            request_hash=row.request_hash,
+            expires_at=as_utc(row.expires_at),
+            status_code=row.status_code,
+            body=row.response_body
+        )
+
+def purge_expired_idempotency_keys(batch_size: int) -> int:
+    """Deletes expired keys batch by batch, each in its own transaction."""
+    purged = 0
+    while True:
+        with SessionLocal() as db:
+            count = IdempotencySQLAlchemyRepo(db).purge_expired(batch_size)
+            db.commit()
+        purged += count
+        if count < batch_size:
+            return purged
@@ -1,58 +1,224 @@
-from typing import List, Optional
+from contextlib import contextmanager
+from typing import Any, Generator, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, TypeVar
+from datetime import datetime, timedelta
+from sqlalchemy import Column, bindparam, delete, func, insert, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
 from app.domain.models.task_entity import Task
+from app.domain.models.task_page import TaskPage
+from app.domain.models.bulk_result import BulkItemResult
 from app.domain.repositories.task_repository import TaskRepository
-from app.infrastructure.db.models.task_model import TaskModel
-from app.infrastructure.db.models.session import SessionLocal
+from app.domain.models.task_list_fingerprint import TaskListFingerprint
+from app.domain.models.task_changes import TaskChanges, TaskTombstone
+from app.domain.models.task_stats import TaskStats
+from app.infrastructure.db.models.task_model import TaskModel, utcnow, as_utc
+from app.infrastructure.db.models.task_tombstone_model import (
+    TaskTombstoneModel, prunable_tombstones_statement, raise_watermark_statement, tombstone_watermark_statement
+)
+from app.infrastructure.db.models.task_archive_model import (
+    archivable_ids_statement, archive_statements, archived_ids_statement, archived_task_statement,
+    remove_archived_statement, restore_statements
+)
+from app.infrastructure.db.models.task_search_index import LIKE_ESCAPE, title_prefix_pattern, search_terms, search_statement
+from app.infrastructure.db.models.task_stats_model import current_stats_statement, stats_aggregate_statement
+from app.infrastructure.db.models.task_version_model import TaskVersionModel, bump_version_statement, current_version_statement
+from app.infrastructure.db.models.session import SessionLocal, open_read_session
+from app.infrastructure.metrics.request_timings import count_hydrated
+from app.infrastructure.metrics.app_metrics import tasks_archived, task_tombstones_pruned
+from app.config.settings import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+def _chunks(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
 class TaskSQLAlchemyRepo(TaskRepository):
+    def __init__(self, session: Optional[Session] = None):
+        # When a request-scoped session is injected its owner commits it; otherwise
+        # every call opens, commits and closes its own session
+        self.session = session
+        
     def get_all(self) -> List[Task]:
         try:
-            with SessionLocal() as db:
-                tasks = db.query(TaskModel)
-                return [self._to_entity(t) for t in tasks]
+            with self._session() as db:
+                return self._rows_to_entities(db.execute(select(*self._columns())))
         except Exception as e:
             logger.exception((f'Error in TaskRepository.get_all: {e}'))
             raise RuntimeError(f"Failed to retrieve tasks: {e}")
     
+    def list_page(
+        self,
+        limit: int,
+        after: Optional[int] = None,
+        completed: Optional[bool] = None,
+        title_prefix: Optional[str] = None
+    ) -> TaskPage:
+        try:
+            with self._session() as db:
+                stmt = select(*self._columns())
+                if after is not None:
+                    stmt = stmt.where(TaskModel.id > after)
+                if completed is not None:
+                    stmt = stmt.where(TaskModel.completed == completed)
+                if title_prefix:
+                    stmt = stmt.where(TaskModel.title.like(title_prefix_pattern(title_prefix), escape=LIKE_ESCAPE))
+                # Fetch one extra row to know whether another page exists
+                tasks = self._rows_to_entities(db.execute(stmt.order_by(TaskModel.id).limit(limit + 1)))
+                next_cursor = tasks[limit - 1].id if len(tasks) > limit else None
+                return TaskPage(items=tasks[:limit], next_cursor=next_cursor)
+        except Exception as e:
+            logger.exception((f'Error in TaskRepository.list_page: {e}'))
+            raise RuntimeError(f"Failed to retrieve tasks page: {e}")
+    
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Task]:
+        try:
+            # Streams outlive the request, so they always use their own session. Under
+            # the SQLite profile it must not hold the single writer connection
+            with open_read_session() as db:
+                # yield_per streams rows through a server-side cursor in batches
+                stmt = select(*self._columns()).order_by(TaskModel.id).execution_options(yield_per=batch_size)
+                for rows in db.execute(stmt).partitions():
+                    yield from self._rows_to_entities(rows)
+        except Exception as e:
+            logger.exception((f'Error in TaskRepository.iter_all: {e}'))
+            raise RuntimeError(f"Failed to stream tasks: {e}")
+    
     def get_by_id(self, task_id: int) -> Optional[Task]:
         try:
-            with SessionLocal() as db:
-                task = db.query(TaskModel).filter(TaskModel.id == task_id).first()
-                if not task:
+            with self._session() as db:
+                row = db.execute(select(*self._columns()).where(TaskModel.id == task_id)).first()
+                if not row:
+                    # Archived tasks keep their id
+                    row = db.execute(archived_task_statement(task_id)).first()
+                if not row:
                     raise ValueError(f"Task with ID {task_id} not found")
-                return self._to_entity(task) if task else None
+                return self._row_to_entity(row)
         except ValueError: 
             raise
         except Exception as e:
             logger.exception((f'Error in TaskRepository.get_by_id: {e}'))
             raise RuntimeError(f"Failed to retrieve task with ID {task_id}: {e}")
         
+    def list_fingerprint(self) -> TaskListFingerprint:
+        try:
+            with self._session() as db:
+                tasks_table = TaskModel.__table__
+                counter = TaskVersionModel.__table__
+                # One round trip: indexed max(version), count(*) and the counter's last write time
+                row = db.execute(select(
+                    select(func.max(tasks_table.c.version)).scalar_subquery(),
+                    select(func.count()).select_from(tasks_table).scalar_subquery(),
+                    current_version_statement().with_only_columns(counter.c.updated_at).scalar_subquery()
+                )).one()
+                return TaskListFingerprint(
+                    max_version=row[0] or 0,
+                    count=row[1],
+                    last_modified=as_utc(row[2]) if row[2] else None
+                )
+        except Exception as e:
+            logger.exception((f'Error in TaskRepository.list_fingerprint: {e}'))
+            raise RuntimeError(f"Failed to retrieve tasks fingerprint: {e}")
+        
+    def stats(self) -> TaskStats:
+        try:
+            with self._session() as db:
+                row = db.execute(current_stats_statement()).first() if settings.TASKS_STATS_COUNTER_ENABLED else None
+                if row is not None:
+                    total, completed = row
+                else:
+                    counts = {is_completed: count for is_completed, count in db.execute(stats_aggregate_statement())}
+                    total, completed = sum(counts.values()), counts.get(True, 0)
+                return TaskStats(total=total, completed=completed, pending=total - completed)
+        except Exception as e:
+            logger.exception((f'Error in TaskRepository.stats: {e}'))
+            raise RuntimeError(f"Failed to retrieve task stats: {e}")
+        
+    def changes_since(self, since: int, limit: int) -> TaskChanges:
+        try:
+            with self._session() as db:
+                if since < (db.execute(tombstone_watermark_statement()).scalar_one_or_none() or 0):
+                    # Deletes this client has not seen may be pruned already. Anything written
+                    # while it reloads the list is replayed from the current version.
+                    return TaskChanges(next_since=db.execute(current_version_statement()).scalar_one(), full_resync=True)
+                tasks_table = TaskModel.__table__
+                tombstones = TaskTombstoneModel.__table__
+                tasks = [self._row_to_entity(r) for r in db.execute(
+                    select(*self._columns()).where(tasks_table.c.version > since)
+                    .order_by(tasks_table.c.version, tasks_table.c.id).limit(limit + 1)
+                )]
+                deleted = [self._row_to_tombstone(r) for r in db.execute(
+                    select(tombstones).where(tombstones.c.version > since)
+                    .order_by(tombstones.c.version, tombstones.c.id).limit(limit + 1)
+                )]
+                versions = sorted([t.version or 0 for t in tasks] + [d.version for d in deleted])
+                if len(versions) <= limit:
+                    return TaskChanges(tasks=tasks, deleted=deleted, next_since=versions[-1] if versions else since)
+                # Cut on a version boundary: bulk writes share one version and a client
+                # resuming from `next_since` must not skip the rest of that group
+                boundary = versions[limit]
+                upto = boundary - 1 if versions[0] < boundary else boundary
+                if upto == boundary:
+                    # A single version group larger than the page: return all of it
+                    tasks = [self._row_to_entity(r) for r in db.execute(
+                        select(*self._columns()).where(tasks_table.c.version == boundary).order_by(tasks_table.c.id)
+                    )]
+                    deleted = [self._row_to_tombstone(r) for r in db.execute(
+                        select(tombstones).where(tombstones.c.version == boundary).order_by(tombstones.c.id)
+                    )]
+                return TaskChanges(
+                    tasks=[t for t in tasks if (t.version or 0) <= upto],
+                    deleted=[d for d in deleted if d.version <= upto],
+                    next_since=max(v for v in versions if v <= upto),
+                    has_more=True
+                )
+        except Exception as e:
+            logger.exception((f'Error in TaskRepository.changes_since: {e}'))
+            raise RuntimeError(f"Failed to retrieve task changes since version {since}: {e}")
+        
+    def search(self, query: str, limit: int, offset: int = 0) -> TaskPage:
+        try:
+            terms = search_terms(query)
+            if not terms:
+                return TaskPage(items=[], next_cursor=None)
+            with self._session() as db:
+                stmt = search_statement(db.get_bind().dialect.name, terms, self._columns())
+                # Ranked results have no stable keyset, so the cursor is the next offset
+                tasks = self._rows_to_entities(db.execute(stmt.limit(limit + 1).offset(offset)))
+                next_cursor = offset + limit if len(tasks) > limit else None
+                return TaskPage(items=tasks[:limit], next_cursor=next_cursor)
+        except Exception as e:
+            logger.exception((f'Error in TaskRepository.search: {e}'))
+            raise RuntimeError(f"Failed to search tasks: {e}")
+        
     def create(self, task_title: str) -> Task:
         try:
-            with SessionLocal() as db:
-                db_task = TaskModel(title=task_title, completed=False)
+            with self._session() as db:
+                now = utcnow()
+                db_task = TaskModel(title=task_title, completed=False, version=self._next_version(db, now), updated_at=now)
                 db.add(db_task)
-                db.commit()
-                db.refresh(db_task)
-                return self._to_entity(db_task)
+                db.flush()
+                task = self._to_entity(db_task)
+                self._commit(db)
+                return task
         except Exception as e:
             logger.exception((f'Error in TaskRepository.create: {e}'))
             raise RuntimeError(f"Failed to create task: {e}")
     
     def update(self, task_id: int, updated_task: Task) -> Task:
         try:
-            with SessionLocal() as db:
-                db_task = db.query(TaskModel).filter(TaskModel.id == task_id). first()
-                if not db_task:
+            with self._session() as db:
+                values = {"title": updated_task.title, "completed": updated_task.completed}
+                task = self._update_returning(db, task_id, **values)
+                if not task and self._restore_archived(db, [task_id]):
+                    task = self._update_returning(db, task_id, **values)
+                if not task:
                     raise ValueError(f"Task with ID {task_id} not found")
-                setattr(db_task, 'title', updated_task.title)
-                setattr(db_task, 'completed', updated_task.completed)
-                db.commit()
-                db.refresh(db_task)
-                return self._to_entity(db_task)
+                self._commit(db)
+                return task
         except ValueError: 
             raise
         except Exception as e:
@@ -61,14 +227,14 @@ class TaskSQLAlchemyRepo(TaskRepository):
         
     def mark_complete(self, task_id: int) -> Task:
         try: 
-            with SessionLocal() as db:
-                db_task = db.query(TaskModel).filter(TaskModel.id == task_id). first()
-                if not db_task:
+            with self._session() as db:
+                task = self._update_returning(db, task_id, completed=True)
+                if not task and self._restore_archived(db, [task_id]):
+                    task = self._update_returning(db, task_id, completed=True)
+                if not task:
                     raise ValueError(f"Task with ID {task_id} not found")
-                setattr(db_task, 'completed', True)
-                db.commit()
-                db.refresh(db_task)
-                return self._to_entity(db_task)
+                self._commit(db)
+                return task
         except ValueError: 
             raise
         except Exception as e:
@@ -77,21 +243,280 @@ class TaskSQLAlchemyRepo(TaskRepository):
         
     def delete(self, task_id: int) -> None:
         try:
-            with SessionLocal() as db:
-                db_task = db.query(TaskModel).filter(TaskModel.id == task_id).first()
-                if not db_task:
+            with self._session() as db:
+                tasks_table = TaskModel.__table__
+                now = utcnow()
+                version = self._next_version(db, now)
+                # Both tables, so no archived copy of the id outlives the delete
+                result = db.execute(delete(tasks_table).where(tasks_table.c.id == task_id))
+                archived = db.execute(remove_archived_statement([task_id]))
+                if not result.rowcount and not archived.rowcount:
                     raise ValueError(f"Task with ID {task_id} not found")
-                db.delete(db_task)
-                db.commit()
+                self._write_tombstones(db, [task_id], version, now)
+                self._commit(db)
         except ValueError: 
             raise
         except Exception as e:
             logger.exception((f'Error in TaskRepository.delete: {e}'))
             raise RuntimeError(f"Failed to delete task with ID {task_id}: {e}")
         
+    def create_many(self, task_titles: List[str]) -> List[BulkItemResult]:
+        try:
+            with self._session() as db:
+                tasks_table = TaskModel.__table__
+                now = utcnow()
+                version = self._next_version(db, now)
+                rows = [{"title": title, "completed": False, "version": version, "updated_at": now} for title in task_titles]
+                if db.get_bind().dialect.insert_executemany_returning_sort_by_parameter_order:
+                    # Batched multi-row INSERT ... RETURNING, rows come back in input order
+                    stmt = insert(tasks_table).returning(*self._columns(), sort_by_parameter_order=True)
+                    created = [self._row_to_entity(r) for r in db.execute(stmt, rows)]
+                else:
+                    # Without RETURNING (MySQL) the ORM flush is the reliable way to get every new id
+                    models = [TaskModel(**row) for row in rows]
+                    db.add_all(models)
+                    db.flush()
+                    created = [self._to_entity(m) for m in models]
+                self._commit(db)
+                return [BulkItemResult(index=i, id=task.id, ok=True, task=task) for i, task in enumerate(created)]
+        except Exception as e:
+            logger.exception((f'Error in TaskRepository.create_many: {e}'))
+            raise RuntimeError(f"Failed to create tasks: {e}")
+        
+    def update_many(self, updated_tasks: List[Task]) -> List[BulkItemResult]:
+        try:
+            with self._session() as db:
+                task_ids = [t.id for t in updated_tasks if t.id is not None]
+                existing = self._existing_ids(db, task_ids)
+                archived = self._archived_ids(db, [task_id for task_id in task_ids if task_id not in existing])
+                tasks_table = TaskModel.__table__
+                now = utcnow()
+                version = self._next_version(db, now) if existing or archived else None
+                existing |= self._restore_archived(db, sorted(archived))
+                stmt = (
+                    update(tasks_table)
+                    .where(tasks_table.c.id == bindparam("b_id"))
+                    .values(title=bindparam("b_title"), completed=bindparam("b_completed"), version=version, updated_at=now)
+                )
+                params = [
+                    {"b_id": t.id, "b_title": t.title, "b_completed": t.completed}
+                    for t in updated_tasks if t.id in existing
+                ]
+                if params:
+                    db.execute(stmt, params)
+                self._commit(db)
+                return [
+                    BulkItemResult(index=i, id=t.id, ok=True, task=Task(
+                        id=t.id, title=t.title, completed=t.completed, version=version, updated_at=as_utc(now)
+                    ))
+                    if t.id in existing else
+                    BulkItemResult(index=i, id=t.id, ok=False, error=f"Task with ID {t.id} not found")
+                    for i, t in enumerate(updated_tasks)
+                ]
+        except Exception as e:
+            logger.exception((f'Error in TaskRepository.update_many: {e}'))
+            raise RuntimeError(f"Failed to update tasks: {e}")
+        
+    def delete_many(self, task_ids: List[int]) -> List[BulkItemResult]:
+        try:
+            with self._session() as db:
+                tasks_table = TaskModel.__table__
+                now = utcnow()
+                version = self._next_version(db, now)
+                deleted: Set[int] = set()
+                returning = db.get_bind().dialect.delete_returning
+                for chunk in _chunks(list(dict.fromkeys(task_ids)), settings.TASKS_BULK_CHUNK_SIZE):
+                    stmt = delete(tasks_table).where(tasks_table.c.id.in_(chunk))
+                    if returning:
+                        deleted.update(db.scalars(stmt.returning(tasks_table.c.id)))
+                    else:
+                        deleted.update(self._existing_ids(db, chunk))
+                        db.execute(stmt)
+                deleted.update(self._delete_archived(db, task_ids))
+                if deleted:
+                    self._write_tombstones(db, sorted(deleted), version, now)
+                self._commit(db)
+                return [
+                    BulkItemResult(index=i, id=task_id, ok=True)
+                    if task_id in deleted else
+                    BulkItemResult(index=i, id=task_id, ok=False, error=f"Task with ID {task_id} not found")
+                    for i, task_id in enumerate(task_ids)
+                ]
+        except Exception as e:
+            logger.exception((f'Error in TaskRepository.delete_many: {e}'))
+            raise RuntimeError(f"Failed to delete tasks: {e}")
+        
+    def archive_completed(self, completed_before: datetime, batch_size: int) -> int:
+        """Moves one batch of completed tasks last written before `completed_before` to the archive."""
+        try:
+            with self._session() as db:
+                now = utcnow()
+                task_ids = list(db.scalars(archivable_ids_statement(completed_before, batch_size)))
+                if task_ids:
+                    # Bumped like any delete, so list Last-Modified moves and locks stay in order
+                    self._next_version(db, now)
+                    for stmt in archive_statements(task_ids, now):
+                        db.execute(stmt)
+                self._commit(db)
+                return len(task_ids)
+        except Exception as e:
+            logger.exception((f'Error in TaskRepository.archive_completed: {e}'))
+            raise RuntimeError(f"Failed to archive tasks: {e}")
+        
+    def prune_tombstones(self, deleted_before: datetime, batch_size: int) -> int:
+        """Deletes one batch of tombstones written before `deleted_before` and raises the watermark past them."""
+        try:
+            with self._session() as db:
+                rows = db.execute(prunable_tombstones_statement(deleted_before, batch_size)).all()
+                if rows:
+                    tombstones = TaskTombstoneModel.__table__
+                    db.execute(delete(tombstones).where(tombstones.c.id.in_([row.id for row in rows])))
+                    db.execute(raise_watermark_statement(max(row.version for row in rows)))
+                self._commit(db)
+                return len(rows)
+        except Exception as e:
+            logger.exception((f'Error in TaskRepository.prune_tombstones: {e}'))
+            raise RuntimeError(f"Failed to prune task tombstones: {e}")
+        
+    def _update_returning(self, db: Session, task_id: int, **values: Any) -> Optional[Task]:
+        tasks_table = TaskModel.__table__
+        columns = self._columns()
+        now = utcnow()
+        stmt = update(tasks_table).where(tasks_table.c.id == task_id).values(
+            **values, version=self._next_version(db, now), updated_at=now
+        )
+        if db.get_bind().dialect.update_returning:
+            row = db.execute(stmt.returning(*columns)).first()
+        else:
+            # MySQL has no UPDATE ... RETURNING: read the row back in the same transaction.
+            # rowcount counts matched rows because SQLAlchemy enables CLIENT_FOUND_ROWS.
+            result = db.execute(stmt)
+            row = db.execute(select(*columns).where(tasks_table.c.id == task_id)).first() if result.rowcount else None
+        return self._row_to_entity(row) if row else None
+    
+    def _next_version(self, db: Session, now: datetime) -> int:
+        # Every write bumps the counter before touching `tasks`, so writers take the
+        # counter row lock and then the task rows (and the stats row their triggers
+        # update) in the same order and cannot deadlock each other
+        stmt = bump_version_statement(now)
+        if db.get_bind().dialect.update_returning:
+            return db.execute(stmt.returning(TaskVersionModel.__table__.c.value)).scalar_one()
+        db.execute(stmt)
+        return db.execute(current_version_statement()).scalar_one()
+    
+    def _write_tombstones(self, db: Session, task_ids: List[int], version: int, now: datetime) -> None:
+        db.execute(
+            insert(TaskTombstoneModel.__table__),
+            [{"task_id": task_id, "version": version, "deleted_at": now} for task_id in task_ids]
+        )
+    
+    def _existing_ids(self, db: Session, task_ids: Sequence[int]) -> Set[int]:
+        existing: Set[int] = set()
+        for chunk in _chunks(list(dict.fromkeys(task_ids)), settings.TASKS_BULK_CHUNK_SIZE):
+            existing.update(db.scalars(select(TaskModel.id).where(TaskModel.id.in_(chunk))))
+        return existing
+    
+    def _archived_ids(self, db: Session, task_ids: Sequence[int]) -> Set[int]:
+        archived: Set[int] = set()
+        for chunk in _chunks(list(dict.fromkeys(task_ids)), settings.TASKS_BULK_CHUNK_SIZE):
+            archived.update(db.scalars(archived_ids_statement(list(chunk))))
+        return archived
+    
+    def _restore_archived(self, db: Session, task_ids: Sequence[int]) -> Set[int]:
+        # Writing to an archived task brings it back to `tasks` first. Callers have
+        # bumped the version counter already, keeping the usual lock order.
+        restored = self._archived_ids(db, task_ids)
+        for chunk in _chunks(sorted(restored), settings.TASKS_BULK_CHUNK_SIZE):
+            for stmt in restore_statements(list(chunk)):
+                db.execute(stmt)
+        return restored
+    
+    def _delete_archived(self, db: Session, task_ids: Sequence[int]) -> Set[int]:
+        deleted = self._archived_ids(db, task_ids)
+        for chunk in _chunks(sorted(deleted), settings.TASKS_BULK_CHUNK_SIZE):
+            db.execute(remove_archived_statement(list(chunk)))
+        return deleted
+    
+    @contextmanager
+    def _session(self) -> Generator[Session, None, None]:
+        if self.session is None:
+            with SessionLocal() as db:
+                yield db
+            return
+        try:
+            yield self.session
+        except Exception:
+            # Leave the shared session usable for the request's final commit/rollback.
+            # Inside a savepoint its owner undoes just that savepoint instead.
+            if not self.session.in_nested_transaction():
+                self.session.rollback()
+            raise
+        
+    def _commit(self, db: Session) -> None:
+        if self.session is None:
+            db.commit()
+        else:
+            db.flush()
+    
+    def _columns(self) -> Tuple[Column[Any], ...]:
+        tasks_table = TaskModel.__table__
+        return (tasks_table.c.id, tasks_table.c.title, tasks_table.c.completed, tasks_table.c.version, tasks_table.c.updated_at)
+    
+    def _row_to_entity(self, row: Row[Any]) -> Task:
+        count_hydrated()
+        return Task(
+            id=row.id,
+            title=row.title,
+            completed=row.completed,
+            version=row.version,
+            updated_at=as_utc(row.updated_at)
+        )
+    
+    def _rows_to_entities(self, rows: Iterable[Row[Any]]) -> List[Task]:
+        # Read hot path: entities built positionally from plain row tuples, with no
+        # ORM instances, identity map or per-row attribute instrumentation
+        tasks = [
+            Task(task_id, title, completed, version, as_utc(updated_at))
+            for task_id, title, completed, version, updated_at in rows
+        ]
+        count_hydrated(len(tasks))
+        return tasks
+    
+    def _row_to_tombstone(self, row: Row[Any]) -> TaskTombstone:
+        return TaskTombstone(id=row.task_id, version=row.version, deleted_at=as_utc(row.deleted_at))
+    
     def _to_entity(self, model: TaskModel) -> Task:
+        count_hydrated()
         return Task(
             id=model.id_value,
             title=model.title_value,
-            completed=model.completed_value
-        )
\ No newline at end of file
+            completed=model.completed_value,
+            version=model.version_value,
+            updated_at=model.updated_at_value
+        )
+
+def archive_completed_tasks(archive_after_days: float, batch_size: int) -> int:
+    """Archives completed tasks batch by batch, each in its own short transaction."""
+    completed_before = utcnow() - timedelta(days=archive_after_days)
+    archived = 0
+    while True:
+        count = TaskSQLAlchemyRepo().archive_completed(completed_before, batch_size)
+        archived += count
+        tasks_archived.inc(count)
+        if count < batch_size:
+            if archived:
+                logger.info(f'Archived {archived} completed tasks')
+            return archived
+
+def prune_task_tombstones(retention_days: float, batch_size: int) -> int:
+    """Deletes tombstones older than the retention batch by batch, each in its own short transaction."""
+    deleted_before = utcnow() - timedelta(days=retention_days)
+    pruned = 0
+    while True:
+        count = TaskSQLAlchemyRepo().prune_tombstones(deleted_before, batch_size)
+        pruned += count
+        task_tombstones_pruned.inc(count)
+        if count < batch_size:
+            if pruned:
+                logger.info(f'Pruned {pruned} task tombstones')
+            return pruned
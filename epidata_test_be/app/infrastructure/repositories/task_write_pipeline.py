@@ -0,0 +1,169 @@
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+from app.config.settings import settings
+from app.domain.repositories.task_repository import TaskRepository
+from app.infrastructure.db.models.session import create_dedicated_engine
+from app.infrastructure.metrics.request_timings import timed
+from app.infrastructure.repositories.task_sqlalchemy_repo import TaskSQLAlchemyRepo
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class _PendingWrite:
+    operation: Callable[[TaskRepository], Any]
+    future: "Future[Any]" = field(default_factory=Future[Any])
+
+class TaskWritePipeline:
+    """Group commit for single-task writes.
+    
+    Callers queue a write and block on its future. A writer thread drains the
+    queue into micro-batches, closed when `max_batch_size` writes are waiting or
+    `max_delay_ms` after the first one arrived, and runs each batch in a single
+    transaction: one commit, so one fsync, for the whole batch. Every write runs
+    in its own savepoint, so one that fails (a missing id, a constraint) is undone
+    alone and its caller gets its exception while the others still commit.
+    Futures resolve only after the commit, so a caller never sees a result the
+    database could still lose. Without a `session_factory` the thread writes
+    through a dedicated connection of its own.
+    """
+    
+    def __init__(
+        self,
+        max_batch_size: int,
+        max_delay_ms: float,
+        session_factory: Optional[Callable[[], Session]] = None
+    ):
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay_ms / 1000
+        self.session_factory = session_factory
+        self._engine: Optional[Engine] = None
+        self._queue: "queue.Queue[Optional[_PendingWrite]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.batches = 0
+        self.writes = 0
+        self.failed_commits = 0
+        self.max_batch_seen = 0
+        
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+        
+    def start(self) -> None:
+        if self._thread is None:
+            session_factory = self.session_factory
+            if session_factory is None:
+                self._engine = create_dedicated_engine()
+                session_factory = self.session_factory = sessionmaker(bind=self._engine)
+            self._thread = threading.Thread(
+                target=self._run, args=(session_factory,), name="task-write-pipeline", daemon=True
+            )
+            self._thread.start()
+            
+    def stop(self) -> None:
+        # Writes queued before the stop are still committed
+        with self._lock:
+            thread, self._thread = self._thread, None
+            if thread is not None:
+                self._queue.put(None)
+        if thread is not None:
+            thread.join()
+        if self._engine is not None:
+            self._engine.dispose()
+            self._engine = None
+            self.session_factory = None
+            
+    def submit(self, operation: Callable[[TaskRepository], Any]) -> Any:
+        """Runs `operation` against the batch repository and returns its result once committed.
+        
+        Raises RuntimeError once the pipeline is stopped, since nothing would drain the write.
+        """
+        pending = _PendingWrite(operation)
+        with timed("write_batch"):
+            # Checked under the lock stop() queues its sentinel with, so no write lands behind it
+            with self._lock:
+                if self._thread is None:
+                    raise RuntimeError("Task write pipeline is not running")
+                self._queue.put(pending)
+            return pending.future.result()
+            
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "running": self.running,
+                "batches": self.batches,
+                "writes": self.writes,
+                "failed_commits": self.failed_commits,
+                "avg_batch_size": round(self.writes / self.batches, 2) if self.batches else 0.0,
+                "max_batch_size": self.max_batch_seen,
+                "queued": self._queue.qsize()
+            }
+            
+    def _run(self, session_factory: Callable[[], Session]) -> None:
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            deadline = time.monotonic() + self.max_delay
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    pending = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if pending is None:
+                    stopping = True
+                    break
+                batch.append(pending)
+            self._flush(session_factory, batch)
+            
+    def _flush(self, session_factory: Callable[[], Session], batch: List[_PendingWrite]) -> None:
+        outcomes: List[Tuple[_PendingWrite, Any, Optional[Exception]]] = []
+        try:
+            with session_factory() as db:
+                repo = TaskSQLAlchemyRepo(db)
+                connection = db.connection()
+                # Only None once the connection is invalidated, which checkout never hands out
+                dbapi_connection = connection.connection.dbapi_connection
+                if connection.dialect.name == "sqlite" and dbapi_connection is not None and not dbapi_connection.in_transaction:
+                    # pysqlite opens no transaction before a SAVEPOINT, and releasing
+                    # an outermost savepoint commits it: open the batch's one explicitly.
+                    # Engines under the SQLite profile have begun it already.
+                    connection.exec_driver_sql("BEGIN")
+                for pending in batch:
+                    try:
+                        with db.begin_nested():
+                            result = pending.operation(repo)
+                        outcomes.append((pending, result, None))
+                    except Exception as e:
+                        outcomes.append((pending, None, e))
+                db.commit()
+        except Exception as e:
+            logger.exception((f'Error in TaskWritePipeline._flush: {e}'))
+            with self._lock:
+                self.failed_commits += 1
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(RuntimeError(f"Failed to commit task writes: {e}"))
+            return
+        with self._lock:
+            self.batches += 1
+            self.writes += len(batch)
+            self.max_batch_seen = max(self.max_batch_seen, len(batch))
+        for pending, result, error in outcomes:
+            if error is not None:
+                pending.future.set_exception(error)
+            else:
+                pending.future.set_result(result)
+
+# Shared by every request of this worker, started and stopped by the app lifespan
+task_write_pipeline = TaskWritePipeline(settings.TASK_WRITE_BATCH_MAX_SIZE, settings.TASK_WRITE_BATCH_MAX_DELAY_MS)
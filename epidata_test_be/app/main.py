@@ -1,22 +1,132 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.presentation.controllers.task_controller import router as task_router
+from app.presentation.controllers.metrics_controller import router as metrics_router, prometheus_router
+from app.presentation.middleware.request_timing_middleware import RequestTimingMiddleware
+from app.presentation.middleware.compression_middleware import CompressionMiddleware
+from app.presentation.middleware.read_your_writes_middleware import ReadYourWritesMiddleware
+from app.presentation.middleware.admission_control_middleware import AdmissionControlMiddleware, admission_controller
+from app.presentation.controllers.task_stream_controller import router as task_stream_router
 from app.config.settings import settings
-from app.infrastructure.db.models.session import engine
-from app.infrastructure.db.models.task_model import Base
+from app.infrastructure.db.models.session import get_engine, dispose_engine, replica_router, replica_urls, sqlite_profile
+from app.infrastructure.db.migrate import run_migrations
+from app.infrastructure.events.task_events import task_event_broker
+from app.infrastructure.jobs.periodic import run_periodically
+from app.infrastructure.repositories.idempotency_sqlalchemy_repo import purge_expired_idempotency_keys
+from app.infrastructure.repositories.task_write_pipeline import task_write_pipeline
+from app.infrastructure.repositories.task_sqlalchemy_repo import archive_completed_tasks, prune_task_tombstones
 
-Base.metadata.create_all(bind=engine)
+# uvicorn's own logger, so the startup time shows up in the server output
+logger = logging.getLogger("uvicorn.error")
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    started = time.perf_counter()
+    engine = get_engine()
+    # Production runs the migrate command once per deploy instead of once per worker
+    if settings.DB_AUTO_MIGRATE:
+        run_migrations(engine)
+    if settings.DATABASE_ASYNC:
+        from app.infrastructure.db.models.async_session import get_async_engine
+        get_async_engine()
+    task_event_broker.start()
+    if settings.TASK_WRITE_COALESCING_ENABLED:
+        if sqlite_profile(settings.DATABASE_URL) is not None:
+            # Requests take the SQLite write lock with their connection and would hold
+            # it while waiting on the pipeline, which needs that lock to commit
+            logger.warning('TASK_WRITE_COALESCING_ENABLED is ignored under the SQLite profile')
+        else:
+            task_write_pipeline.start()
+    jobs = [
+        asyncio.create_task(run_periodically(
+            settings.IDEMPOTENCY_PURGE_INTERVAL_SECONDS,
+            purge_expired_idempotency_keys,
+            settings.IDEMPOTENCY_PURGE_BATCH_SIZE
+        )),
+        asyncio.create_task(run_periodically(
+            settings.TASK_TOMBSTONES_PRUNE_INTERVAL_SECONDS,
+            prune_task_tombstones,
+            settings.TASK_TOMBSTONES_RETENTION_DAYS,
+            settings.TASK_TOMBSTONES_PRUNE_BATCH_SIZE
+        ))
+    ]
+    if settings.TASKS_ARCHIVE_ENABLED:
+        jobs.append(asyncio.create_task(run_periodically(
+            settings.TASKS_ARCHIVE_INTERVAL_SECONDS,
+            archive_completed_tasks,
+            settings.TASKS_ARCHIVE_AFTER_DAYS,
+            settings.TASKS_ARCHIVE_BATCH_SIZE
+        )))
+    if replica_router.engines:
+        jobs.append(asyncio.create_task(run_periodically(
+            settings.DB_REPLICA_HEALTH_CHECK_SECONDS,
+            replica_router.check_health
+        )))
+    logger.info(f'Startup completed in {(time.perf_counter() - started) * 1000:.1f} ms')
+    yield
+    for job in jobs:
+        job.cancel()
+    task_write_pipeline.stop()
+    task_event_broker.stop()
+    if settings.DATABASE_ASYNC:
+        from app.infrastructure.db.models.async_session import dispose_async_engine
+        await dispose_async_engine()
+    dispose_engine()
 
 app = FastAPI(
     title=settings.APP_NAME,
-    version=settings.VERSION)
+    version=settings.VERSION,
+    lifespan=lifespan)
+
+if settings.ADMISSION_CONTROL_ENABLED:
+    # Innermost, so shed responses still get CORS headers and show up in the request timings
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        controller=admission_controller,
+        retry_after_seconds=settings.ADMISSION_RETRY_AFTER_SECONDS
+    )
 
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000"],
     allow_credentials=True,
     allow_methods=["*"],
-    allow_headers=["*"]
+    allow_headers=["*"],
+    expose_headers=["Server-Timing"]
+)
+
+if settings.COMPRESSION_ENABLED:
+    # Inside the timing middleware, so Server-Timing includes the compress phase
+    app.add_middleware(
+        CompressionMiddleware,
+        encodings=settings.COMPRESSION_ENCODINGS.split(","),
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        levels={
+            "gzip": settings.COMPRESSION_GZIP_LEVEL,
+            "br": settings.COMPRESSION_BROTLI_QUALITY,
+            "zstd": settings.COMPRESSION_ZSTD_LEVEL
+        }
+    )
+
+if replica_urls():
+    app.add_middleware(ReadYourWritesMiddleware, window_seconds=settings.DB_READ_YOUR_WRITES_SECONDS)
+
+app.add_middleware(
+    RequestTimingMiddleware,
+    server_timing=settings.SERVER_TIMING_ENABLED,
+    slow_request_log=settings.SLOW_QUERY_LOG_ENABLED,
+    slow_request_threshold_ms=settings.SLOW_REQUEST_THRESHOLD_MS
 )
 
-app.include_router(task_router, prefix="/api", tags=["Tasks"])
\ No newline at end of file
+if settings.DATABASE_ASYNC:
+    from app.presentation.controllers.async_task_controller import router as async_task_router
+    app.include_router(async_task_router, prefix="/api", tags=["Tasks"])
+
+app.include_router(task_stream_router, prefix="/api", tags=["Tasks"])
+app.include_router(task_router, prefix="/api", tags=["Tasks"])
+app.include_router(metrics_router, prefix="/api", tags=["Metrics"])
+app.include_router(prometheus_router, tags=["Metrics"])
\ No newline at end of file
@@ -0,0 +1,112 @@
+from fastapi import APIRouter, Depends, Header, Query, Request
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config.settings import settings
+from app.presentation.schemas.base_response import ResponseSchema, PageResponseSchema
+from app.presentation.schemas.task_schema import TaskCreate, TaskUpdate
+from app.use_cases.async_task_use_case import AsyncTaskUseCase
+from app.infrastructure.repositories.async_task_sqlalchemy_repo import AsyncTaskSQLAlchemyRepo
+from app.infrastructure.repositories.async_idempotency_sqlalchemy_repo import AsyncIdempotencySQLAlchemyRepo
+from app.domain.repositories.async_idempotency_repository import AsyncIdempotencyRepository
+from app.infrastructure.db.models.async_session import get_async_db_session, get_async_read_db_session
+from app.infrastructure.events.task_events import task_event_broker, SessionBoundPublisher
+from app.domain.models.task_entity import Task
+from app.presentation.schemas.response_utils import ok_response, ok_page_response, error_response
+from app.presentation.schemas.idempotency_utils import idempotent_response_async
+from app.presentation.schemas.conditional_utils import task_etag, list_etag, is_not_modified, with_cache_headers, not_modified_response
+
+# Async counterparts of the hot routes in task_controller. This router is mounted
+# ahead of the sync one, so any route not declared here (e.g. /tasks/export) keeps
+# being served by task_controller. The ":int" convertor stops "/tasks/{task_id}"
+# from shadowing those literal paths.
+router = APIRouter()
+
+def get_async_use_case(db: AsyncSession = Depends(get_async_db_session)) -> AsyncTaskUseCase:
+    return AsyncTaskUseCase(AsyncTaskSQLAlchemyRepo(db), SessionBoundPublisher(task_event_broker, db.sync_session))
+
+def get_async_read_use_case(db: AsyncSession = Depends(get_async_read_db_session)) -> AsyncTaskUseCase:
+    # Under the SQLite profile reads stay off the one writer connection
+    return AsyncTaskUseCase(AsyncTaskSQLAlchemyRepo(db))
+
+def get_async_idempotency_repo(db: AsyncSession = Depends(get_async_db_session)) -> AsyncIdempotencyRepository:
+    return AsyncIdempotencySQLAlchemyRepo(db)
+
+@router.get("/tasks", response_model=PageResponseSchema)
+async def get_all_tasks(
+    request: Request,
+    limit: int = Query(settings.TASKS_PAGE_DEFAULT_LIMIT, ge=1, le=settings.TASKS_PAGE_MAX_LIMIT),
+    after: Optional[int] = Query(None, ge=0),
+    completed: Optional[bool] = None,
+    title_prefix: Optional[str] = Query(None, min_length=1, max_length=100),
+    use_case: AsyncTaskUseCase = Depends(get_async_read_use_case)
+):
+    try:
+        fingerprint = await use_case.get_list_fingerprint()
+        etag = list_etag(fingerprint)
+        if is_not_modified(request, etag, fingerprint.last_modified):
+            return not_modified_response(etag, fingerprint.last_modified)
+        page = await use_case.list_tasks_page(limit, after, completed, title_prefix)
+        response = ok_page_response("Tareas Obtenidas", page.items, page.next_cursor)
+        return with_cache_headers(response, etag, fingerprint.last_modified)
+    except Exception as e:
+        return error_response("Error retrieving tasks", e, status_code=500)
+
+@router.get("/tasks/{task_id:int}", response_model=ResponseSchema)
+async def get_task(task_id: int, request: Request, use_case: AsyncTaskUseCase = Depends(get_async_read_use_case)):
+    try:
+        task = await use_case.get_task_by_id(task_id)
+        if task is None:
+            raise ValueError(f"Task with ID {task_id} not found")
+        etag = task_etag(task)
+        if is_not_modified(request, etag, task.updated_at):
+            return not_modified_response(etag, task.updated_at)
+        return with_cache_headers(ok_response("Tarea obtenida", task), etag, task.updated_at)
+    except ValueError as ve:
+        return error_response(str(ve), None, status_code=404)
+    except Exception as e:
+        return error_response("Error retrieving task", e, status_code=500)
+
+@router.post("/tasks", response_model=ResponseSchema, status_code=201)
+async def create_task(
+    task_create: TaskCreate,
+    idempotency_key: Optional[str] = Header(None, max_length=255),
+    use_case: AsyncTaskUseCase = Depends(get_async_use_case),
+    idempotency: AsyncIdempotencyRepository = Depends(get_async_idempotency_repo)
+):
+    async def create():
+        return ok_response("Tarea creada", await use_case.create_task(task_create.title))
+    try:
+        return await idempotent_response_async(idempotency, "POST /tasks", idempotency_key, task_create, create)
+    except ValueError as ve:
+        return error_response(str(ve), None, status_code=404)
+    except Exception as e:
+        return error_response("Error creating task", e, status_code=500)
+
+@router.put("/tasks/{task_id:int}", response_model=ResponseSchema)
+async def update_task(task_id: int, task_update: TaskUpdate, use_case: AsyncTaskUseCase = Depends(get_async_use_case)):
+    try:
+        task = Task(id=None, title=task_update.title, completed=task_update.completed)
+        return ok_response("Tarea actualizada", await use_case.update_task(task_id, task))
+    except ValueError as ve:
+        return error_response(str(ve), None, status_code=404)
+    except Exception as e:
+        return error_response("Error updating task", e, status_code=500)
+    
+@router.patch("/tasks/{task_id:int}/complete", response_model=ResponseSchema)
+async def mark_task_complete(task_id: int, use_case: AsyncTaskUseCase = Depends(get_async_use_case)):
+    try:
+        return ok_response("Tarea marcada como terminada", await use_case.mark_task_complete(task_id))
+    except ValueError as ve:
+        return error_response(str(ve), None, status_code=404)
+    except Exception as e:
+        return error_response("Error marking task as completed", e, status_code=500)
+
+@router.delete("/tasks/{task_id:int}/complete", response_model=ResponseSchema)
+async def delete_task(task_id: int, use_case: AsyncTaskUseCase = Depends(get_async_use_case)):
+    try:
+        await use_case.delete_task(task_id)
+        return ok_response("Tarea borrada", None)
+    except ValueError as ve:
+        return error_response(str(ve), None, status_code=404)
+    except Exception as e:
+        return error_response("Error deleting task", e, status_code=500)
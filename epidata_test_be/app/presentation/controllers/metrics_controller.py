@@ -0,0 +1,66 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from typing import Any, Dict, List
+from app.config.settings import settings
+from app.infrastructure.db.models.session import pool_metrics, replica_router
+from app.infrastructure.cache.task_cache import task_cache_backend, task_cache_stats
+from app.infrastructure.events.task_events import task_event_broker
+from app.infrastructure.repositories.task_write_pipeline import task_write_pipeline
+from app.infrastructure.metrics.app_metrics import (
+    http_request_duration, db_query_duration, db_slow_queries, rows_hydrated,
+    compression_input_bytes, compression_output_bytes, tasks_archived, http_requests_shed,
+    task_tombstones_pruned
+)
+from app.infrastructure.metrics.prometheus import render_gauges
+from app.presentation.schemas.base_response import ResponseSchema
+from app.presentation.schemas.response_utils import ok_response
+from app.presentation.middleware.admission_control_middleware import admission_controller
+
+router = APIRouter()
+# Mounted without the /api prefix, where Prometheus scrapes by default
+prometheus_router = APIRouter()
+
+@router.get("/metrics/pool", response_model=ResponseSchema)
+def get_pool_metrics():
+    data: Dict[str, Any] = {"sync": pool_metrics.snapshot()}
+    if settings.DATABASE_ASYNC:
+        from app.infrastructure.db.models.async_session import async_pool_metrics
+        data["async"] = async_pool_metrics.snapshot()
+    return ok_response("Metricas del pool", data)
+
+@router.get("/metrics/replicas", response_model=ResponseSchema)
+def get_replica_metrics():
+    return ok_response("Metricas de replicas", replica_router.snapshot())
+
+@router.get("/metrics/cache", response_model=ResponseSchema)
+def get_cache_metrics():
+    data: Dict[str, Any] = {"enabled": task_cache_backend is not None, **task_cache_stats.snapshot()}
+    return ok_response("Metricas de cache", data)
+
+@router.get("/metrics/events", response_model=ResponseSchema)
+def get_event_metrics():
+    data: Dict[str, Any] = {"backend": settings.TASK_EVENTS_BACKEND, **task_event_broker.snapshot()}
+    return ok_response("Metricas de eventos", data)
+
+@router.get("/metrics/writes", response_model=ResponseSchema)
+def get_write_metrics():
+    return ok_response("Metricas de escrituras", task_write_pipeline.snapshot())
+
+@router.get("/metrics/admission", response_model=ResponseSchema)
+def get_admission_metrics():
+    return ok_response("Metricas de admision", admission_controller.snapshot())
+
+@prometheus_router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def get_prometheus_metrics():
+    lines: List[str] = []
+    for metric in (
+        http_request_duration, db_query_duration, db_slow_queries, rows_hydrated,
+        compression_input_bytes, compression_output_bytes, tasks_archived, http_requests_shed,
+        task_tombstones_pruned
+    ):
+        lines.extend(metric.render())
+    lines.extend(render_gauges("db_pool", "Connection pool usage of the sync engine", pool_metrics.snapshot()))
+    lines.extend(render_gauges("task_cache", "Task cache hits, misses and invalidations", task_cache_stats.snapshot()))
+    lines.extend(render_gauges("task_events", "Task change feed subscribers and throughput", task_event_broker.snapshot()))
+    lines.extend(render_gauges("admission", "Requests in flight, queued, admitted and shed per route class", admission_controller.snapshot()))
+    return PlainTextResponse("\n".join(lines) + "\n", media_type="text/plain; version=0.0.4")
\ No newline at end of file
@@ -1,37 +1,183 @@
-from fastapi import APIRouter, Depends
-from typing import List
-from app.presentation.schemas.base_response import ResponseSchema
-from app.presentation.schemas.task_schema import TaskOut, TaskCreate, TaskUpdate
+from fastapi import APIRouter, Depends, Header, Query, Request
+from typing import Iterator, List, Literal, Optional
+from sqlalchemy.orm import Session
+from app.config.settings import settings
+from app.presentation.schemas.base_response import ResponseSchema, PageResponseSchema
+from app.presentation.schemas.task_schema import TaskOut, TaskCreate, TaskUpdate, TaskBulkCreate, TaskBulkUpdate, TaskBulkDelete
 from app.use_cases.task_use_case import TaskUseCase
 from app.infrastructure.repositories.task_sqlalchemy_repo import TaskSQLAlchemyRepo
+from app.infrastructure.repositories.idempotency_sqlalchemy_repo import IdempotencySQLAlchemyRepo
+from app.infrastructure.repositories.coalescing_task_repo import CoalescingTaskRepository
+from app.infrastructure.repositories.task_write_pipeline import task_write_pipeline
+from app.domain.repositories.task_repository import TaskRepository
+from app.domain.repositories.idempotency_repository import IdempotencyRepository
+from app.infrastructure.db.models.session import get_db_session, get_read_db_session, is_replica_session
+from app.infrastructure.cache.task_cache import with_task_cache
+from app.infrastructure.events.task_events import task_event_broker, SessionBoundPublisher
 from app.domain.models.task_entity import Task
-from app.presentation.schemas.response_utils import ok_response, error_response
+from app.presentation.schemas.response_utils import ok_response, ok_page_response, error_response
+from app.presentation.schemas.export_utils import export_response
+from app.presentation.schemas.idempotency_utils import idempotent_response
+from app.presentation.middleware.read_your_writes_middleware import reads_pinned_to_primary
+from app.presentation.schemas.conditional_utils import task_etag, list_etag, is_not_modified, with_cache_headers, not_modified_response
 
 router = APIRouter()
 
-def get_use_case() -> TaskUseCase:
+def get_use_case(request: Request, db: Session = Depends(get_db_session)) -> TaskUseCase:
+    repo: TaskRepository = TaskSQLAlchemyRepo(db)
+    # A write carrying an Idempotency-Key stays in the request transaction, atomic with its key
+    if task_write_pipeline.running and "idempotency-key" not in request.headers:
+        repo = CoalescingTaskRepository(repo, task_write_pipeline)
+    return TaskUseCase(with_task_cache(repo, db), SessionBoundPublisher(task_event_broker, db))
+
+def get_read_db(request: Request) -> Iterator[Session]:
+    # Clients that just wrote keep reading from the primary until replicas catch up
+    yield from get_read_db_session(reads_pinned_to_primary(request))
+
+def get_read_use_case(db: Session = Depends(get_read_db)) -> TaskUseCase:
+    repo = TaskSQLAlchemyRepo(db)
+    # Rows read from a lagging replica must not be written back into the shared cache
+    return TaskUseCase(repo if is_replica_session(db) else with_task_cache(repo, db))
+
+def get_idempotency_repo(db: Session = Depends(get_db_session)) -> IdempotencyRepository:
+    # Same request session as the use case, so key and write commit together
+    return IdempotencySQLAlchemyRepo(db)
+
+def get_streaming_use_case() -> TaskUseCase:
+    # A stream is consumed after the request-scoped session is closed
     return TaskUseCase(TaskSQLAlchemyRepo())
 
-@router.get("/tasks", response_model=ResponseSchema)
-def get_all_tasks(use_case: TaskUseCase = Depends(get_use_case)):
+@router.get("/tasks", response_model=PageResponseSchema)
+def get_all_tasks(
+    request: Request,
+    limit: int = Query(settings.TASKS_PAGE_DEFAULT_LIMIT, ge=1, le=settings.TASKS_PAGE_MAX_LIMIT),
+    after: Optional[int] = Query(None, ge=0),
+    completed: Optional[bool] = None,
+    title_prefix: Optional[str] = Query(None, min_length=1, max_length=100),
+    use_case: TaskUseCase = Depends(get_read_use_case)
+):
     try:
-        return ok_response("Tareas Obtenidas", use_case.list_tasks())
+        fingerprint = use_case.get_list_fingerprint()
+        etag = list_etag(fingerprint)
+        if is_not_modified(request, etag, fingerprint.last_modified):
+            return not_modified_response(etag, fingerprint.last_modified)
+        page = use_case.list_tasks_page(limit, after, completed, title_prefix)
+        response = ok_page_response("Tareas Obtenidas", page.items, page.next_cursor)
+        return with_cache_headers(response, etag, fingerprint.last_modified)
     except Exception as e:
         return error_response("Error retrieving tasks", e, status_code=500)
 
+@router.get("/tasks/export")
+def export_tasks(
+    format: Literal["ndjson", "csv"] = Query("ndjson"),
+    use_case: TaskUseCase = Depends(get_streaming_use_case)
+):
+    try:
+        batch_size = settings.TASKS_EXPORT_BATCH_SIZE
+        return export_response(use_case.export_tasks(batch_size), format, batch_size)
+    except Exception as e:
+        return error_response("Error exporting tasks", e, status_code=500)
+
+@router.get("/tasks/changes", response_model=ResponseSchema)
+def get_task_changes(
+    since: int = Query(..., ge=0),
+    limit: int = Query(settings.TASKS_PAGE_DEFAULT_LIMIT, ge=1, le=settings.TASKS_PAGE_MAX_LIMIT),
+    use_case: TaskUseCase = Depends(get_read_use_case)
+):
+    try:
+        return ok_response("Cambios obtenidos", use_case.list_changes(since, limit))
+    except Exception as e:
+        return error_response("Error retrieving task changes", e, status_code=500)
+
+@router.get("/tasks/stats", response_model=ResponseSchema)
+def get_task_stats(use_case: TaskUseCase = Depends(get_read_use_case)):
+    try:
+        return ok_response("Estadisticas obtenidas", use_case.get_task_stats())
+    except Exception as e:
+        return error_response("Error retrieving task stats", e, status_code=500)
+
+@router.get("/tasks/search", response_model=PageResponseSchema)
+def search_tasks(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(settings.TASKS_PAGE_DEFAULT_LIMIT, ge=1, le=settings.TASKS_PAGE_MAX_LIMIT),
+    offset: int = Query(0, ge=0),
+    use_case: TaskUseCase = Depends(get_read_use_case)
+):
+    try:
+        page = use_case.search_tasks(q, limit, offset)
+        return ok_page_response("Tareas encontradas", page.items, page.next_cursor)
+    except Exception as e:
+        return error_response("Error searching tasks", e, status_code=500)
+
+@router.post("/tasks/bulk", response_model=ResponseSchema, status_code=201)
+def create_tasks(
+    bulk_create: TaskBulkCreate,
+    idempotency_key: Optional[str] = Header(None, max_length=255),
+    use_case: TaskUseCase = Depends(get_use_case),
+    idempotency: IdempotencyRepository = Depends(get_idempotency_repo)
+):
+    def create():
+        return ok_response("Tareas creadas", use_case.create_tasks([t.title for t in bulk_create.tasks]))
+    try:
+        return idempotent_response(idempotency, "POST /tasks/bulk", idempotency_key, bulk_create, create)
+    except Exception as e:
+        return error_response("Error creating tasks", e, status_code=500)
+
+@router.patch("/tasks/bulk", response_model=ResponseSchema)
+def update_tasks(
+    bulk_update: TaskBulkUpdate,
+    idempotency_key: Optional[str] = Header(None, max_length=255),
+    use_case: TaskUseCase = Depends(get_use_case),
+    idempotency: IdempotencyRepository = Depends(get_idempotency_repo)
+):
+    def update():
+        tasks = [Task(id=t.id, title=t.title, completed=t.completed) for t in bulk_update.tasks]
+        return ok_response("Tareas actualizadas", use_case.update_tasks(tasks))
+    try:
+        return idempotent_response(idempotency, "PATCH /tasks/bulk", idempotency_key, bulk_update, update)
+    except Exception as e:
+        return error_response("Error updating tasks", e, status_code=500)
+
+@router.delete("/tasks/bulk", response_model=ResponseSchema)
+def delete_tasks(
+    bulk_delete: TaskBulkDelete,
+    idempotency_key: Optional[str] = Header(None, max_length=255),
+    use_case: TaskUseCase = Depends(get_use_case),
+    idempotency: IdempotencyRepository = Depends(get_idempotency_repo)
+):
+    def delete():
+        return ok_response("Tareas borradas", use_case.delete_tasks(bulk_delete.ids))
+    try:
+        return idempotent_response(idempotency, "DELETE /tasks/bulk", idempotency_key, bulk_delete, delete)
+    except Exception as e:
+        return error_response("Error deleting tasks", e, status_code=500)
+
 @router.get("/tasks/{task_id}", response_model=ResponseSchema)
-def get_task(task_id: int, use_case: TaskUseCase = Depends(get_use_case)):
+def get_task(task_id: int, request: Request, use_case: TaskUseCase = Depends(get_read_use_case)):
     try:
-        return ok_response("Tarea obtenida", use_case.get_task_by_id(task_id))
+        task = use_case.get_task_by_id(task_id)
+        if task is None:
+            raise ValueError(f"Task with ID {task_id} not found")
+        etag = task_etag(task)
+        if is_not_modified(request, etag, task.updated_at):
+            return not_modified_response(etag, task.updated_at)
+        return with_cache_headers(ok_response("Tarea obtenida", task), etag, task.updated_at)
     except ValueError as ve:
         return error_response(str(ve), None, status_code=404)
     except Exception as e:
         return error_response("Error retrieving task", e, status_code=500)
 
 @router.post("/tasks", response_model=ResponseSchema, status_code=201)
-def create_task(task_create: TaskCreate, use_case: TaskUseCase = Depends(get_use_case)):
-    try:
+def create_task(
+    task_create: TaskCreate,
+    idempotency_key: Optional[str] = Header(None, max_length=255),
+    use_case: TaskUseCase = Depends(get_use_case),
+    idempotency: IdempotencyRepository = Depends(get_idempotency_repo)
+):
+    def create():
         return ok_response("Tarea creada", use_case.create_task(task_create.title))
+    try:
+        return idempotent_response(idempotency, "POST /tasks", idempotency_key, task_create, create)
     except ValueError as ve:
         return error_response(str(ve), None, status_code=404)
     except Exception as e:
@@ -0,0 +1,63 @@
+import asyncio
+from fastapi import APIRouter, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from app.config.settings import settings
+from app.infrastructure.events.task_event_broker import Subscription
+from app.infrastructure.events.task_events import task_event_broker
+
+# Live change feed. Mounted ahead of task_controller so "/tasks/{task_id}" does
+# not shadow "/tasks/stream". Events carry the task's version, so a client that
+# reconnects (or is disconnected for falling behind) resyncs via /tasks/changes.
+router = APIRouter()
+
+@router.get("/tasks/stream")
+async def stream_tasks(request: Request):
+    subscription = task_event_broker.subscribe()
+    
+    async def events():
+        try:
+            yield b"retry: 3000\n\n"
+            while not await request.is_disconnected():
+                payload = await subscription.get(settings.TASK_EVENTS_HEARTBEAT_SECONDS)
+                if payload is not None:
+                    yield b"event: task\ndata: " + payload + b"\n\n"
+                elif subscription.closed:
+                    break
+                else:
+                    # Keeps proxies from closing an idle connection
+                    yield b": heartbeat\n\n"
+        finally:
+            task_event_broker.unsubscribe(subscription)
+            
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.websocket("/tasks/stream/ws")
+async def stream_tasks_ws(websocket: WebSocket):
+    await websocket.accept()
+    subscription = task_event_broker.subscribe()
+    watcher = asyncio.create_task(_close_on_disconnect(websocket, subscription))
+    try:
+        while True:
+            payload = await subscription.get(settings.TASK_EVENTS_HEARTBEAT_SECONDS)
+            if payload is not None:
+                await websocket.send_text(payload.decode())
+            elif subscription.closed:
+                if not watcher.done():
+                    await websocket.close(code=1013)
+                break
+    except WebSocketDisconnect:
+        pass
+    finally:
+        watcher.cancel()
+        task_event_broker.unsubscribe(subscription)
+
+async def _close_on_disconnect(websocket: WebSocket, subscription: Subscription) -> None:
+    # Clients send nothing, but only a receive sees them go away; otherwise a quiet
+    # feed keeps the subscription until its next send fails
+    while (await websocket.receive())["type"] != "websocket.disconnect":
+        pass
+    subscription.close()
@@ -0,0 +1,200 @@
+import asyncio
+import bisect
+import itertools
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Pattern, Tuple
+from starlette.types import ASGIApp, Receive, Scope, Send
+from app.config.settings import settings
+from app.infrastructure.metrics.app_metrics import http_requests_shed
+from app.infrastructure.metrics.request_timings import record_phase
+from app.presentation.schemas.response_utils import error_response
+
+@dataclass(frozen=True)
+class RouteClass:
+    name: str
+    # Lower goes first when a slot frees up
+    priority: int
+    methods: Tuple[str, ...]
+    path: Pattern[str]
+
+READ_METHODS = ("GET", "HEAD")
+WRITE_METHODS = ("POST", "PUT", "PATCH", "DELETE")
+
+# First match wins. Unmatched requests (the change stream, metrics, docs) are not limited:
+# the stream holds its request open for as long as the client listens
+ROUTE_CLASSES = (
+    RouteClass("lookup", 0, READ_METHODS, re.compile(r"/api/tasks/\d+")),
+    RouteClass("export", 3, READ_METHODS, re.compile(r"/api/tasks/export")),
+    RouteClass("list", 2, READ_METHODS, re.compile(r"/api/tasks(/changes|/stats|/search)?")),
+    RouteClass("bulk", 3, WRITE_METHODS, re.compile(r"/api/tasks/bulk")),
+    RouteClass("write", 1, WRITE_METHODS, re.compile(r"/api/tasks(/\d+(/complete)?)?")),
+)
+
+def classify(method: str, path: str) -> Optional[RouteClass]:
+    for route_class in ROUTE_CLASSES:
+        if method in route_class.methods and route_class.path.fullmatch(path):
+            return route_class
+    return None
+
+def parse_route_limits(value: str) -> Dict[str, int]:
+    """Reads "lookup:15,list:6" into per-class limits; classes left out get no limit of their own."""
+    names = {route_class.name for route_class in ROUTE_CLASSES}
+    limits: Dict[str, int] = {}
+    for item in filter(None, (part.strip() for part in value.split(","))):
+        name, _, limit = item.partition(":")
+        if name.strip() not in names or not limit.strip().isdigit():
+            raise ValueError(f"Invalid admission route limit: {item}")
+        limits[name.strip()] = int(limit)
+    return limits
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    seq: int
+    route_class: RouteClass = field(compare=False)
+    future: "asyncio.Future[bool]" = field(compare=False)
+
+class AdmissionController:
+    """Caps the requests in flight, per route class and in total, queueing the overflow.
+    
+    Waiters are served by priority, then arrival, whenever a slot frees up, so
+    cheap lookups overtake queued lists and exports. The queue is bounded: when
+    it is full a newcomer evicts the lowest priority waiter, or is turned away
+    if there is none lower than itself. A waiter still queued after
+    `queue_timeout_ms` is turned away too, since its client has likely given up.
+    
+    State is only changed on the event loop of one worker process, so it needs
+    no lock; every worker enforces its own limits.
+    """
+    
+    def __init__(self, max_concurrency: int, limits: Dict[str, int], queue_size: int, queue_timeout_ms: float):
+        self.max_concurrency = max_concurrency
+        self.limits = {rc.name: limits.get(rc.name, max_concurrency) for rc in ROUTE_CLASSES}
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout_ms / 1000
+        self.in_flight = 0
+        self.active = {rc.name: 0 for rc in ROUTE_CLASSES}
+        self.admitted = {rc.name: 0 for rc in ROUTE_CLASSES}
+        self.shed = {rc.name: 0 for rc in ROUTE_CLASSES}
+        self._waiters: List[_Waiter] = []
+        self._seq = itertools.count()
+        
+    async def acquire(self, route_class: RouteClass) -> bool:
+        """Waits for a slot; False when the request is shed instead."""
+        # Nobody queued could use a free slot of this class, _wake would have admitted them
+        if self._has_room(route_class):
+            self._admit(route_class)
+            return True
+        if len(self._waiters) >= self.queue_size:
+            lowest = self._waiters[-1]
+            if lowest.priority <= route_class.priority:
+                self._shed(route_class, "queue_full")
+                return False
+            self._waiters.pop()
+            lowest.future.set_result(False)
+        waiter = _Waiter(route_class.priority, next(self._seq), route_class, asyncio.get_running_loop().create_future())
+        bisect.insort(self._waiters, waiter)
+        started = time.perf_counter()
+        try:
+            await asyncio.wait((waiter.future,), timeout=self.queue_timeout)
+        except asyncio.CancelledError:
+            # The client went away while queued
+            if waiter.future.done():
+                if waiter.future.result():
+                    self.release(route_class)
+            else:
+                self._remove(waiter)
+            raise
+        finally:
+            record_phase("queue", time.perf_counter() - started)
+        if not waiter.future.done():
+            self._remove(waiter)
+            self._shed(route_class, "timeout")
+            return False
+        if not waiter.future.result():
+            self._shed(route_class, "evicted")
+            return False
+        return True
+        
+    def release(self, route_class: RouteClass) -> None:
+        self.in_flight -= 1
+        self.active[route_class.name] -= 1
+        self._wake()
+        
+    def snapshot(self) -> Dict[str, int]:
+        # Read from the threadpool too: work on a copy of the queue
+        waiters = list(self._waiters)
+        stats = {"in_flight": self.in_flight, "queued": len(waiters)}
+        queued = {rc.name: 0 for rc in ROUTE_CLASSES}
+        for waiter in waiters:
+            queued[waiter.route_class.name] += 1
+        for rc in ROUTE_CLASSES:
+            stats.update({
+                f"{rc.name}_active": self.active[rc.name],
+                f"{rc.name}_queued": queued[rc.name],
+                f"{rc.name}_admitted": self.admitted[rc.name],
+                f"{rc.name}_shed": self.shed[rc.name]
+            })
+        return stats
+        
+    def _has_room(self, route_class: RouteClass) -> bool:
+        return self.in_flight < self.max_concurrency and self.active[route_class.name] < self.limits[route_class.name]
+        
+    def _admit(self, route_class: RouteClass) -> None:
+        self.in_flight += 1
+        self.active[route_class.name] += 1
+        self.admitted[route_class.name] += 1
+        
+    def _wake(self) -> None:
+        for waiter in list(self._waiters):
+            if self.in_flight >= self.max_concurrency:
+                return
+            if self._has_room(waiter.route_class):
+                self._waiters.remove(waiter)
+                self._admit(waiter.route_class)
+                waiter.future.set_result(True)
+                
+    def _remove(self, waiter: _Waiter) -> None:
+        if waiter in self._waiters:
+            self._waiters.remove(waiter)
+            
+    def _shed(self, route_class: RouteClass, reason: str) -> None:
+        self.shed[route_class.name] += 1
+        http_requests_shed.inc(route_class=route_class.name, reason=reason)
+
+class AdmissionControlMiddleware:
+    """Admits requests through an AdmissionController, answering 503 when it sheds them.
+    
+    A shed request costs no threadpool slot or database connection, and its
+    Retry-After tells well-behaved clients when to come back.
+    """
+    
+    def __init__(self, app: ASGIApp, controller: AdmissionController, retry_after_seconds: int):
+        self.app = app
+        self.controller = controller
+        self.retry_after_seconds = retry_after_seconds
+        
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        route_class = classify(scope["method"], scope["path"]) if scope["type"] == "http" else None
+        if route_class is None:
+            await self.app(scope, receive, send)
+            return
+        if not await self.controller.acquire(route_class):
+            response = error_response("Server overloaded, retry later", None, status_code=503)
+            response.headers["Retry-After"] = str(self.retry_after_seconds)
+            await response(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(route_class)
+
+# One per worker process, shared by the middleware and the metrics endpoints
+admission_controller = AdmissionController(
+    settings.ADMISSION_MAX_CONCURRENCY,
+    parse_route_limits(settings.ADMISSION_ROUTE_LIMITS),
+    settings.ADMISSION_QUEUE_SIZE,
+    settings.ADMISSION_QUEUE_TIMEOUT_MS
+)
@@ -0,0 +1,254 @@
+import importlib.util
+import logging
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.infrastructure.metrics.app_metrics import compression_input_bytes, compression_output_bytes
+from app.infrastructure.metrics.request_timings import timed
+
+logger = logging.getLogger(__name__)
+
+# Every body the API serves except the SSE change feed, whose events have to reach
+# the client as they happen instead of waiting in a compressor buffer
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/csv", "text/plain")
+
+# zlib, brotli and zstd release the GIL: chunks this large are compressed in the
+# threadpool instead of stalling every other request on the event loop
+THREADPOOL_MIN_SIZE = 64 * 1024
+
+class Compressor(ABC):
+    # Content-Encoding token, also the label on the compression metrics
+    encoding: str
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        pass
+        
+    @abstractmethod
+    def flush(self) -> bytes:
+        pass
+        
+    @abstractmethod
+    def finish(self) -> bytes:
+        pass
+
+class GzipCompressor(Compressor):
+    encoding = "gzip"
+    
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+        
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+        
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+        
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+class BrotliCompressor(Compressor):
+    encoding = "br"
+    
+    def __init__(self, level: int):
+        brotli = importlib.import_module("brotli")
+        self._compressor: Any = brotli.Compressor(quality=level)
+        
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+        
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+        
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+class ZstdCompressor(Compressor):
+    encoding = "zstd"
+    
+    def __init__(self, level: int):
+        zstandard = importlib.import_module("zstandard")
+        self._flush_block: int = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        self._compressor: Any = zstandard.ZstdCompressor(level=level).compressobj()
+        
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+        
+    def flush(self) -> bytes:
+        return self._compressor.flush(self._flush_block)
+        
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+COMPRESSORS: Dict[str, Callable[[int], Compressor]] = {
+    "gzip": GzipCompressor,
+    "br": BrotliCompressor,
+    "zstd": ZstdCompressor
+}
+
+_REQUIRED_PACKAGES = {"br": "brotli", "zstd": "zstandard"}
+
+def available_encodings(preferred: Sequence[str]) -> List[str]:
+    """The preferred encodings this process can produce, in preference order."""
+    encodings: List[str] = []
+    for encoding in (e.strip().lower() for e in preferred if e.strip()):
+        if encoding not in COMPRESSORS:
+            raise ValueError(f"Unknown compression encoding: {encoding}")
+        package = _REQUIRED_PACKAGES.get(encoding)
+        if package is not None and importlib.util.find_spec(package) is None:
+            logger.warning(f"'{package}' not installed, {encoding} compression disabled")
+            continue
+        encodings.append(encoding)
+    return encodings
+
+def negotiate_encoding(accept_encoding: str, offered: Sequence[str]) -> Optional[str]:
+    """Highest q-value encoding the client accepts; server preference breaks ties."""
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name.strip():
+            weights[name.strip().lower()] = quality
+    best, best_quality = None, 0.0
+    for encoding in offered:
+        quality = weights.get(encoding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+class CompressionMiddleware:
+    """Compresses response bodies with the best encoding the client accepts.
+    
+    Bodies are held back until they reach `minimum_size`, so small responses
+    (a single task, errors, 304s) go out untouched, and streamed responses are
+    compressed chunk by chunk as they are produced. Compressed responses get a
+    weak ETag, which conditional requests still match since If-None-Match uses
+    weak comparison.
+    """
+    
+    def __init__(self, app: ASGIApp, encodings: Sequence[str], minimum_size: int, levels: Dict[str, int]):
+        self.app = app
+        self.encodings = available_encodings(encodings)
+        self.minimum_size = minimum_size
+        self.levels = levels
+        
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.encodings:
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        responder = _CompressingResponder(send, encoding, self.minimum_size, self.levels.get(encoding or "", -1))
+        await self.app(scope, receive, responder)
+
+class _CompressingResponder:
+    def __init__(self, send: Send, encoding: Optional[str], minimum_size: int, level: int):
+        self.send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.level = level
+        # The start message is held until the body shows whether it is worth compressing
+        self.start: Optional[Message] = None
+        self.pending: List[bytes] = []
+        self.pending_size = 0
+        self.compressor: Optional[Compressor] = None
+        
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            if self._compressible(message):
+                self.start = message
+            else:
+                await self.send(message)
+            return
+        if message["type"] != "http.response.body":
+            await self._release_start()
+            await self.send(message)
+            return
+        if self.compressor is not None:
+            await self._send_compressed(self.compressor, message.get("body", b""), message.get("more_body", False))
+            return
+        # _compressible only holds the start back once an encoding was negotiated
+        if self.start is None or self.encoding is None:
+            await self.send(message)
+            return
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        self.pending.append(body)
+        self.pending_size += len(body)
+        if self.pending_size < self.minimum_size:
+            if more_body:
+                return
+            await self._release_start()
+            await self.send({"type": "http.response.body", "body": b"".join(self.pending), "more_body": False})
+            return
+        headers = MutableHeaders(raw=list(self.start.get("headers", [])))
+        headers["Content-Encoding"] = self.encoding
+        del headers["Content-Length"]
+        etag = headers.get("ETag")
+        if etag and not etag.startswith("W/"):
+            # The compressed bytes differ from the identity ones the strong ETag names
+            headers["ETag"] = "W/" + etag
+        compressor = self.compressor = COMPRESSORS[self.encoding](self.level)
+        pending = b"".join(self.pending)
+        self.pending = []
+        if not more_body:
+            # Whole body at hand: compress it in one go and keep a Content-Length
+            body = await self._compress(compressor, pending, final=True)
+            headers["Content-Length"] = str(len(body))
+            self.start["headers"] = headers.raw
+            await self._release_start()
+            await self.send({"type": "http.response.body", "body": body, "more_body": False})
+            return
+        self.start["headers"] = headers.raw
+        await self._release_start()
+        await self._send_compressed(compressor, pending, True)
+        
+    def _compressible(self, message: Message) -> bool:
+        headers = Headers(raw=message.get("headers", []))
+        if message["status"] < 200 or message["status"] in (204, 304) or "content-encoding" in headers:
+            return False
+        if headers.get("content-type", "").partition(";")[0].strip() not in COMPRESSIBLE_TYPES:
+            return False
+        # Caches must key the response on Accept-Encoding whether or not it ends up compressed
+        vary = [v.strip() for v in headers.get("vary", "").split(",") if v.strip()]
+        if "accept-encoding" not in (v.lower() for v in vary):
+            mutable = MutableHeaders(raw=list(message.get("headers", [])))
+            mutable["Vary"] = ", ".join(vary + ["Accept-Encoding"])
+            message["headers"] = mutable.raw
+        return self.encoding is not None
+        
+    async def _send_compressed(self, compressor: Compressor, body: bytes, more_body: bool) -> None:
+        chunk = await self._compress(compressor, body, final=not more_body)
+        if chunk or not more_body:
+            await self.send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+            
+    async def _compress(self, compressor: Compressor, body: bytes, final: bool) -> bytes:
+        with timed("compress"):
+            if len(body) >= THREADPOOL_MIN_SIZE:
+                chunk = await run_in_threadpool(self._compress_sync, compressor, body, final)
+            else:
+                chunk = self._compress_sync(compressor, body, final)
+        compression_input_bytes.inc(len(body), encoding=compressor.encoding)
+        compression_output_bytes.inc(len(chunk), encoding=compressor.encoding)
+        return chunk
+        
+    def _compress_sync(self, compressor: Compressor, body: bytes, final: bool) -> bytes:
+        # Each streamed chunk is flushed so the client gets it now rather than when
+        # the compressor's buffer fills; the few bytes this costs per chunk are noise
+        # next to the export's batch-sized chunks
+        chunk = compressor.compress(body)
+        return chunk + (compressor.finish() if final else compressor.flush())
+        
+    async def _release_start(self) -> None:
+        if self.start is not None:
+            start, self.start = self.start, None
+            await self.send(start)
@@ -0,0 +1,44 @@
+import math
+import time
+from fastapi import Request
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+PRIMARY_READS_COOKIE = "primary_reads_until"
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+def reads_pinned_to_primary(request: Request) -> bool:
+    try:
+        return float(request.cookies.get(PRIMARY_READS_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+class ReadYourWritesMiddleware:
+    """Sends a client's reads to the primary for a while after it writes.
+
+    Every successful write response sets a cookie holding the end of the window,
+    so the client's next reads skip replicas that may not have replayed that
+    write yet. Being a cookie, the pin holds whichever worker serves the read.
+    """
+
+    def __init__(self, app: ASGIApp, window_seconds: float):
+        self.app = app
+        self.window_seconds = window_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_pin(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                headers = MutableHeaders(raw=list(message.get("headers", [])))
+                headers.append("Set-Cookie", (
+                    f"{PRIMARY_READS_COOKIE}={time.time() + self.window_seconds:.3f}; "
+                    f"Max-Age={math.ceil(self.window_seconds)}; Path=/; HttpOnly; SameSite=Lax"
+                ))
+                message["headers"] = headers.raw
+            await send(message)
+
+        await self.app(scope, receive, send_with_pin)
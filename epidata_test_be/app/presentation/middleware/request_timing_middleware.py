@@ -0,0 +1,52 @@
+import logging
+from typing import Any, MutableMapping
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.infrastructure.metrics.app_metrics import http_request_duration, rows_hydrated
+from app.infrastructure.metrics.request_timings import RequestTimings, start_request
+
+logger = logging.getLogger("app.slow_request")
+
+def route_label(scope: MutableMapping[str, Any]) -> str:
+    # Templated path, so /tasks/1 and /tasks/2 share one series
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+class RequestTimingMiddleware:
+    """Times each HTTP request by phase.
+    
+    Adds a Server-Timing header to the response, feeds the per-route histograms
+    served at /metrics and logs requests slower than the configured threshold.
+    The clock stops when the response headers go out, so a streamed body (export,
+    change feed) counts up to its first chunk only.
+    """
+    
+    def __init__(self, app: ASGIApp, server_timing: bool, slow_request_log: bool, slow_request_threshold_ms: float):
+        self.app = app
+        self.server_timing = server_timing
+        self.slow_request_log = slow_request_log
+        self.slow_request_threshold = slow_request_threshold_ms / 1000
+        
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        timings = start_request()
+        
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                self._finish(scope, message, timings)
+            await send(message)
+            
+        await self.app(scope, receive, send_with_timing)
+        
+    def _finish(self, scope: Scope, message: Message, timings: RequestTimings) -> None:
+        elapsed = timings.elapsed()
+        route = route_label(scope)
+        http_request_duration.observe(elapsed, method=scope["method"], route=route, status=str(message["status"]))
+        if timings.rows:
+            rows_hydrated.inc(timings.rows, route=route)
+        if self.server_timing:
+            message.setdefault("headers", [])
+            message["headers"] = list(message["headers"]) + [(b"server-timing", timings.server_timing().encode("latin-1"))]
+        if self.slow_request_log and elapsed >= self.slow_request_threshold:
+            logger.warning(f'Slow request {scope["method"]} {scope["path"]} ({elapsed * 1000:.1f} ms): {timings.server_timing()}')
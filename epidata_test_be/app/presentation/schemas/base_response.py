@@ -1,7 +1,10 @@
 from pydantic import BaseModel
-from typing import Any
+from typing import Any, Optional
 
 class ResponseSchema(BaseModel):
     estado: str
     message: str
-    data: Any
\ No newline at end of file
+    data: Any
+
+class PageResponseSchema(ResponseSchema):
+    next_cursor: Optional[int] = None
\ No newline at end of file
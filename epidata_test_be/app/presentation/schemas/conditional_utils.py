@@ -0,0 +1,44 @@
+from datetime import datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+from fastapi import Request
+from fastapi.responses import Response
+from app.domain.models.task_entity import Task
+from app.domain.models.task_list_fingerprint import TaskListFingerprint
+
+def task_etag(task: Task) -> str:
+    return f'"task-{task.id}-{task.version}"'
+
+def list_etag(fingerprint: TaskListFingerprint) -> str:
+    return f'"tasks-{fingerprint.max_version}-{fingerprint.count}"'
+
+def http_date(value: datetime) -> str:
+    return format_datetime(value.replace(microsecond=0), usegmt=True)
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match wins over If-Modified-Since and uses weak comparison (RFC 9110 13.1.2)
+        candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in candidates or etag in candidates
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    return last_modified.replace(microsecond=0) <= since
+
+def with_cache_headers(response: Response, etag: str, last_modified: Optional[datetime]) -> Response:
+    response.headers["ETag"] = etag
+    # Clients may store the response but have to revalidate it before every reuse
+    response.headers["Cache-Control"] = "no-cache"
+    if last_modified is not None:
+        response.headers["Last-Modified"] = http_date(last_modified)
+    return response
+
+def not_modified_response(etag: str, last_modified: Optional[datetime]) -> Response:
+    return with_cache_headers(Response(status_code=304), etag, last_modified)
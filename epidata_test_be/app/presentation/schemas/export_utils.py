@@ -0,0 +1,53 @@
+import csv
+import io
+from itertools import chain
+from typing import Iterable, Iterator, List, Optional
+from fastapi.responses import StreamingResponse
+from app.domain.models.task_entity import Task
+from app.presentation.schemas.response_utils import dumps
+
+CSV_HEADER = ["id", "title", "completed", "version", "updated_at"]
+
+def ndjson_chunks(tasks: Iterable[Task], rows_per_chunk: int) -> Iterator[bytes]:
+    lines: List[bytes] = []
+    for task in tasks:
+        lines.append(dumps(task) + b"\n")
+        if len(lines) >= rows_per_chunk:
+            yield b"".join(lines)
+            lines.clear()
+    if lines:
+        yield b"".join(lines)
+
+def csv_chunks(tasks: Iterable[Task], rows_per_chunk: int) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_HEADER)
+    rows = 0
+    for task in tasks:
+        writer.writerow([
+            task.id,
+            task.title,
+            "true" if task.completed else "false",
+            task.version,
+            task.updated_at.isoformat() if task.updated_at else ""
+        ])
+        rows += 1
+        if rows >= rows_per_chunk:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            rows = 0
+    if buffer.tell():
+        yield buffer.getvalue()
+
+def export_response(tasks: Iterator[Task], export_format: str, rows_per_chunk: int) -> StreamingResponse:
+    # Pull the first row eagerly so query errors surface before the headers are sent
+    first: Optional[Task] = next(tasks, None)
+    rows: Iterator[Task] = chain([first], tasks) if first is not None else tasks
+    if export_format == "csv":
+        return StreamingResponse(
+            csv_chunks(rows, rows_per_chunk),
+            media_type="text/csv",
+            headers={"Content-Disposition": 'attachment; filename="tasks.csv"'}
+        )
+    return StreamingResponse(ndjson_chunks(rows, rows_per_chunk), media_type="application/x-ndjson")
@@ -0,0 +1,78 @@
+import hashlib
+from typing import Awaitable, Callable, Optional
+from fastapi.responses import Response
+from pydantic import BaseModel
+from app.config.settings import settings
+from app.domain.models.idempotency_record import IdempotencyRecord
+from app.domain.repositories.idempotency_repository import IdempotencyRepository
+from app.domain.repositories.async_idempotency_repository import AsyncIdempotencyRepository
+from app.presentation.schemas.response_utils import FastJSONResponse, dumps, error_response
+
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+def request_hash(payload: BaseModel) -> str:
+    return hashlib.sha256(dumps(payload.model_dump(mode="json"))).hexdigest()
+
+def replay_response(record: Optional[IdempotencyRecord], digest: str) -> Response:
+    if record is None or record.request_hash != digest:
+        return error_response("Idempotency-Key was already used with a different request", None, status_code=422)
+    if record.status_code is None:
+        # Only reachable if the first request failed without rolling back its key
+        return error_response("A request with this Idempotency-Key is still in progress", None, status_code=409)
+    response = FastJSONResponse(status_code=record.status_code, content=record.body)
+    response.headers[REPLAYED_HEADER] = "true"
+    return response
+
+def _should_store(response: Response) -> bool:
+    # Server errors are not final: release the key so a retry runs again
+    return response.status_code < 500
+
+def idempotent_response(
+    repo: IdempotencyRepository,
+    scope: str,
+    key: Optional[str],
+    payload: BaseModel,
+    handler: Callable[[], Response]
+) -> Response:
+    """Runs `handler` once per Idempotency-Key and replays its response afterwards.
+    
+    Concurrent duplicates are settled by the unique key: the loser's insert
+    waits for the winner's transaction and then replays the stored response.
+    """
+    if key is None:
+        return handler()
+    digest = request_hash(payload)
+    record = repo.find(scope, key)
+    if record is None:
+        if repo.reserve(scope, key, digest, settings.IDEMPOTENCY_TTL_SECONDS):
+            response = handler()
+            if _should_store(response):
+                repo.complete(scope, key, response.status_code, bytes(response.body))
+            else:
+                repo.release(scope, key)
+            return response
+        record = repo.find(scope, key)
+    return replay_response(record, digest)
+
+async def idempotent_response_async(
+    repo: AsyncIdempotencyRepository,
+    scope: str,
+    key: Optional[str],
+    payload: BaseModel,
+    handler: Callable[[], Awaitable[Response]]
+) -> Response:
+    """Async counterpart of idempotent_response."""
+    if key is None:
+        return await handler()
+    digest = request_hash(payload)
+    record = await repo.find(scope, key)
+    if record is None:
+        if await repo.reserve(scope, key, digest, settings.IDEMPOTENCY_TTL_SECONDS):
+            response = await handler()
+            if _should_store(response):
+                await repo.complete(scope, key, response.status_code, bytes(response.body))
+            else:
+                await repo.release(scope, key)
+            return response
+        record = await repo.find(scope, key)
+    return replay_response(record, digest)
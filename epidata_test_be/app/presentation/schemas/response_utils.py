@@ -1,17 +1,36 @@
-from typing import Any, Optional, Union
-from fastapi.responses import JSONResponse
-from app.presentation.schemas.base_response import ResponseSchema
-
-def ok_response(message: str, data: Any) -> Union[ResponseSchema, JSONResponse]:
-    response = ResponseSchema(estado="ok", message=message, data=data)
-    return JSONResponse(status_code=200, content=response.model_dump())
-
-def error_response(message: str, exc: Optional[Exception], status_code: int) -> Union[ResponseSchema, JSONResponse]:
-    response = ResponseSchema(
-        estado="error",
-        message=message,
-        data={
-            "error": str(exc)
-        }
-    )
-    return JSONResponse(status_code=status_code, content=response.model_dump())
\ No newline at end of file
+from typing import Any, Optional
+import orjson
+from fastapi.responses import Response
+from pydantic import BaseModel
+from app.infrastructure.metrics.request_timings import timed
+
+# The envelope keys are written around a directly serialized payload, skipping the
+# ResponseSchema -> model_dump() -> json.dumps round trip. Output stays byte-for-byte
+# what JSONResponse(ResponseSchema(...).model_dump()) produced: compact, UTF-8, same key order.
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def dumps(data: Any) -> bytes:
+    return orjson.dumps(data, default=_default)
+
+class FastJSONResponse(Response):
+    media_type = "application/json"
+
+def envelope(estado: str, message: str, data: Any, **extra: Any) -> bytes:
+    with timed("serialize"):
+        body = b'{"estado":' + dumps(estado) + b',"message":' + dumps(message) + b',"data":' + dumps(data)
+        for key, value in extra.items():
+            body += b',"' + key.encode("utf-8") + b'":' + dumps(value)
+        return body + b"}"
+
+def ok_response(message: str, data: Any) -> FastJSONResponse:
+    return FastJSONResponse(status_code=200, content=envelope("ok", message, data))
+
+def ok_page_response(message: str, data: Any, next_cursor: Optional[int]) -> FastJSONResponse:
+    return FastJSONResponse(status_code=200, content=envelope("ok", message, data, next_cursor=next_cursor))
+
+def error_response(message: str, exc: Optional[Exception], status_code: int) -> FastJSONResponse:
+    return FastJSONResponse(status_code=status_code, content=envelope("error", message, {"error": str(exc)}))
@@ -1,4 +1,7 @@
+from datetime import datetime
+from typing import List, Optional
 from pydantic import BaseModel, Field
+from app.config.settings import settings
 
 class TaskCreate(BaseModel):
     title: str = Field(..., min_length=1, max_length=100)
@@ -10,4 +13,18 @@ class TaskUpdate(BaseModel):
 class TaskOut(BaseModel):
     id: int
     title: str
-    completed: bool
\ No newline at end of file
+    completed: bool
+    version: Optional[int] = None
+    updated_at: Optional[datetime] = None
+
+class TaskBulkUpdateItem(TaskUpdate):
+    id: int
+
+class TaskBulkCreate(BaseModel):
+    tasks: List[TaskCreate] = Field(..., min_length=1, max_length=settings.TASKS_BULK_MAX_ITEMS)
+
+class TaskBulkUpdate(BaseModel):
+    tasks: List[TaskBulkUpdateItem] = Field(..., min_length=1, max_length=settings.TASKS_BULK_MAX_ITEMS)
+
+class TaskBulkDelete(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=settings.TASKS_BULK_MAX_ITEMS)
\ No newline at end of file
@@ -0,0 +1,47 @@
+"""Production entry point: uvicorn with one worker process per CPU.
+
+    python -m app.infrastructure.db.migrate && python -m app.serve
+"""
+import importlib.util
+import logging
+import os
+import uvicorn
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+def available_cpus() -> int:
+    # Honours CPU affinity (e.g. docker --cpuset-cpus); CPU quotas are not visible
+    # here, so quota-limited containers should set SERVER_WORKERS explicitly
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+def worker_count() -> int:
+    # Each worker runs its own event loop plus a threadpool for the sync routes,
+    # so one per CPU keeps every core busy without oversubscribing
+    return settings.SERVER_WORKERS or max(2, available_cpus())
+
+def _installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+def main() -> None:
+    loop = "uvloop" if _installed("uvloop") else "asyncio"
+    http = "httptools" if _installed("httptools") else "h11"
+    if loop != "uvloop" or http != "httptools":
+        logger.warning(f'uvloop/httptools not installed, falling back to loop={loop} http={http}')
+    uvicorn.run(
+        "app.main:app",
+        host=settings.SERVER_HOST,
+        port=settings.SERVER_PORT,
+        workers=worker_count(),
+        loop=loop,
+        http=http,
+        backlog=settings.SERVER_BACKLOG,
+        timeout_keep_alive=settings.SERVER_KEEPALIVE_SECONDS,
+        proxy_headers=True,
+        access_log=False
+    )
+
+if __name__ == "__main__":
+    main()
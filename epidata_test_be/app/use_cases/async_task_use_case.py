@@ -0,0 +1,52 @@
+from typing import Optional
+from app.domain.models.task_entity import Task
+from app.domain.models.task_event import TaskEvent, TASK_CREATED, TASK_UPDATED, TASK_COMPLETED, TASK_DELETED
+from app.domain.repositories.async_task_repository import AsyncTaskRepository
+from app.domain.events.task_event_publisher import TaskEventPublisher
+
+class AsyncTaskUseCase:
+    def __init__(self, repo: AsyncTaskRepository, events: Optional[TaskEventPublisher] = None):
+        self.repo = repo
+        self.events = events
+        
+    async def list_tasks(self):
+        return await self.repo.get_all()
+    
+    async def list_tasks_page(
+        self,
+        limit: int,
+        after: Optional[int] = None,
+        completed: Optional[bool] = None,
+        title_prefix: Optional[str] = None
+    ):
+        return await self.repo.list_page(limit, after, completed, title_prefix)
+    
+    async def get_task_by_id(self, task_id: int):
+        return await self.repo.get_by_id(task_id)
+    
+    async def get_list_fingerprint(self):
+        return await self.repo.list_fingerprint()
+    
+    async def create_task(self, title: str):
+        task = await self.repo.create(title)
+        self._publish(TASK_CREATED, task)
+        return task
+    
+    async def update_task(self, task_id: int, task: Task):
+        updated = await self.repo.update(task_id, task)
+        self._publish(TASK_UPDATED, updated)
+        return updated
+    
+    async def mark_task_complete(self, task_id: int):
+        task = await self.repo.mark_complete(task_id)
+        self._publish(TASK_COMPLETED, task)
+        return task
+    
+    async def delete_task(self, task_id: int):
+        result = await self.repo.delete(task_id)
+        self._publish(TASK_DELETED, None, task_id)
+        return result
+    
+    def _publish(self, event_type: str, task: Optional[Task], task_id: Optional[int] = None):
+        if self.events is not None:
+            self.events.publish(TaskEvent(type=event_type, task_id=task.id if task else task_id, task=task))
@@ -1,24 +1,87 @@
+from typing import List, Optional
 from app.domain.models.task_entity import Task
+from app.domain.models.bulk_result import BulkItemResult
+from app.domain.models.task_event import TaskEvent, TASK_CREATED, TASK_UPDATED, TASK_COMPLETED, TASK_DELETED
 from app.domain.repositories.task_repository import TaskRepository
+from app.domain.events.task_event_publisher import TaskEventPublisher
 
 class TaskUseCase:
-    def __init__(self, repo: TaskRepository):
+    def __init__(self, repo: TaskRepository, events: Optional[TaskEventPublisher] = None):
         self.repo = repo
+        self.events = events
         
     def list_tasks(self):
         return self.repo.get_all()
     
+    def list_tasks_page(
+        self,
+        limit: int,
+        after: Optional[int] = None,
+        completed: Optional[bool] = None,
+        title_prefix: Optional[str] = None
+    ):
+        return self.repo.list_page(limit, after, completed, title_prefix)
+    
+    def export_tasks(self, batch_size: int = 1000):
+        return self.repo.iter_all(batch_size)
+    
     def get_task_by_id(self, task_id: int):
         return self.repo.get_by_id(task_id)
     
+    def get_list_fingerprint(self):
+        return self.repo.list_fingerprint()
+    
+    def get_task_stats(self):
+        return self.repo.stats()
+    
+    def list_changes(self, since: int, limit: int):
+        return self.repo.changes_since(since, limit)
+    
+    def search_tasks(self, query: str, limit: int, offset: int = 0):
+        return self.repo.search(query, limit, offset)
+    
     def create_task(self, title: str):
-        return self.repo.create(title)
+        task = self.repo.create(title)
+        self._publish(TASK_CREATED, task)
+        return task
     
     def update_task(self, task_id: int, task: Task):
-        return self.repo.update(task_id, task)
+        updated = self.repo.update(task_id, task)
+        self._publish(TASK_UPDATED, updated)
+        return updated
     
     def mark_task_complete(self, task_id: int):
-        return self.repo.mark_complete(task_id)
+        task = self.repo.mark_complete(task_id)
+        self._publish(TASK_COMPLETED, task)
+        return task
     
     def delete_task(self, task_id: int):    
-        return self.repo.delete(task_id)
\ No newline at end of file
+        result = self.repo.delete(task_id)
+        self._publish(TASK_DELETED, None, task_id)
+        return result
+    
+    def create_tasks(self, titles: List[str]):
+        results = self.repo.create_many(titles)
+        self._publish_results(TASK_CREATED, results)
+        return results
+    
+    def update_tasks(self, tasks: List[Task]):
+        results = self.repo.update_many(tasks)
+        self._publish_results(TASK_UPDATED, results)
+        return results
+    
+    def delete_tasks(self, task_ids: List[int]):
+        results = self.repo.delete_many(task_ids)
+        self._publish_results(TASK_DELETED, results)
+        return results
+    
+    def _publish(self, event_type: str, task: Optional[Task], task_id: Optional[int] = None):
+        if self.events is not None:
+            self.events.publish(TaskEvent(type=event_type, task_id=task.id if task else task_id, task=task))
+            
+    def _publish_results(self, event_type: str, results: List[BulkItemResult]):
+        if self.events is None:
+            return
+        for result in results:
+            if result.ok:
+                self._publish(event_type, result.task, result.id)
\ No newline at end of file
@@ -0,0 +1,57 @@
+"""Compare two task_api_benchmark reports.
+
+    python -m benchmarks.compare_benchmarks before.json after.json --threshold 10
+
+Prints the p95 latency and RPS change of every scenario present in both reports
+and exits with status 1 when any of them regressed by more than the threshold.
+"""
+import argparse
+import json
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+Key = Tuple[str, int, str]
+
+def load_results(path: str) -> Dict[Key, Dict[str, Any]]:
+    with open(path) as report:
+        results = json.load(report)["results"]
+    return {(r["database"], r["size"], r["scenario"]): r for r in results}
+
+def change_pct(before: Optional[float], after: Optional[float]) -> Optional[float]:
+    if not before or after is None:
+        return None
+    return round((after - before) / before * 100, 1)
+
+def compare(before: Dict[Key, Dict[str, Any]], after: Dict[Key, Dict[str, Any]], threshold: float) -> Tuple[List[str], bool]:
+    lines = [f"{'database':<8} {'size':>8} {'scenario':<24} {'p95 ms':>18} {'rps':>20}"]
+    regressed = False
+    for key in sorted(before.keys() & after.keys()):
+        old, new = before[key], after[key]
+        p95_change = change_pct(old["latency_ms"]["p95"], new["latency_ms"]["p95"])
+        rps_change = change_pct(old["rps"], new["rps"])
+        flag = ""
+        if (p95_change or 0) > threshold or (rps_change or 0) < -threshold:
+            regressed = True
+            flag = "  REGRESSION"
+        lines.append(
+            f"{key[0]:<8} {key[1]:>8} {key[2]:<24} "
+            f"{old['latency_ms']['p95']!s:>7} -> {new['latency_ms']['p95']!s:<7} "
+            f"{old['rps']!s:>8} -> {new['rps']!s:<8} "
+            f"({p95_change:+}% p95, {rps_change:+}% rps){flag}"
+            if p95_change is not None and rps_change is not None else
+            f"{key[0]:<8} {key[1]:>8} {key[2]:<24} no data"
+        )
+    return lines, regressed
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("before")
+    parser.add_argument("after")
+    parser.add_argument("--threshold", type=float, default=10.0, help="allowed regression in percent")
+    args = parser.parse_args(argv)
+    lines, regressed = compare(load_results(args.before), load_results(args.after), args.threshold)
+    print("\n".join(lines))
+    sys.exit(1 if regressed else 0)
+
+if __name__ == "__main__":
+    main()
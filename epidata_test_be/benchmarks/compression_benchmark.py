@@ -0,0 +1,106 @@
+"""CPU cost vs. bytes saved when compressing typical task API responses.
+
+Builds list pages and NDJSON exports exactly as the API serializes them and
+compresses each with every available encoding and level. For every payload it
+reports compression time, output size and the net time won on a link of the
+given bandwidth (transfer time saved minus CPU spent), which is what
+COMPRESSION_MIN_SIZE and the COMPRESSION_*_LEVEL settings trade off.
+
+    python -m benchmarks.compression_benchmark --link-mbps 50
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.domain.models.task_entity import Task
+from app.presentation.middleware.compression_middleware import COMPRESSORS, available_encodings
+from app.presentation.schemas.response_utils import dumps, envelope
+
+DEFAULT_TASK_COUNTS = "1,5,10,25,50,100,1000,10000"
+LEVELS = {"gzip": (1, 6, 9), "br": (1, 4, 11), "zstd": (1, 3, 10)}
+
+def make_tasks(count: int) -> List[Task]:
+    now = datetime.now(timezone.utc)
+    return [
+        Task(id=i, title=f"Task {i}: follow up on report {i * 7 % 1000}", completed=i % 3 == 0, version=i, updated_at=now)
+        for i in range(1, count + 1)
+    ]
+
+def payloads(count: int) -> List[Tuple[str, bytes]]:
+    tasks = make_tasks(count)
+    page = envelope("ok", "Tareas Obtenidas", tasks, next_cursor=None)
+    export = b"".join(dumps(task) + b"\n" for task in tasks)
+    return [("list_page", page), ("export_ndjson", export)]
+
+def compress_once(encoding: str, level: int, body: bytes) -> Tuple[float, int]:
+    started = time.perf_counter()
+    compressor = COMPRESSORS[encoding](level)
+    size = len(compressor.compress(body)) + len(compressor.finish())
+    return time.perf_counter() - started, size
+
+def measure(encoding: str, level: int, body: bytes, repeat: int, link_mbps: float) -> Dict[str, Any]:
+    results = [compress_once(encoding, level, body) for _ in range(repeat)]
+    cpu_ms = statistics.median(seconds for seconds, _ in results) * 1000
+    size = results[0][1]
+    saved = len(body) - size
+    transfer_saved_ms = saved * 8 / (link_mbps * 1000)
+    return {
+        "encoding": encoding,
+        "level": level,
+        "bytes_out": size,
+        "ratio": round(len(body) / size, 2) if size else None,
+        "cpu_ms": round(cpu_ms, 4),
+        "mb_per_s": round(len(body) / 2**20 / (cpu_ms / 1000), 1) if cpu_ms else None,
+        "net_ms": round(transfer_saved_ms - cpu_ms, 4)
+    }
+
+def break_even_size(rows: List[Dict[str, Any]], encoding: str, level: int) -> Optional[int]:
+    """Smallest measured list page from which compressing is a net win."""
+    winning = [
+        row["bytes_in"] for row in rows
+        if row["payload"] == "list_page"
+        for result in row["results"]
+        if result["encoding"] == encoding and result["level"] == level and result["net_ms"] > 0
+    ]
+    return min(winning) if winning else None
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", default=DEFAULT_TASK_COUNTS, help="comma separated tasks per payload")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--link-mbps", type=float, default=50.0, help="client bandwidth the savings are priced at")
+    parser.add_argument("--encodings", default="zstd,br,gzip")
+    args = parser.parse_args(argv)
+
+    encodings = available_encodings(args.encodings.split(","))
+    rows = []
+    for count in (int(c) for c in args.tasks.split(",")):
+        for name, body in payloads(count):
+            rows.append({
+                "payload": name,
+                "tasks": count,
+                "bytes_in": len(body),
+                "results": [
+                    measure(encoding, level, body, args.repeat, args.link_mbps)
+                    for encoding in encodings for level in LEVELS[encoding]
+                ]
+            })
+    print(json.dumps({
+        "link_mbps": args.link_mbps,
+        "encodings": encodings,
+        "break_even_bytes": {
+            f"{encoding}:{level}": break_even_size(rows, encoding, level)
+            for encoding in encodings for level in LEVELS[encoding]
+        },
+        "payloads": rows
+    }, indent=2))
+
+if __name__ == "__main__":
+    main()
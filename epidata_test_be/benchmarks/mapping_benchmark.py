@@ -0,0 +1,105 @@
+"""Micro-benchmark of the row -> Task mapping used by list reads.
+
+Compares the previous read path (ORM instances, `*_value` properties, plain
+dataclass) against TaskSQLAlchemyRepo's Core path (column tuples, slotted
+Task). Reports time and allocations per N rows as JSON.
+
+    python -m benchmarks.mapping_benchmark --rows 100000
+"""
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.infrastructure.db.models.base import Base
+from app.infrastructure.db.models.task_model import TaskModel, utcnow
+from app.infrastructure.repositories.task_sqlalchemy_repo import TaskSQLAlchemyRepo
+
+@dataclass
+class UnslottedTask:
+    """Task as it was before it became a slotted dataclass."""
+    id: Optional[int]
+    title: str
+    completed: bool = False
+    version: Optional[int] = None
+    updated_at: Optional[datetime] = None
+
+def orm_path(session_factory: Callable) -> List[Any]:
+    with session_factory() as db:
+        return [
+            UnslottedTask(
+                id=t.id_value,
+                title=t.title_value,
+                completed=t.completed_value,
+                version=t.version_value,
+                updated_at=t.updated_at_value
+            )
+            for t in db.query(TaskModel)
+        ]
+
+def core_path(session_factory: Callable) -> List[Any]:
+    with session_factory() as db:
+        return TaskSQLAlchemyRepo(db).get_all()
+
+def measure(fn: Callable[[], List[Any]], repeat: int) -> Dict[str, Any]:
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started)
+    gc.collect()
+    tracemalloc.start()
+    result = fn()
+    current, peak = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(stat.count for stat in snapshot.statistics("filename"))
+    return {
+        "rows": len(result),
+        "best_s": round(min(times), 4),
+        "mean_s": round(sum(times) / len(times), 4),
+        "peak_alloc_mb": round(peak / 2**20, 2),
+        "retained_mb": round(current / 2**20, 2),
+        "retained_blocks": blocks
+    }
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    now = utcnow()
+    with engine.begin() as conn:
+        conn.execute(insert(TaskModel), [
+            {"id": i, "title": f"Task {i}", "completed": i % 2 == 0, "version": i, "updated_at": now}
+            for i in range(1, args.rows + 1)
+        ])
+    session_factory = sessionmaker(bind=engine)
+
+    before = measure(lambda: orm_path(session_factory), args.repeat)
+    after = measure(lambda: core_path(session_factory), args.repeat)
+    print(json.dumps({
+        "rows": args.rows,
+        "orm_unslotted": before,
+        "core_slotted": after,
+        "speedup": round(before["best_s"] / after["best_s"], 2),
+        "retained_memory_ratio": round(after["retained_mb"] / before["retained_mb"], 2) if before["retained_mb"] else None
+    }, indent=2))
+
+if __name__ == "__main__":
+    main()
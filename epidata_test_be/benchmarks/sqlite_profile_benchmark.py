@@ -0,0 +1,145 @@
+"""Concurrent TaskSQLAlchemyRepo workload on a SQLite file, default engine vs SQLite profile.
+
+Seeds a file database, then runs the repository operations from many threads the
+way requests do: writes in a session with an eager checkout and one commit,
+reads in their own session (the profile's read engine when it has one). Reports
+throughput, per-operation latency and errors such as "database is locked" as JSON.
+
+    python -m benchmarks.sqlite_profile_benchmark --threads 32 --duration 10
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from unittest.mock import patch
+
+from sqlalchemy import insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.config.settings import settings
+from app.domain.models.task_entity import Task
+from app.infrastructure.db.migrate import run_migrations
+from app.infrastructure.db.models.session import create_primary_engines
+from app.infrastructure.db.models.task_model import TaskModel, utcnow
+from app.infrastructure.repositories.task_sqlalchemy_repo import TaskSQLAlchemyRepo
+
+# Share of each operation in the mix, roughly what the web client sends
+OPERATIONS = {
+    "get_by_id": 40,
+    "list_page": 25,
+    "stats": 5,
+    "create": 15,
+    "mark_complete": 10,
+    "update": 5,
+}
+WRITES = ("create", "mark_complete", "update")
+
+def seed(engine: Engine, size: int) -> None:
+    run_migrations(engine)
+    now = utcnow()
+    with engine.begin() as conn:
+        conn.execute(insert(TaskModel), [
+            {"title": f"Task {i}", "completed": False, "version": 0, "updated_at": now} for i in range(size)
+        ])
+
+def run_operation(name: str, repo: TaskSQLAlchemyRepo, size: int) -> None:
+    task_id = random.randint(1, size)
+    if name == "get_by_id":
+        repo.get_by_id(task_id)
+    elif name == "list_page":
+        repo.list_page(100, after=random.randint(0, size))
+    elif name == "stats":
+        repo.stats()
+    elif name == "create":
+        repo.create("Benchmark task")
+    elif name == "mark_complete":
+        repo.mark_complete(task_id)
+    else:
+        repo.update(task_id, Task(id=task_id, title="Updated task", completed=False))
+
+def worker(
+    write_sessions: Callable[[], Session],
+    read_sessions: Callable[[], Session],
+    size: int,
+    deadline: float,
+    latencies: Dict[str, List[float]],
+    errors: Dict[str, int],
+    lock: threading.Lock
+) -> None:
+    names, weights = list(OPERATIONS), list(OPERATIONS.values())
+    while time.perf_counter() < deadline:
+        name = random.choices(names, weights)[0]
+        started = time.perf_counter()
+        try:
+            with (write_sessions if name in WRITES else read_sessions)() as db:
+                db.connection()
+                run_operation(name, TaskSQLAlchemyRepo(db), size)
+                db.commit()
+        except Exception as e:
+            error = "database is locked" if "locked" in str(e) else type(e).__name__
+            with lock:
+                errors[error] = errors.get(error, 0) + 1
+            continue
+        elapsed = time.perf_counter() - started
+        with lock:
+            latencies[name].append(elapsed)
+
+def run_profile(profile_enabled: bool, args: argparse.Namespace, workdir: str) -> Dict[str, Any]:
+    url = f"sqlite:///{workdir}/{'profile' if profile_enabled else 'default'}.db"
+    with patch.object(settings, "SQLITE_PROFILE_ENABLED", profile_enabled):
+        writer, reader = create_primary_engines(url)
+    seed(writer, args.size)
+    write_sessions = sessionmaker(bind=writer)
+    read_sessions = sessionmaker(bind=reader or writer)
+    latencies: Dict[str, List[float]] = {name: [] for name in OPERATIONS}
+    errors: Dict[str, int] = {}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + args.duration
+    threads = [
+        threading.Thread(target=worker, args=(write_sessions, read_sessions, args.size, deadline, latencies, errors, lock))
+        for _ in range(args.threads)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    writer.dispose()
+    if reader is not None:
+        reader.dispose()
+    completed = sum(len(times) for times in latencies.values())
+    return {
+        "profile": "sqlite_profile" if profile_enabled else "default",
+        "ops_per_s": round(completed / args.duration, 1),
+        "errors": errors,
+        "operations": {
+            name: {
+                "count": len(times),
+                "p50_ms": round(statistics.median(times) * 1000, 2),
+                "p95_ms": round(statistics.quantiles(times, n=20)[18] * 1000, 2) if len(times) > 1 else None
+            }
+            for name, times in latencies.items() if times
+        }
+    }
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=10000, help="tasks seeded before the run")
+    parser.add_argument("--threads", type=int, default=16, help="concurrent workers, like the server threadpool")
+    parser.add_argument("--duration", type=float, default=10.0, help="measured seconds per profile")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="sqlite-profile-bench-") as workdir:
+        results = [run_profile(enabled, args, workdir) for enabled in (False, True)]
+    print(json.dumps({"size": args.size, "threads": args.threads, "results": results}, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Measures cold start of the production server profile.
+
+Starts `python -m app.serve` against a fresh SQLite database and reports the
+time from process spawn to the first successful response, for the migrate
+command run separately (DB_AUTO_MIGRATE=false) and for per-worker schema
+creation. Exits non-zero when the production profile misses --target-ms.
+
+    python -m benchmarks.startup_benchmark --workers 4 --target-ms 5000
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from benchmarks.task_api_benchmark import PROJECT_ROOT, free_port
+
+def wait_ready(url: str, process: subprocess.Popen, timeout: float) -> float:
+    started = time.perf_counter()
+    while time.perf_counter() - started < timeout:
+        if process.poll() is not None:
+            raise RuntimeError("Server exited during startup")
+        try:
+            if httpx.get(url, timeout=0.5).status_code == 200:
+                return time.perf_counter() - started
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.01)
+    raise RuntimeError("Server did not become ready")
+
+def measure(database_url: str, workers: int, auto_migrate: bool, runs: int) -> Dict[str, Any]:
+    env = {**os.environ, "DATABASE_URL": database_url, "SERVER_WORKERS": str(workers),
+           "DB_AUTO_MIGRATE": str(auto_migrate).lower(), "SERVER_HOST": "127.0.0.1"}
+    migrate_s = None
+    if not auto_migrate:
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-m", "app.infrastructure.db.migrate"], cwd=PROJECT_ROOT, env=env,
+                       check=True, capture_output=True)
+        migrate_s = time.perf_counter() - started
+    samples: List[float] = []
+    for _ in range(runs):
+        port = free_port()
+        env["SERVER_PORT"] = str(port)
+        spawned = time.perf_counter()
+        process = subprocess.Popen([sys.executable, "-m", "app.serve"], cwd=PROJECT_ROOT, env=env,
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            wait_ready(f"http://127.0.0.1:{port}/api/tasks?limit=1", process, timeout=60)
+            samples.append(time.perf_counter() - spawned)
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+    return {
+        "auto_migrate": auto_migrate,
+        "workers": workers,
+        "migrate_s": round(migrate_s, 3) if migrate_s is not None else None,
+        "first_response_s": {"best": round(min(samples), 3), "mean": round(sum(samples) / len(samples), 3)}
+    }
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--target-ms", type=float, default=5000.0, help="startup budget of the production profile")
+    parser.add_argument("--database-url", default="", help="defaults to a fresh SQLite file")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="task-startup-") as workdir:
+        url = args.database_url or f"sqlite:///{Path(workdir) / 'startup.db'}"
+        production = measure(url, args.workers, auto_migrate=False, runs=args.runs)
+        per_worker = measure(url, args.workers, auto_migrate=True, runs=args.runs)
+
+    met = production["first_response_s"]["mean"] * 1000 <= args.target_ms
+    print(json.dumps({"target_ms": args.target_ms, "target_met": met, "production": production, "auto_migrate": per_worker}, indent=2))
+    sys.exit(0 if met else 1)
+
+if __name__ == "__main__":
+    main()
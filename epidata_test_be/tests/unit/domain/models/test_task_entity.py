@@ -26,4 +26,12 @@ class TestTaskEntity:
         
         assert task.id == None
         assert task.title == "Test task"
-        assert task.completed is False
\ No newline at end of file
+        assert task.completed is False
+        
+    def test_task_is_slotted(self):
+        """Test tasks carry no per-instance __dict__"""
+        task = Task(id=1, title="Test task")
+        
+        assert not hasattr(task, "__dict__")
+        with pytest.raises(AttributeError):
+            task.unknown = True
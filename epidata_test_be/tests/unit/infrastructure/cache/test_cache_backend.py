@@ -0,0 +1,86 @@
+import pytest
+from unittest.mock import patch
+
+from app.infrastructure.cache.cache_backend import InMemoryCacheBackend, RedisCacheBackend, create_cache_backend
+
+class FakeRedis:
+    """Local stand-in implementing the subset of the redis-py API the backend uses"""
+    
+    def __init__(self):
+        self.data = {}
+        
+    def get(self, key):
+        return self.data.get(key)
+    
+    def set(self, key, value, px=None):
+        self.data[key] = value.encode("utf-8")
+        
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+            
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, b"0")) + 1).encode("utf-8")
+        return int(self.data[key])
+
+class TestInMemoryCacheBackend:
+    """Test cases for the in-process cache backend"""
+    
+    def test_set_get_delete(self):
+        """Test storing, reading and deleting values"""
+        cache = InMemoryCacheBackend(max_entries=10)
+        cache.set("a", "1", ttl_seconds=60)
+        
+        assert cache.get("a") == "1"
+        cache.delete("a", "missing")
+        assert cache.get("a") is None
+        
+    def test_entries_expire(self):
+        """Test values are dropped once their TTL elapses"""
+        cache = InMemoryCacheBackend(max_entries=10)
+        with patch("app.infrastructure.cache.cache_backend.time.monotonic", return_value=100.0):
+            cache.set("a", "1", ttl_seconds=5)
+        with patch("app.infrastructure.cache.cache_backend.time.monotonic", return_value=106.0):
+            assert cache.get("a") is None
+            
+    def test_least_recently_used_is_evicted(self):
+        """Test the least recently read entry is evicted when full"""
+        cache = InMemoryCacheBackend(max_entries=2)
+        cache.set("a", "1", ttl_seconds=60)
+        cache.set("b", "2", ttl_seconds=60)
+        cache.get("a")
+        cache.set("c", "3", ttl_seconds=60)
+        
+        assert cache.get("a") == "1"
+        assert cache.get("b") is None
+        assert cache.get("c") == "3"
+        
+    def test_counters_survive_eviction(self):
+        """Test counters are readable and never evicted"""
+        cache = InMemoryCacheBackend(max_entries=1)
+        assert cache.incr("version") == 1
+        cache.set("a", "1", ttl_seconds=60)
+        cache.set("b", "2", ttl_seconds=60)
+        
+        assert cache.incr("version") == 2
+        assert cache.get("version") == "2"
+
+class TestRedisCacheBackend:
+    """Test cases for the Redis-compatible backend against a local stand-in"""
+    
+    def test_round_trip_with_prefix(self):
+        """Test values are stored under the key prefix and decoded on read"""
+        client = FakeRedis()
+        cache = RedisCacheBackend(client, key_prefix="test:")
+        cache.set("a", "valor ñ", ttl_seconds=1)
+        
+        assert client.data == {"test:a": "valor ñ".encode("utf-8")}
+        assert cache.get("a") == "valor ñ"
+        assert cache.incr("version") == 1
+        cache.delete("a")
+        assert cache.get("a") is None
+        
+def test_create_unknown_backend():
+    """Test an unknown backend name is rejected"""
+    with pytest.raises(ValueError, match="Unknown cache backend"):
+        create_cache_backend("memcached", 10, "")
@@ -0,0 +1,73 @@
+from sqlalchemy import create_engine, inspect, text
+
+from app.infrastructure.db.migrate import run_migrations
+from app.infrastructure.db.pool_metrics import PoolMetrics
+
+def test_run_migrations_creates_schema(tmp_path):
+    """Test the migrate command creates every table and the search indexes"""
+    test_engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    
+    run_migrations(test_engine)
+    run_migrations(test_engine)
+    inspector = inspect(test_engine)
+    tables = set(inspector.get_table_names())
+    test_engine.dispose()
+    
+    assert {"tasks", "task_version_counter", "task_tombstones", "task_tombstone_watermark", "tasks_fts"} <= tables
+    assert inspector.has_index("tasks", "ix_tasks_title")
+    
+def test_run_migrations_adds_version_columns_to_existing_tasks(tmp_path):
+    """Test the migrate command upgrades a tasks table created before versions"""
+    test_engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    with test_engine.begin() as conn:
+        conn.execute(text("CREATE TABLE tasks (id INTEGER PRIMARY KEY, title VARCHAR(255) NOT NULL, completed BOOLEAN)"))
+        conn.execute(text("INSERT INTO tasks (title, completed) VALUES ('Old task', 0), ('Done task', 1)"))
+        
+    run_migrations(test_engine)
+    run_migrations(test_engine)
+    inspector = inspect(test_engine)
+    with test_engine.connect() as conn:
+        tasks = conn.execute(text("SELECT id, version, updated_at FROM tasks ORDER BY id")).all()
+        counter = conn.execute(text("SELECT value FROM task_version_counter")).scalar_one()
+    test_engine.dispose()
+    
+    assert inspector.has_index("tasks", "ix_tasks_version")
+    assert [(t.id, t.version) for t in tasks] == [(1, 1), (2, 2)]
+    assert all(not t.updated_at.startswith("1970") for t in tasks)
+    assert counter == 2
+    
+def test_run_migrations_stops_sqlite_reusing_task_ids(tmp_path):
+    """Test the migrate command rebuilds a tasks table created without AUTOINCREMENT"""
+    from sqlalchemy.orm import sessionmaker
+    from app.infrastructure.repositories.task_sqlalchemy_repo import TaskSQLAlchemyRepo
+    test_engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    with test_engine.begin() as conn:
+        conn.execute(text("CREATE TABLE tasks (id INTEGER PRIMARY KEY, title VARCHAR(255) NOT NULL, completed BOOLEAN)"))
+        conn.execute(text("INSERT INTO tasks (title, completed) VALUES ('Task 1', 0), ('Task 2', 1), ('Task 3', 0)"))
+        
+    run_migrations(test_engine)
+    run_migrations(test_engine)
+    with sessionmaker(bind=test_engine)() as db:
+        repo = TaskSQLAlchemyRepo(db)
+        repo.delete(3)
+        created = repo.create("Task 4")
+        found = repo.search("task", 10).items
+        stats = repo.stats()
+        db.commit()
+    with test_engine.connect() as conn:
+        schema = conn.execute(text("SELECT sql FROM sqlite_master WHERE name = 'tasks'")).scalar_one()
+    inspector = inspect(test_engine)
+    test_engine.dispose()
+    
+    assert "AUTOINCREMENT" in schema
+    assert created.id == 4
+    assert [t.id for t in found] == [1, 2, 4]
+    assert (stats.total, stats.completed) == (3, 1)
+    assert inspector.has_index("tasks", "ix_tasks_version")
+    
+def test_pool_metrics_before_engine_exists():
+    """Test metrics can be read before the lazy engine is created"""
+    snapshot = PoolMetrics().snapshot()
+    
+    assert snapshot["pool_class"] is None
+    assert snapshot["checkouts"] == 0
@@ -0,0 +1,35 @@
+import logging
+from sqlalchemy import create_engine, text
+
+from app.infrastructure.db.query_metrics import QueryMetrics
+from app.infrastructure.metrics.app_metrics import db_slow_queries
+from app.infrastructure.metrics.request_timings import start_request
+
+def test_query_metrics_record_into_request_timings():
+    """Test statements are counted and timed on the current request"""
+    test_engine = create_engine("sqlite:///:memory:")
+    QueryMetrics(test_engine, slow_query_enabled=False, slow_query_threshold_ms=100)
+    timings = start_request()
+    
+    with test_engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        conn.execute(text("SELECT 2"))
+    test_engine.dispose()
+    
+    assert timings.sql_count == 2
+    assert timings.sql_seconds > 0
+    
+def test_slow_query_log(caplog):
+    """Test statements over the threshold are logged and counted"""
+    test_engine = create_engine("sqlite:///:memory:")
+    QueryMetrics(test_engine, slow_query_enabled=True, slow_query_threshold_ms=0)
+    before = db_slow_queries.value()
+    
+    with caplog.at_level(logging.WARNING, logger="app.slow_query"):
+        with test_engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    test_engine.dispose()
+    
+    assert db_slow_queries.value() == before + 1
+    assert "Slow query" in caplog.text
+    assert "SELECT 1" in caplog.text
@@ -0,0 +1,59 @@
+from sqlalchemy import create_engine, text
+from unittest.mock import patch
+
+from app.infrastructure.db.models import session
+from app.infrastructure.db.replica_router import ReplicaRouter
+
+def make_engines(tmp_path, *names):
+    return [create_engine(f"sqlite:///{tmp_path / name}") for name in names]
+
+def test_candidates_rotate_over_healthy_replicas(tmp_path):
+    """Test each call starts at the next replica and skips the ones marked down"""
+    first, second, third = make_engines(tmp_path, "a.db", "b.db", "c.db")
+    router = ReplicaRouter([first, second, third])
+    
+    rotations = [router.candidates() for _ in range(3)]
+    router.mark_down(second, RuntimeError("gone"))
+    
+    assert rotations == [[first, second, third], [second, third, first], [third, first, second]]
+    assert router.candidates() == [first, third]
+    assert router.snapshot()[1] == {"url": f"sqlite:///{tmp_path / 'b.db'}", "healthy": False, "reads": 0, "failures": 1}
+    
+def test_health_check_restores_and_removes_replicas(tmp_path):
+    """Test a reachable replica comes back and an unreachable one goes out"""
+    reachable, = make_engines(tmp_path, "a.db")
+    unreachable = create_engine(f"sqlite:///{tmp_path / 'missing' / 'b.db'}")
+    router = ReplicaRouter([reachable, unreachable])
+    router.mark_down(reachable, RuntimeError("blip"))
+    
+    router.check_health()
+    
+    assert router.candidates() == [reachable]
+    
+def test_read_session_falls_back_to_primary(tmp_path):
+    """Test reads go to a replica, past a dead one, and to the primary when pinned"""
+    primary, replica = make_engines(tmp_path, "primary.db", "replica.db")
+    dead = create_engine(f"sqlite:///{tmp_path / 'missing' / 'dead.db'}")
+    router = ReplicaRouter([dead, replica])
+    
+    def read_from(pinned):
+        sessions = session.get_read_db_session(pinned)
+        db = next(sessions)
+        bind = db.get_bind()
+        db.execute(text("SELECT 1"))
+        sessions.close()
+        return bind
+    
+    with (
+        patch.object(session, "engine", primary),
+        patch.object(session, "SessionLocal", session.LazySessionMaker(bind=primary)),
+        patch.object(session, "replica_router", router)
+    ):
+        assert read_from(False) is replica
+        assert read_from(False) is replica
+        assert read_from(True) is primary
+        router.mark_down(replica, RuntimeError("gone"))
+        assert read_from(False) is primary
+    
+    assert router.snapshot()[0]["failures"] == 1
+    assert router.snapshot()[1]["reads"] == 2
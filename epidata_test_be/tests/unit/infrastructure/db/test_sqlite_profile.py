@@ -0,0 +1,102 @@
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+from unittest.mock import patch
+
+from app.config.settings import settings
+from app.infrastructure.db.models import session
+from app.infrastructure.db.sqlite_profile import SQLiteProfile, is_sqlite_file
+
+def make_engine(tmp_path, profile, writer):
+    engine = create_engine(f"sqlite:///{tmp_path / 'tasks.db'}")
+    profile.attach(engine, writer=writer)
+    return engine
+    
+def test_pragmas_applied_on_connect(tmp_path):
+    """Test every connection gets WAL and the configured pragmas"""
+    engine = make_engine(tmp_path, SQLiteProfile("normal", 1000, 2048, 16), writer=False)
+    
+    with engine.connect() as conn:
+        pragmas = [conn.exec_driver_sql(f"PRAGMA {name}").scalar() for name in ("journal_mode", "synchronous", "busy_timeout", "cache_size", "mmap_size")]
+    engine.dispose()
+    
+    assert pragmas == ["wal", 1, 1000, -2048, 16 * 1024 * 1024]
+    
+def test_unknown_synchronous_mode_rejected():
+    """Test a misspelt synchronous mode fails at startup"""
+    with pytest.raises(ValueError, match="Unknown SQLite synchronous mode: FAST"):
+        SQLiteProfile("fast", 1000, 2048, 16)
+        
+def test_writers_queue_while_readers_proceed(tmp_path):
+    """Test a writer holds the write lock from BEGIN while readers still read"""
+    profile = SQLiteProfile("NORMAL", 50, 2048, 16)
+    writer, other_writer, reader = (make_engine(tmp_path, profile, writer=w) for w in (True, True, False))
+    with writer.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+        
+    with writer.begin() as conn:
+        conn.execute(text("INSERT INTO items VALUES (1)"))
+        with reader.connect() as read_conn:
+            visible = read_conn.execute(text("SELECT count(*) FROM items")).scalar()
+        with pytest.raises(OperationalError, match="locked"):
+            with other_writer.begin():
+                pass
+    for engine in (writer, other_writer, reader):
+        engine.dispose()
+        
+    assert visible == 0
+    
+def test_savepoint_stays_inside_transaction(tmp_path):
+    """Test releasing a savepoint does not commit the enclosing transaction"""
+    engine = make_engine(tmp_path, SQLiteProfile("NORMAL", 1000, 2048, 16), writer=True)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+        
+    with sessionmaker(bind=engine)() as db:
+        with db.begin_nested():
+            db.execute(text("INSERT INTO items VALUES (1)"))
+        db.rollback()
+    with engine.connect() as conn:
+        count = conn.execute(text("SELECT count(*) FROM items")).scalar()
+    engine.dispose()
+    
+    assert count == 0
+    
+def test_primary_engines(tmp_path):
+    """Test the profile splits a file database into a one-connection writer and a reader pool"""
+    url = f"sqlite:///{tmp_path / 'tasks.db'}"
+    
+    plain, no_reader = session.create_primary_engines(url)
+    with patch.object(settings, "SQLITE_PROFILE_ENABLED", True):
+        writer, reader = session.create_primary_engines(url)
+        memory, memory_reader = session.create_primary_engines("sqlite:///:memory:")
+        
+    assert no_reader is None and memory_reader is None
+    assert writer.pool.size() == 1
+    assert reader.pool.size() == settings.DB_POOL_SIZE
+    assert not is_sqlite_file("mysql+pymysql://root@localhost/tasks")
+    for engine in (plain, writer, reader, memory):
+        engine.dispose()
+    
+def test_async_primary_engines_begin_immediate_for_writes(tmp_path):
+    """Test async writes take the write lock at BEGIN, so a read-then-write never upgrades"""
+    import asyncio
+    from app.infrastructure.db.models.async_session import create_async_primary_engines
+    url = f"sqlite+aiosqlite:///{tmp_path / 'tasks.db'}"
+    
+    async def run():
+        with patch.object(settings, "SQLITE_PROFILE_ENABLED", True):
+            writer, reader = create_async_primary_engines(url)
+        statements = []
+        event.listen(writer.sync_engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+        async with writer.begin() as conn:
+            await conn.execute(text("SELECT 1"))
+        for engine in (writer, reader):
+            await engine.dispose()
+        return writer.sync_engine.pool.size(), statements
+    
+    size, statements = asyncio.run(run())
+    
+    assert size == 1
+    assert statements[:2] == ["BEGIN IMMEDIATE", "SELECT 1"]
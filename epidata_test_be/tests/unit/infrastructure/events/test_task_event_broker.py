@@ -0,0 +1,139 @@
+import asyncio
+import threading
+import orjson
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.domain.models.task_entity import Task
+from app.domain.models.task_event import TaskEvent, TASK_CREATED, TASK_DELETED
+from app.infrastructure.events.event_backend import LocalEventBackend
+from app.infrastructure.events.task_event_broker import TaskEventBroker, DROP_OLDEST, DISCONNECT
+from app.infrastructure.events.task_events import SessionBoundPublisher
+
+def make_broker(queue_size=10, drop_policy=DROP_OLDEST):
+    broker = TaskEventBroker(LocalEventBackend(), queue_size, drop_policy)
+    broker.start()
+    return broker
+
+class TestTaskEventBroker:
+    """Test cases for the task event fan-out"""
+    
+    def test_publish_reaches_every_subscriber(self):
+        """Test that a published event is delivered to all subscribers"""
+        
+        async def scenario():
+            broker = make_broker()
+            first, second = broker.subscribe(), broker.subscribe()
+            broker.publish(TaskEvent(type=TASK_CREATED, task_id=1, task=Task(id=1, title="Task")))
+            return await first.get(1), await second.get(1), broker.snapshot()
+        
+        first, second, snapshot = asyncio.run(scenario())
+        
+        assert first == second
+        assert orjson.loads(first) == {"type": "created", "task_id": 1, "task": {"id": 1, "title": "Task", "completed": False, "version": None, "updated_at": None}}
+        assert snapshot["subscribers"] == 2
+        assert snapshot["published"] == 1
+        
+    def test_publish_from_worker_thread(self):
+        """Test that events published off the loop (sync routes run in a threadpool) are delivered"""
+        
+        async def scenario():
+            broker = make_broker()
+            subscription = broker.subscribe()
+            thread = threading.Thread(target=broker.publish, args=(TaskEvent(type=TASK_DELETED, task_id=3),))
+            thread.start()
+            thread.join()
+            return await subscription.get(1)
+        
+        assert orjson.loads(asyncio.run(scenario()))["task_id"] == 3
+        
+    def test_get_times_out_without_events(self):
+        """Test that get returns None once the heartbeat timeout expires"""
+        
+        async def scenario():
+            return await make_broker().subscribe().get(0.01)
+        
+        assert asyncio.run(scenario()) is None
+        
+    def test_drop_oldest_keeps_latest_events(self):
+        """Test that a full queue drops its oldest event under drop_oldest"""
+        
+        async def scenario():
+            broker = make_broker(queue_size=2)
+            subscription = broker.subscribe()
+            for task_id in range(3):
+                broker.publish(TaskEvent(type=TASK_DELETED, task_id=task_id))
+            await asyncio.sleep(0)
+            received = [await subscription.get(1), await subscription.get(1)]
+            return received, subscription.dropped
+        
+        received, dropped = asyncio.run(scenario())
+        
+        assert [orjson.loads(payload)["task_id"] for payload in received] == [1, 2]
+        assert dropped == 1
+        
+    def test_disconnect_closes_slow_subscriber(self):
+        """Test that a full queue closes the subscription under disconnect"""
+        
+        async def scenario():
+            broker = make_broker(queue_size=1, drop_policy=DISCONNECT)
+            subscription = broker.subscribe()
+            for task_id in range(2):
+                broker.publish(TaskEvent(type=TASK_DELETED, task_id=task_id))
+            await asyncio.sleep(0)
+            return subscription.closed, await subscription.get(1)
+        
+        assert asyncio.run(scenario()) == (True, None)
+        
+    def test_unsubscribe_stops_delivery(self):
+        """Test that unsubscribed clients no longer receive events"""
+        
+        async def scenario():
+            broker = make_broker()
+            subscription = broker.subscribe()
+            broker.unsubscribe(subscription)
+            broker.publish(TaskEvent(type=TASK_DELETED, task_id=1))
+            return broker.snapshot()
+        
+        snapshot = asyncio.run(scenario())
+        
+        assert snapshot["subscribers"] == 0
+        assert snapshot["delivered"] == 0
+
+class RecordingPublisher:
+    def __init__(self):
+        self.events = []
+        
+    def publish(self, event):
+        self.events.append(event)
+
+class TestSessionBoundPublisher:
+    """Test cases for publishing events only after the transaction commits"""
+    
+    def setup_method(self):
+        self.session = sessionmaker(bind=create_engine("sqlite:///:memory:"))()
+        self.target = RecordingPublisher()
+        self.publisher = SessionBoundPublisher(self.target, self.session)
+        
+    def teardown_method(self):
+        self.session.close()
+        
+    def test_events_published_on_commit(self):
+        """Test that pending events are forwarded once the session commits"""
+        
+        self.publisher.publish(TaskEvent(type=TASK_DELETED, task_id=1))
+        assert self.target.events == []
+        
+        self.session.commit()
+        
+        assert [event.task_id for event in self.target.events] == [1]
+        
+    def test_events_discarded_on_rollback(self):
+        """Test that a rolled back write never reaches subscribers"""
+        
+        self.session.execute(text("SELECT 1"))
+        self.publisher.publish(TaskEvent(type=TASK_DELETED, task_id=1))
+        self.session.rollback()
+        self.session.commit()
+        
+        assert self.target.events == []
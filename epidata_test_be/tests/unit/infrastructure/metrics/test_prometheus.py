@@ -0,0 +1,57 @@
+from app.infrastructure.metrics.prometheus import Counter, Histogram, render_gauges
+from app.infrastructure.metrics.request_timings import start_request, timed, count_hydrated
+
+class TestPrometheus:
+    """Test cases for the Prometheus text exposition helpers"""
+    
+    def test_histogram_buckets_are_cumulative(self):
+        """Test observations land in cumulative buckets with sum and count"""
+        histogram = Histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+        histogram.observe(0.05, route="/tasks")
+        histogram.observe(0.5, route="/tasks")
+        histogram.observe(5.0, route="/tasks")
+        
+        lines = histogram.render()
+        
+        assert 'latency_seconds_bucket{route="/tasks",le="0.1"} 1' in lines
+        assert 'latency_seconds_bucket{route="/tasks",le="1.0"} 2' in lines
+        assert 'latency_seconds_bucket{route="/tasks",le="+Inf"} 3' in lines
+        assert 'latency_seconds_count{route="/tasks"} 3' in lines
+        assert 'latency_seconds_sum{route="/tasks"} 5.55' in lines
+        assert "# TYPE latency_seconds histogram" in lines
+        
+    def test_counter_labels(self):
+        """Test counters keep one series per label set"""
+        counter = Counter("rows_total", "Rows")
+        counter.inc(2, route="/a")
+        counter.inc(3, route="/a")
+        counter.inc(route="/b")
+        
+        assert 'rows_total{route="/a"} 5' in counter.render()
+        assert counter.value(route="/b") == 1
+        
+    def test_gauges_skip_non_numeric_values(self):
+        """Test snapshot dicts render numeric entries only"""
+        lines = render_gauges("db_pool", "Pool", {"pool_class": "QueuePool", "size": 5, "wait_avg_ms": 0.5})
+        
+        assert 'db_pool{stat="size"} 5' in lines
+        assert 'db_pool{stat="wait_avg_ms"} 0.5' in lines
+        assert not any("pool_class" in line for line in lines)
+
+class TestRequestTimings:
+    """Test cases for per-request phase timings"""
+    
+    def test_server_timing_header(self):
+        """Test phases, SQL and hydrated rows are reported"""
+        timings = start_request()
+        with timed("serialize"):
+            pass
+        timings.add_sql(0.002)
+        count_hydrated(3)
+        
+        header = timings.server_timing()
+        
+        assert header.startswith("app;dur=")
+        assert "serialize;dur=" in header
+        assert 'sql;dur=2.000;desc="1 statements"' in header
+        assert 'hydrate;desc="3 rows"' in header
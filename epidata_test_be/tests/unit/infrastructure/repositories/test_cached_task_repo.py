@@ -0,0 +1,116 @@
+import pytest
+from unittest.mock import Mock
+
+from app.domain.models.task_entity import Task
+from app.domain.models.task_page import TaskPage
+from app.domain.models.task_list_fingerprint import TaskListFingerprint
+from app.domain.models.task_stats import TaskStats
+from app.domain.repositories.task_repository import TaskRepository
+from app.infrastructure.cache.cache_backend import InMemoryCacheBackend
+from app.infrastructure.repositories.cached_task_repo import CachedTaskRepository
+
+@pytest.fixture
+def mock_repository():
+    return Mock(spec=TaskRepository)
+
+@pytest.fixture
+def cached_repo(mock_repository):
+    return CachedTaskRepository(mock_repository, InMemoryCacheBackend(max_entries=100), ttl_seconds=60)
+
+class TestCachedTaskRepository:
+    """Test cases for the read-through task cache"""
+    
+    def test_get_by_id_is_cached(self, cached_repo, mock_repository):
+        """Test a second read by id is served from the cache"""
+        mock_repository.get_by_id.return_value = Task(id=1, title="Task 1", completed=False)
+        
+        first = cached_repo.get_by_id(1)
+        second = cached_repo.get_by_id(1)
+        
+        assert first == second == Task(id=1, title="Task 1", completed=False)
+        mock_repository.get_by_id.assert_called_once_with(1)
+        assert cached_repo.cache_stats.snapshot() == {"task_misses": 1, "task_hits": 1}
+        
+    def test_not_found_is_not_cached(self, cached_repo, mock_repository):
+        """Test not found errors always reach the repository"""
+        mock_repository.get_by_id.side_effect = ValueError("Task with ID 9 not found")
+        
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                cached_repo.get_by_id(9)
+        assert mock_repository.get_by_id.call_count == 2
+        
+    def test_list_page_cached_until_write(self, cached_repo, mock_repository):
+        """Test list pages are cached per parameters and dropped by any write"""
+        page = TaskPage(items=[Task(id=1, title="Task 1", completed=False)], next_cursor=1)
+        mock_repository.list_page.return_value = page
+        
+        assert cached_repo.list_page(1) == page
+        assert cached_repo.list_page(1) == page
+        cached_repo.list_page(1, completed=True)
+        assert mock_repository.list_page.call_count == 2
+        
+        cached_repo.create("Task 2")
+        cached_repo.list_page(1)
+        assert mock_repository.list_page.call_count == 3
+        
+    def test_stats_reads_through(self, cached_repo, mock_repository):
+        """Test stats are always read from the repository, next to the cache counters"""
+        mock_repository.stats.return_value = TaskStats(total=2, completed=1, pending=1)
+        
+        assert cached_repo.stats() == TaskStats(total=2, completed=1, pending=1)
+        assert cached_repo.stats() == TaskStats(total=2, completed=1, pending=1)
+        assert mock_repository.stats.call_count == 2
+        
+    def test_list_page_keyed_on_fingerprint(self, cached_repo, mock_repository):
+        """Test a write made elsewhere changes the fingerprint and skips the cached page"""
+        mock_repository.list_fingerprint.return_value = TaskListFingerprint(max_version=1, count=1)
+        mock_repository.list_page.return_value = TaskPage(items=[Task(id=1, title="Task 1", completed=False)], next_cursor=1)
+        
+        assert cached_repo.list_fingerprint().max_version == 1
+        cached_repo.list_page(1)
+        cached_repo.list_page(1)
+        mock_repository.list_fingerprint.return_value = TaskListFingerprint(max_version=2, count=2)
+        cached_repo.list_fingerprint()
+        cached_repo.list_page(1)
+        
+        assert mock_repository.list_page.call_count == 2
+        assert mock_repository.list_fingerprint.call_count == 2
+        
+    @pytest.mark.parametrize("write", [
+        lambda repo: repo.update(1, Task(id=None, title="Updated", completed=True)),
+        lambda repo: repo.mark_complete(1),
+        lambda repo: repo.delete(1)
+    ])
+    def test_writes_invalidate_task(self, cached_repo, mock_repository, write):
+        """Test update, mark_complete and delete drop the cached task"""
+        mock_repository.get_by_id.return_value = Task(id=1, title="Task 1", completed=False)
+        cached_repo.get_by_id(1)
+        
+        write(cached_repo)
+        cached_repo.get_by_id(1)
+        
+        assert mock_repository.get_by_id.call_count == 2
+        
+    def test_invalidation_repeated_after_commit(self, mock_repository):
+        """Test the invalidation is handed to the after_commit hook"""
+        hooks = []
+        repo = CachedTaskRepository(mock_repository, InMemoryCacheBackend(max_entries=10), 60, after_commit=hooks.append)
+        mock_repository.get_by_id.return_value = Task(id=1, title="Stale", completed=False)
+        
+        repo.mark_complete(1)
+        repo.get_by_id(1)
+        hooks[0]()
+        repo.get_by_id(1)
+        
+        assert mock_repository.get_by_id.call_count == 2
+        
+    def test_cached_task_keeps_version_and_updated_at(self, cached_repo, mock_repository):
+        """Test cached tasks round-trip version and updated_at"""
+        from datetime import datetime, timezone
+        task = Task(id=1, title="Task 1", completed=False, version=4, updated_at=datetime(2025, 1, 2, tzinfo=timezone.utc))
+        mock_repository.get_by_id.return_value = task
+        
+        cached_repo.get_by_id(1)
+        
+        assert cached_repo.get_by_id(1) == task
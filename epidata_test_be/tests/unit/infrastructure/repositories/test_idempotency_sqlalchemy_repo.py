@@ -0,0 +1,75 @@
+import pytest
+from datetime import timedelta
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import sessionmaker
+
+from app.infrastructure.db.models.base import Base
+from app.infrastructure.db.models.idempotency_key_model import IdempotencyKeyModel
+from app.infrastructure.db.models.task_model import utcnow
+from app.infrastructure.repositories.idempotency_sqlalchemy_repo import IdempotencySQLAlchemyRepo
+
+@pytest.fixture
+def session_factory(tmp_path):
+    test_engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    Base.metadata.create_all(bind=test_engine)
+    yield sessionmaker(bind=test_engine)
+    test_engine.dispose()
+    
+def expire_all(session_factory):
+    with session_factory() as db:
+        db.execute(update(IdempotencyKeyModel).values(expires_at=utcnow() - timedelta(seconds=1)))
+        db.commit()
+        
+def test_reserve_complete_find(session_factory):
+    """Test a reserved key stores and returns its response"""
+    with session_factory() as db:
+        repo = IdempotencySQLAlchemyRepo(db)
+        assert repo.find("POST /tasks", "key-1") is None
+        assert repo.reserve("POST /tasks", "key-1", "hash", 60)
+        repo.complete("POST /tasks", "key-1", 200, b'{"ok":true}')
+        db.commit()
+        
+    with session_factory() as db:
+        record = IdempotencySQLAlchemyRepo(db).find("POST /tasks", "key-1")
+        
+    assert record.request_hash == "hash"
+    assert record.status_code == 200
+    assert record.body == b'{"ok":true}'
+    
+def test_duplicate_reserve_fails(session_factory):
+    """Test the unique constraint rejects a second reservation of the same key"""
+    with session_factory() as db:
+        IdempotencySQLAlchemyRepo(db).reserve("POST /tasks", "key-1", "hash", 60)
+        db.commit()
+        
+    with session_factory() as db:
+        repo = IdempotencySQLAlchemyRepo(db)
+        assert not repo.reserve("POST /tasks", "key-1", "hash", 60)
+        assert repo.reserve("POST /tasks/bulk", "key-1", "hash", 60)
+        
+def test_expired_key_is_reusable(session_factory):
+    """Test expired keys are ignored and can be reserved again"""
+    with session_factory() as db:
+        IdempotencySQLAlchemyRepo(db).reserve("POST /tasks", "key-1", "hash", 60)
+        db.commit()
+    expire_all(session_factory)
+    
+    with session_factory() as db:
+        repo = IdempotencySQLAlchemyRepo(db)
+        assert repo.find("POST /tasks", "key-1") is None
+        assert repo.reserve("POST /tasks", "key-1", "other", 60)
+        
+def test_purge_expired(session_factory):
+    """Test expired keys are deleted in batches"""
+    with session_factory() as db:
+        repo = IdempotencySQLAlchemyRepo(db)
+        for i in range(3):
+            repo.reserve("POST /tasks", f"key-{i}", "hash", 60)
+        db.commit()
+    expire_all(session_factory)
+    
+    with session_factory() as db:
+        repo = IdempotencySQLAlchemyRepo(db)
+        assert repo.purge_expired(2) == 2
+        assert repo.purge_expired(2) == 1
+        db.commit()
@@ -1,10 +1,12 @@
 import pytest
+from datetime import timedelta
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from unittest.mock import patch
 
 from app.infrastructure.db.models.base import Base
 from app.domain.models.task_entity import Task
+from app.infrastructure.db.models.task_model import utcnow
 from app.infrastructure.repositories.task_sqlalchemy_repo import TaskSQLAlchemyRepo
 
 @pytest.fixture(scope="function")
@@ -107,4 +109,447 @@ def test_delete_task_success(task_repo):
 def test_delete_task_not_found(task_repo):
     """Test deleting a task that doesn't exist"""
     with pytest.raises(ValueError, match="Task with ID 999 not found"):
-        task_repo.mark_complete(999)
\ No newline at end of file
+        task_repo.mark_complete(999)
+
+
+def test_list_page_empty(task_repo):
+    """Test listing a page when database is empty"""
+    page = task_repo.list_page(limit=10)
+    
+    assert page.items == []
+    assert page.next_cursor is None
+    
+def test_list_page_follows_cursor(task_repo):
+    """Test walking every page through next_cursor"""
+    created = [task_repo.create(f"Task {i}") for i in range(5)]
+    
+    first = task_repo.list_page(limit=2)
+    second = task_repo.list_page(limit=2, after=first.next_cursor)
+    third = task_repo.list_page(limit=2, after=second.next_cursor)
+    
+    assert [t.id for t in first.items] == [created[0].id, created[1].id]
+    assert first.next_cursor == created[1].id
+    assert [t.id for t in second.items] == [created[2].id, created[3].id]
+    assert [t.id for t in third.items] == [created[4].id]
+    assert third.next_cursor is None
+    
+def test_list_page_filters(task_repo):
+    """Test filtering a page by completed and title prefix"""
+    task_repo.create("Buy milk")
+    bread = task_repo.create("Buy bread")
+    task_repo.create("Walk the dog")
+    task_repo.create("100%_done")
+    task_repo.mark_complete(bread.id)
+    
+    completed = task_repo.list_page(limit=10, completed=True)
+    buy_pending = task_repo.list_page(limit=10, completed=False, title_prefix="Buy")
+    escaped = task_repo.list_page(limit=10, title_prefix="100%_")
+    
+    assert [t.id for t in completed.items] == [bread.id]
+    assert [t.title for t in buy_pending.items] == ["Buy milk"]
+    assert [t.title for t in escaped.items] == ["100%_done"]
+    
+def test_iter_all_streams_every_task(task_repo):
+    """Test streaming all tasks in id order across several batches"""
+    created = [task_repo.create(f"Task {i}") for i in range(5)]
+    
+    streamed = list(task_repo.iter_all(batch_size=2))
+    
+    assert [t.id for t in streamed] == [t.id for t in created]
+    assert [t.title for t in streamed] == [f"Task {i}" for i in range(5)]
+    
+def test_injected_session_defers_commit(db_session, task_repo):
+    """Test a request-scoped session is flushed by the repo and committed by its owner"""
+    with db_session() as db:
+        repo = type(task_repo)(db)
+        created = repo.create("Uncommitted task")
+        assert created.id is not None
+        assert repo.get_by_id(created.id).title == "Uncommitted task"
+        db.rollback()
+        
+    assert task_repo.get_all() == []
+    
+    with db_session() as db:
+        repo = type(task_repo)(db)
+        repo.create("Committed task")
+        db.commit()
+        
+    assert [t.title for t in task_repo.get_all()] == ["Committed task"]
+    
+def test_create_many_success(task_repo):
+    """Test creating several tasks in one call keeps the input order"""
+    results = task_repo.create_many(["Task 1", "Task 2", "Task 3"])
+    
+    assert [r.index for r in results] == [0, 1, 2]
+    assert all(r.ok for r in results)
+    assert [r.task.title for r in results] == ["Task 1", "Task 2", "Task 3"]
+    assert [t.id for t in task_repo.get_all()] == [r.id for r in results]
+    
+def test_update_many_reports_missing_tasks(task_repo):
+    """Test updating several tasks reports the ones that don't exist"""
+    task = task_repo.create("Task to update")
+    
+    results = task_repo.update_many([
+        Task(id=task.id, title="Task updated", completed=True),
+        Task(id=999, title="Missing", completed=False)
+    ])
+    
+    assert results[0].ok
+    assert (results[0].task.id, results[0].task.title, results[0].task.completed) == (task.id, "Task updated", True)
+    assert results[0].task.version > task.version
+    assert not results[1].ok
+    assert results[1].error == "Task with ID 999 not found"
+    assert task_repo.get_by_id(task.id).title == "Task updated"
+    
+def test_delete_many_reports_missing_tasks(task_repo):
+    """Test deleting several tasks reports the ones that don't exist"""
+    kept = task_repo.create("Task kept")
+    deleted = task_repo.create("Task deleted")
+    
+    results = task_repo.delete_many([deleted.id, 999])
+    
+    assert [(r.id, r.ok) for r in results] == [(deleted.id, True), (999, False)]
+    assert [t.id for t in task_repo.get_all()] == [kept.id]
+    
+def test_writes_issue_single_statement(db_session, task_repo):
+    """Test update, mark_complete and delete don't load the row before writing"""
+    from sqlalchemy import event
+    task = task_repo.create("Task")
+    engine = db_session.kw["bind"]
+    statements = []
+    
+    def record(conn, cursor, statement, *args):
+        statements.append(" ".join(statement.split()[:2]).upper())
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        task_repo.update(task.id, Task(id=None, title="Task updated", completed=False))
+        task_repo.mark_complete(task.id)
+        task_repo.delete(task.id)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    
+    # Each write is one statement on tasks plus the version counter bump (and for the
+    # delete, its archive row and tombstone)
+    assert statements == [
+        "UPDATE TASK_VERSION_COUNTER", "UPDATE TASKS",
+        "UPDATE TASK_VERSION_COUNTER", "UPDATE TASKS",
+        "UPDATE TASK_VERSION_COUNTER", "DELETE FROM", "DELETE FROM", "INSERT INTO"
+    ]
+    
+def test_delete_task_missing_id(task_repo):
+    """Test deleting a task id that doesn't exist raises not found"""
+    with pytest.raises(ValueError, match="Task with ID 999 not found"):
+        task_repo.delete(999)
+
+def test_writes_bump_version_and_updated_at(task_repo):
+    """Test every write hands out a higher version and stamps updated_at"""
+    task = task_repo.create("Task")
+    updated = task_repo.update(task.id, Task(id=None, title="Task updated", completed=False))
+    completed = task_repo.mark_complete(task.id)
+    
+    assert task.version < updated.version < completed.version
+    assert task.updated_at <= updated.updated_at <= completed.updated_at
+    assert task.updated_at.tzinfo is not None
+    assert task_repo.get_by_id(task.id) == completed
+    
+def test_list_fingerprint(task_repo):
+    """Test the list fingerprint tracks max version, count and deletes"""
+    assert task_repo.list_fingerprint().count == 0
+    first = task_repo.create("Task 1")
+    second = task_repo.create("Task 2")
+    
+    fingerprint = task_repo.list_fingerprint()
+    task_repo.delete(first.id)
+    after_delete = task_repo.list_fingerprint()
+    
+    assert (fingerprint.max_version, fingerprint.count) == (second.version, 2)
+    assert (after_delete.max_version, after_delete.count) == (second.version, 1)
+    assert after_delete.last_modified >= fingerprint.last_modified
+
+def test_changes_since_returns_updates_and_tombstones(task_repo):
+    """Test changes since a version include new, updated and deleted tasks"""
+    first = task_repo.create("Task 1")
+    second = task_repo.create("Task 2")
+    since = task_repo.list_fingerprint().max_version
+    
+    third = task_repo.create("Task 3")
+    task_repo.mark_complete(first.id)
+    task_repo.delete(second.id)
+    changes = task_repo.changes_since(since, limit=100)
+    
+    assert [t.id for t in changes.tasks] == [third.id, first.id]
+    assert [(d.id, d.version) for d in changes.deleted] == [(second.id, changes.next_since)]
+    assert not changes.has_more
+    assert task_repo.changes_since(changes.next_since, limit=100).tasks == []
+    
+def test_changes_since_nothing_changed(task_repo):
+    """Test an up to date client gets an empty change set and keeps its version"""
+    task_repo.create("Task 1")
+    
+    changes = task_repo.changes_since(1, limit=10)
+    
+    assert (changes.tasks, changes.deleted, changes.next_since, changes.has_more) == ([], [], 1, False)
+    
+def test_changes_since_pages_on_version_boundaries(task_repo):
+    """Test paging never splits a bulk write that shares a single version"""
+    task_repo.create("Task 1")
+    task_repo.create_many(["Bulk 1", "Bulk 2", "Bulk 3"])
+    task_repo.create("Task 5")
+    
+    first = task_repo.changes_since(0, limit=2)
+    second = task_repo.changes_since(first.next_since, limit=2)
+    third = task_repo.changes_since(second.next_since, limit=2)
+    
+    assert [t.title for t in first.tasks] == ["Task 1"]
+    assert first.has_more
+    assert [t.title for t in second.tasks] == ["Bulk 1", "Bulk 2", "Bulk 3"]
+    assert [t.title for t in third.tasks] == ["Task 5"]
+    assert not third.has_more
+    
+def test_pruned_tombstones_force_a_full_resync(task_repo):
+    """Test syncs resuming from below the pruned watermark are told to reload the list"""
+    from app.infrastructure.repositories.task_sqlalchemy_repo import prune_task_tombstones
+    tasks = [task_repo.create(f"Task {i}") for i in range(3)]
+    task_repo.delete(tasks[0].id)
+    before_prune = task_repo.changes_since(0, 100).next_since
+    
+    assert prune_task_tombstones(1, 10) == 0
+    assert prune_task_tombstones(-1, 1) == 1
+    task_repo.delete(tasks[1].id)
+    stale = task_repo.changes_since(tasks[2].version, 100)
+    current = task_repo.changes_since(before_prune, 100)
+    
+    assert stale.full_resync is True
+    assert (stale.tasks, stale.deleted) == ([], [])
+    assert stale.next_since == current.next_since
+    assert current.full_resync is False
+    assert [d.id for d in current.deleted] == [tasks[1].id]
+    
+def test_delete_many_writes_tombstones(task_repo):
+    """Test bulk deletes are visible to incremental syncs"""
+    tasks = task_repo.create_many(["Task 1", "Task 2"])
+    since = task_repo.list_fingerprint().max_version
+    
+    task_repo.delete_many([r.id for r in tasks] + [999])
+    changes = task_repo.changes_since(since, limit=10)
+    
+    assert sorted(d.id for d in changes.deleted) == sorted(r.id for r in tasks)
+
+def test_search_matches_word_prefixes(task_repo):
+    """Test search finds tasks whose title words start with every term"""
+    groceries = task_repo.create("Buy groceries")
+    task_repo.create("Clean the garage")
+    report = task_repo.create("Write quarterly report")
+    
+    assert [t.id for t in task_repo.search("groc", 10).items] == [groceries.id]
+    assert [t.id for t in task_repo.search("QUARTER rep", 10).items] == [report.id]
+    assert task_repo.search("buy garage", 10).items == []
+    
+def test_search_ranks_and_paginates(task_repo):
+    """Test better matches come first and pages chain through next_cursor"""
+    task_repo.create("Report")
+    task_repo.create("Report the report about a report")
+    for i in range(3):
+        task_repo.create(f"Report {i} with a much longer title that dilutes the match")
+    
+    first = task_repo.search("report", 2)
+    second = task_repo.search("report", 2, first.next_cursor)
+    third = task_repo.search("report", 2, second.next_cursor)
+    
+    assert first.items[0].title == "Report the report about a report"
+    assert first.next_cursor == 2
+    assert len({t.id for t in first.items + second.items + third.items}) == 5
+    assert third.next_cursor is None
+    
+def test_search_follows_updates_and_deletes(task_repo):
+    """Test the full-text index tracks title changes and deletes"""
+    task = task_repo.create("Draft proposal")
+    other = task_repo.create("Draft budget")
+    
+    task_repo.update(task.id, Task(id=None, title="Final proposal", completed=False))
+    task_repo.delete(other.id)
+    
+    assert task_repo.search("draft", 10).items == []
+    assert [t.id for t in task_repo.search("final", 10).items] == [task.id]
+    
+def test_search_without_terms(task_repo):
+    """Test queries without word characters return an empty page"""
+    task_repo.create("Task")
+    
+    page = task_repo.search("%*\"", 10)
+    
+    assert page.items == []
+    assert page.next_cursor is None
+    
+def test_list_page_title_prefix_escapes_wildcards(task_repo):
+    """Test LIKE wildcards in the prefix are matched literally"""
+    task_repo.create("100% done")
+    task_repo.create("100 tasks")
+    
+    assert [t.title for t in task_repo.list_page(10, title_prefix="100%").items] == ["100% done"]
+    
+def test_stats_follow_every_write_path(task_repo):
+    """Test the counter row tracks single, bulk and raw Core writes"""
+    first = task_repo.create("Task 1")
+    task_repo.create_many(["Task 2", "Task 3", "Task 4"])
+    task_repo.mark_complete(first.id)
+    task_repo.mark_complete(first.id)
+    task_repo.update(first.id, Task(id=None, title="Task 1 renamed", completed=True))
+    task_repo.update_many([Task(id=first.id + 1, title="Task 2", completed=True)])
+    task_repo.delete_many([first.id + 2, 999])
+    
+    stats = task_repo.stats()
+    
+    assert (stats.total, stats.completed, stats.pending) == (3, 2, 1)
+    assert task_repo.stats() == _aggregate_stats(task_repo)
+    
+def test_stats_counter_seeded_on_existing_database(tmp_path):
+    """Test a database created before the counter is seeded from its rows"""
+    from sqlalchemy import insert
+    from app.infrastructure.db.migrate import run_migrations
+    from app.infrastructure.db.models.task_model import TaskModel, utcnow
+    test_engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    TaskModel.__table__.create(test_engine)
+    with test_engine.begin() as conn:
+        conn.execute(insert(TaskModel), [
+            {"title": f"Task {i}", "completed": i % 3 == 0, "version": i, "updated_at": utcnow()} for i in range(10)
+        ])
+    
+    run_migrations(test_engine)
+    run_migrations(test_engine)
+    with sessionmaker(bind=test_engine)() as db:
+        stats = TaskSQLAlchemyRepo(db).stats()
+    test_engine.dispose()
+    
+    assert (stats.total, stats.completed, stats.pending) == (10, 4, 6)
+    
+def test_stats_counter_reseeded_to_count_the_archive(tmp_path):
+    """Test a counter set up before it counted archived tasks is seeded again"""
+    from sqlalchemy import text
+    from app.infrastructure.db.migrate import run_migrations
+    test_engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    run_migrations(test_engine)
+    with sessionmaker(bind=test_engine)() as db:
+        repo = TaskSQLAlchemyRepo(db)
+        tasks = [repo.create(f"Task {i}") for i in range(3)]
+        repo.mark_complete(tasks[0].id)
+        db.execute(text("DROP TRIGGER task_stats_archive_ai"))
+        db.execute(text("DROP TRIGGER task_stats_archive_ad"))
+        repo.archive_completed(utcnow() + timedelta(days=1), 10)
+        db.commit()
+    
+    run_migrations(test_engine)
+    with sessionmaker(bind=test_engine)() as db:
+        stats = TaskSQLAlchemyRepo(db).stats()
+    test_engine.dispose()
+    
+    assert (stats.total, stats.completed, stats.pending) == (3, 1, 2)
+    
+def _aggregate_stats(task_repo):
+    with patch('app.infrastructure.repositories.task_sqlalchemy_repo.settings.TASKS_STATS_COUNTER_ENABLED', False):
+        return task_repo.stats()
+    
+def test_archive_moves_old_completed_tasks(task_repo):
+    """Test completed tasks leave the hot table in batches but stay readable by id"""
+    from app.infrastructure.repositories.task_sqlalchemy_repo import archive_completed_tasks
+    tasks = [task_repo.create(f"Task {i}") for i in range(6)]
+    for task in tasks:
+        task_repo.mark_complete(task.id)
+    pending = task_repo.create("Pending")
+    fingerprint = task_repo.list_fingerprint()
+    
+    assert task_repo.archive_completed(utcnow() - timedelta(days=1), 10) == 0
+    assert archive_completed_tasks(-1, 2) == 6
+    
+    assert [t.id for t in task_repo.get_all()] == [pending.id]
+    archived = task_repo.get_by_id(tasks[0].id)
+    assert (archived.id, archived.title, archived.completed) == (tasks[0].id, "Task 0", True)
+    assert task_repo.stats().total == 7
+    assert task_repo.search("Task", 10).items == []
+    assert task_repo.list_fingerprint().last_modified > fingerprint.last_modified
+    
+def test_stats_count_archived_tasks(task_repo):
+    """Test archiving leaves the stats alone, and writes to archived tasks still move them"""
+    tasks = [task_repo.create(f"Task {i}") for i in range(4)]
+    for task in tasks[:2]:
+        task_repo.mark_complete(task.id)
+    before = task_repo.stats()
+    
+    assert task_repo.archive_completed(utcnow() + timedelta(days=1), 10) == 2
+    archived = task_repo.stats()
+    task_repo.update(tasks[0].id, Task(id=None, title="Reopened", completed=False))
+    task_repo.delete(tasks[1].id)
+    
+    assert (before.total, before.completed) == (4, 2)
+    assert archived == before
+    assert (task_repo.stats().total, task_repo.stats().completed) == (3, 0)
+    assert task_repo.stats() == _aggregate_stats(task_repo)
+    
+def test_archived_task_ids_are_not_reused(task_repo):
+    """Test tasks created after the newest one is deleted never take an archived id"""
+    tasks = [task_repo.create(f"Task {i}") for i in range(4)]
+    for task in tasks[1:3]:
+        task_repo.mark_complete(task.id)
+    
+    assert task_repo.archive_completed(utcnow() + timedelta(days=1), 10) == 2
+    task_repo.delete(tasks[3].id)
+    created = task_repo.create("New")
+    task_repo.delete(created.id)
+    
+    assert created.id > tasks[3].id
+    assert task_repo.get_by_id(tasks[1].id).title == "Task 1"
+    
+def test_writes_to_archived_tasks(task_repo):
+    """Test updates restore an archived task and deletes remove it from the archive"""
+    tasks = [task_repo.create(f"Task {i}") for i in range(5)]
+    for task in tasks[:4]:
+        task_repo.mark_complete(task.id)
+    task_repo.archive_completed(utcnow() + timedelta(days=1), 10)
+    
+    updated = task_repo.update(tasks[0].id, Task(id=None, title="Reopened", completed=False))
+    completed = task_repo.mark_complete(tasks[1].id)
+    bulk = task_repo.update_many([Task(id=tasks[2].id, title="Bulk", completed=True), Task(id=999, title="Missing", completed=True)])
+    task_repo.delete(tasks[3].id)
+    
+    assert (updated.title, updated.completed) == ("Reopened", False)
+    assert completed.completed is True
+    assert [r.ok for r in bulk] == [True, False]
+    assert [t.title for t in task_repo.get_all()] == ["Reopened", "Task 1", "Bulk", "Task 4"]
+    assert task_repo.search("reopened", 10).items[0].id == tasks[0].id
+    assert task_repo.stats().total == 4
+    with pytest.raises(ValueError):
+        task_repo.get_by_id(tasks[3].id)
+    assert [d.id for d in task_repo.changes_since(0, 100).deleted] == [tasks[3].id]
+    
+def test_delete_removes_live_and_archived_rows(task_repo, db_session):
+    """Test deletes clear an id from both tables when each holds a row for it"""
+    from sqlalchemy import insert
+    from app.infrastructure.db.models.task_archive_model import TaskArchiveModel
+    tasks = [task_repo.create(f"Task {i}") for i in range(2)]
+    with db_session() as db:
+        db.execute(insert(TaskArchiveModel), [
+            {"task_id": t.id, "title": "Old", "completed": True, "version": 0, "updated_at": utcnow(), "archived_at": utcnow()}
+            for t in tasks
+        ])
+        db.commit()
+    
+    task_repo.delete(tasks[0].id)
+    results = task_repo.delete_many([tasks[1].id])
+    
+    assert [r.ok for r in results] == [True]
+    for task in tasks:
+        with pytest.raises(ValueError):
+            task_repo.get_by_id(task.id)
+    
+def test_delete_many_removes_archived_tasks(task_repo):
+    """Test bulk deletes find tasks in either table"""
+    tasks = [task_repo.create(f"Task {i}") for i in range(3)]
+    task_repo.mark_complete(tasks[0].id)
+    task_repo.archive_completed(utcnow() + timedelta(days=1), 10)
+    
+    results = task_repo.delete_many([tasks[0].id, tasks[1].id, 999])
+    
+    assert [r.ok for r in results] == [True, True, False]
+    assert [t.id for t in task_repo.get_all()] == [tasks[2].id]
+    with pytest.raises(ValueError):
+        task_repo.get_by_id(tasks[0].id)
@@ -0,0 +1,94 @@
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from unittest.mock import patch
+
+from app.infrastructure.db.models.base import Base
+from app.infrastructure.repositories.task_sqlalchemy_repo import TaskSQLAlchemyRepo
+from app.infrastructure.repositories.task_write_pipeline import TaskWritePipeline
+from app.infrastructure.repositories.coalescing_task_repo import CoalescingTaskRepository
+
+@pytest.fixture
+def session_factory(tmp_path):
+    test_engine = create_engine(f"sqlite:///{tmp_path / 'tasks.db'}")
+    Base.metadata.create_all(bind=test_engine)
+    yield sessionmaker(bind=test_engine)
+    test_engine.dispose()
+
+@pytest.fixture
+def pipeline(session_factory):
+    pipeline = TaskWritePipeline(max_batch_size=10, max_delay_ms=50, session_factory=session_factory)
+    pipeline.start()
+    yield pipeline
+    pipeline.stop()
+
+def test_concurrent_writes_are_committed_in_batches(pipeline, session_factory):
+    """Test each caller gets its own task while the writes share commits"""
+    repo = CoalescingTaskRepository(TaskSQLAlchemyRepo(session_factory()), pipeline)
+    
+    with ThreadPoolExecutor(10) as executor:
+        created = list(executor.map(lambda i: repo.create(f"Task {i}"), range(30)))
+        
+    assert sorted(task.title for task in created) == sorted(f"Task {i}" for i in range(30))
+    assert len({task.id for task in created}) == 30
+    assert len(TaskSQLAlchemyRepo(session_factory()).get_all()) == 30
+    snapshot = pipeline.snapshot()
+    assert snapshot["writes"] == 30
+    assert snapshot["batches"] < 30
+    assert snapshot["max_batch_size"] <= 10
+
+def test_failed_write_does_not_undo_its_batch(pipeline, session_factory):
+    """Test a missing id fails only its own caller and the rest of the batch commits"""
+    repo = CoalescingTaskRepository(TaskSQLAlchemyRepo(session_factory()), pipeline)
+    task = repo.create("Task")
+    
+    def write(i):
+        if i == 2:
+            return repo.mark_complete(999)
+        if i == 3:
+            return repo.mark_complete(task.id)
+        return repo.create(f"Task {i}")
+        
+    with ThreadPoolExecutor(5) as executor:
+        futures = [executor.submit(write, i) for i in range(5)]
+        
+    with pytest.raises(ValueError, match="not found"):
+        futures[2].result()
+    assert futures[3].result().completed is True
+    stored = TaskSQLAlchemyRepo(session_factory()).get_all()
+    assert len(stored) == 4
+    assert [t.completed for t in stored if t.id == task.id] == [True]
+
+def test_failed_commit_fails_every_caller(pipeline, session_factory):
+    """Test writes whose commit fails are reported to their callers, not lost silently"""
+    with patch("sqlalchemy.orm.Session.commit", side_effect=RuntimeError("disk full")):
+        with pytest.raises(RuntimeError, match="Failed to commit task writes: disk full"):
+            pipeline.submit(lambda repo: repo.create("Task"))
+            
+    assert TaskSQLAlchemyRepo(session_factory()).get_all() == []
+    assert pipeline.snapshot()["failed_commits"] == 1
+
+def test_stop_commits_queued_writes(session_factory):
+    """Test writes queued before stop are still committed"""
+    pipeline = TaskWritePipeline(max_batch_size=100, max_delay_ms=1000, session_factory=session_factory)
+    pipeline.start()
+    
+    with ThreadPoolExecutor(3) as executor:
+        futures = [executor.submit(pipeline.submit, lambda repo, i=i: repo.create(f"Task {i}")) for i in range(3)]
+        while pipeline._queue.qsize() < 3 and not all(f.done() for f in futures):
+            pass
+        pipeline.stop()
+        
+    assert sorted(f.result().title for f in futures) == ["Task 0", "Task 1", "Task 2"]
+    assert not pipeline.running
+    
+def test_submit_after_stop_raises(session_factory):
+    """Test a write submitted to a stopped pipeline fails instead of waiting forever"""
+    pipeline = TaskWritePipeline(max_batch_size=10, max_delay_ms=50, session_factory=session_factory)
+    pipeline.start()
+    pipeline.stop()
+    
+    with pytest.raises(RuntimeError, match="Task write pipeline is not running"):
+        pipeline.submit(lambda repo: repo.create("Task"))
+    assert pipeline._queue.qsize() == 0
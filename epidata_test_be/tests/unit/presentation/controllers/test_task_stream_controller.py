@@ -0,0 +1,27 @@
+import asyncio
+from fastapi import FastAPI
+
+from app.infrastructure.events.task_events import task_event_broker
+from app.presentation.controllers import task_stream_controller
+
+def test_websocket_unsubscribes_on_disconnect():
+    """Test a client leaving a quiet feed is noticed without waiting for the next event"""
+    app = FastAPI()
+    app.include_router(task_stream_controller.router)
+    scope = {"type": "websocket", "path": "/tasks/stream/ws", "headers": [], "query_string": b""}
+    sent = []
+    
+    async def run():
+        messages = asyncio.Queue()
+        for message in ({"type": "websocket.connect"}, {"type": "websocket.disconnect", "code": 1000}):
+            messages.put_nowait(message)
+            
+        async def send(message):
+            sent.append(message["type"])
+            
+        await asyncio.wait_for(app(scope, messages.get, send), timeout=5)
+        
+    asyncio.run(run())
+    
+    assert sent == ["websocket.accept"]
+    assert task_event_broker.snapshot()["subscribers"] == 0
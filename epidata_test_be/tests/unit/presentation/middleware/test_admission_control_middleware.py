@@ -0,0 +1,127 @@
+import asyncio
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.presentation.middleware.admission_control_middleware import (
+    AdmissionController, AdmissionControlMiddleware, classify, parse_route_limits
+)
+
+LOOKUP, LIST, EXPORT = classify("GET", "/api/tasks/1"), classify("GET", "/api/tasks"), classify("GET", "/api/tasks/export")
+
+@pytest.mark.parametrize("method,path,expected", [
+    ("GET", "/api/tasks/42", "lookup"),
+    ("GET", "/api/tasks", "list"),
+    ("GET", "/api/tasks/search", "list"),
+    ("GET", "/api/tasks/export", "export"),
+    ("POST", "/api/tasks", "write"),
+    ("PATCH", "/api/tasks/42/complete", "write"),
+    ("DELETE", "/api/tasks/bulk", "bulk"),
+    ("GET", "/api/tasks/stream", None),
+    ("GET", "/metrics", None)
+])
+def test_classify(method, path, expected):
+    """Test routes map to their class and the change stream is never limited"""
+    route_class = classify(method, path)
+    assert (route_class.name if route_class else None) == expected
+    
+def test_waiters_are_admitted_by_priority():
+    """Test a freed slot goes to a queued lookup before earlier lists and exports"""
+    async def scenario():
+        controller = AdmissionController(1, {}, queue_size=10, queue_timeout_ms=1000)
+        order = []
+        
+        async def request(route_class):
+            assert await controller.acquire(route_class)
+            order.append(route_class.name)
+            controller.release(route_class)
+            
+        assert await controller.acquire(LIST)
+        waiting = [asyncio.create_task(request(rc)) for rc in (EXPORT, LIST, LOOKUP)]
+        await asyncio.sleep(0)
+        assert controller.snapshot()["queued"] == 3
+        controller.release(LIST)
+        await asyncio.gather(*waiting)
+        return order, controller.snapshot()
+        
+    order, snapshot = asyncio.run(scenario())
+    
+    assert order == ["lookup", "list", "export"]
+    assert (snapshot["in_flight"], snapshot["queued"], snapshot["list_admitted"]) == (0, 0, 2)
+    
+def test_route_limit_leaves_room_for_other_classes():
+    """Test lists beyond their limit queue while lookups are still admitted"""
+    async def scenario():
+        controller = AdmissionController(10, {"list": 1}, queue_size=10, queue_timeout_ms=1000)
+        assert await controller.acquire(LIST)
+        second_list = asyncio.create_task(controller.acquire(LIST))
+        await asyncio.sleep(0)
+        lookup_admitted = await controller.acquire(LOOKUP)
+        queued = controller.snapshot()["list_queued"]
+        controller.release(LIST)
+        return lookup_admitted, queued, await second_list
+        
+    assert asyncio.run(scenario()) == (True, 1, True)
+    
+def test_full_queue_sheds_lowest_priority():
+    """Test a full queue turns away equal priority and evicts lower priority waiters"""
+    async def scenario():
+        controller = AdmissionController(1, {}, queue_size=1, queue_timeout_ms=1000)
+        assert await controller.acquire(LOOKUP)
+        queued_list = asyncio.create_task(controller.acquire(LIST))
+        await asyncio.sleep(0)
+        second_list = await controller.acquire(LIST)
+        queued_lookup = asyncio.create_task(controller.acquire(LOOKUP))
+        await asyncio.sleep(0)
+        evicted = await queued_list
+        controller.release(LOOKUP)
+        return second_list, evicted, await queued_lookup, controller.snapshot()
+        
+    second_list, evicted, lookup, snapshot = asyncio.run(scenario())
+    
+    assert (second_list, evicted, lookup) == (False, False, True)
+    assert snapshot["list_shed"] == 2
+    
+def test_queue_timeout_sheds_waiter():
+    """Test a request queued past the deadline is shed and leaves the queue"""
+    async def scenario():
+        controller = AdmissionController(1, {}, queue_size=10, queue_timeout_ms=10)
+        assert await controller.acquire(LIST)
+        admitted = await controller.acquire(LOOKUP)
+        return admitted, controller.snapshot()
+        
+    admitted, snapshot = asyncio.run(scenario())
+    
+    assert admitted is False
+    assert (snapshot["queued"], snapshot["lookup_shed"], snapshot["in_flight"]) == (0, 1, 1)
+    
+def test_middleware_answers_503_with_retry_after():
+    """Test a shed request gets 503 and Retry-After while unclassified routes pass"""
+    app = FastAPI()
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        controller=AdmissionController(0, {}, queue_size=10, queue_timeout_ms=1),
+        retry_after_seconds=2
+    )
+    
+    @app.get("/api/tasks")
+    def list_tasks():
+        return {"ok": True}
+        
+    @app.get("/health")
+    def health():
+        return {"ok": True}
+        
+    client = TestClient(app)
+    shed = client.get("/api/tasks")
+    
+    assert shed.status_code == 503
+    assert shed.headers["retry-after"] == "2"
+    assert shed.json()["estado"] == "error"
+    assert client.get("/health").status_code == 200
+    
+def test_parse_route_limits():
+    """Test limits are read per class and typos fail at startup"""
+    assert parse_route_limits("lookup:15, list:6,") == {"lookup": 15, "list": 6}
+    with pytest.raises(ValueError, match="Invalid admission route limit: lists:6"):
+        parse_route_limits("lists:6")
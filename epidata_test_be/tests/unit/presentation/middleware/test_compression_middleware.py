@@ -0,0 +1,113 @@
+import asyncio
+import gzip
+import zlib
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.presentation.middleware.compression_middleware import CompressionMiddleware, available_encodings, negotiate_encoding
+from app.presentation.schemas.response_utils import ok_response
+
+LEVELS = {"gzip": 6}
+
+def make_client():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, encodings=["gzip"], minimum_size=500, levels=LEVELS)
+    
+    @app.get("/items")
+    def get_items(count: int):
+        response = ok_response("ok", [{"id": i, "title": f"Task {i}"} for i in range(count)])
+        response.headers["ETag"] = '"items-1"'
+        return response
+        
+    @app.get("/events")
+    def get_events():
+        return Response("data: x\n\n" * 200, media_type="text/event-stream")
+        
+    return TestClient(app)
+
+def test_large_response_is_compressed():
+    """Test a body over the threshold is gzipped with a weak ETag and Vary"""
+    plain = make_client().get("/items?count=100", headers={"Accept-Encoding": "identity"})
+    response = make_client().get("/items?count=100", headers={"Accept-Encoding": "gzip"})
+    
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"] == 'W/"items-1"'
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.content == plain.content
+    assert "content-encoding" not in plain.headers
+    assert plain.headers["vary"] == "Accept-Encoding"
+
+def test_small_and_non_compressible_responses_untouched():
+    """Test single items and the event stream go out as they are"""
+    client = make_client()
+    
+    small = client.get("/items?count=1", headers={"Accept-Encoding": "gzip"})
+    events = client.get("/events", headers={"Accept-Encoding": "gzip"})
+    
+    assert "content-encoding" not in small.headers
+    assert small.headers["etag"] == '"items-1"'
+    assert "content-encoding" not in events.headers
+    assert "vary" not in events.headers
+
+def test_streamed_response_compressed_incrementally():
+    """Test chunks of a stream are compressed and sent before the stream ends"""
+    chunks = [b'{"id": %d}\n' % i * 50 for i in range(3)]
+    sent = []
+    delivered = []
+    
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/x-ndjson")]})
+        for i, chunk in enumerate(chunks):
+            await send({"type": "http.response.body", "body": chunk, "more_body": i < len(chunks) - 1})
+            body = b"".join(m["body"] for m in sent if m["type"] == "http.response.body")
+            delivered.append(zlib.decompressobj(31).decompress(body))
+            
+    async def send(message):
+        sent.append(message)
+        
+    middleware = CompressionMiddleware(app, encodings=["gzip"], minimum_size=100, levels=LEVELS)
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": [(b"accept-encoding", b"gzip")]}
+    asyncio.run(middleware(scope, None, send))
+    
+    headers = dict(sent[0]["headers"])
+    bodies = [m for m in sent if m["type"] == "http.response.body"]
+    assert headers[b"content-encoding"] == b"gzip"
+    assert b"content-length" not in headers
+    assert bodies[-1]["more_body"] is False
+    assert gzip.decompress(b"".join(m["body"] for m in bodies)) == b"".join(chunks)
+    assert delivered == [b"".join(chunks[:i + 1]) for i in range(len(chunks))]
+
+def test_streamed_response_below_threshold_sent_whole():
+    """Test a short stream is buffered and sent uncompressed in one message"""
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, encodings=["gzip"], minimum_size=500, levels=LEVELS)
+    
+    @app.get("/export")
+    def export():
+        return StreamingResponse(iter([b"a\n", b"b\n"]), media_type="application/x-ndjson")
+        
+    response = TestClient(app).get("/export", headers={"Accept-Encoding": "gzip"})
+    
+    assert "content-encoding" not in response.headers
+    assert response.content == b"a\nb\n"
+
+@pytest.mark.parametrize("accept,expected", [
+    ("gzip, deflate, br", "br"),
+    ("br;q=0.5, gzip", "gzip"),
+    ("gzip;q=0", None),
+    ("*", "zstd"),
+    ("*;q=0.1, zstd;q=0", "br"),
+    ("identity", None),
+    ("", None)
+])
+def test_negotiate_encoding(accept, expected):
+    """Test q-values win and server preference breaks ties"""
+    assert negotiate_encoding(accept, ["zstd", "br", "gzip"]) == expected
+
+def test_available_encodings_rejects_unknown():
+    """Test a misspelt encoding in the settings fails at startup"""
+    assert available_encodings(["gzip", " "]) == ["gzip"]
+    with pytest.raises(ValueError, match="Unknown compression encoding: deflate"):
+        available_encodings(["deflate"])
@@ -0,0 +1,49 @@
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.presentation.middleware.read_your_writes_middleware import PRIMARY_READS_COOKIE, ReadYourWritesMiddleware, reads_pinned_to_primary
+from app.presentation.schemas.response_utils import ok_response, error_response
+
+def make_client():
+    app = FastAPI()
+    app.add_middleware(ReadYourWritesMiddleware, window_seconds=5)
+    
+    @app.get("/items")
+    def get_items(request: Request):
+        return ok_response("ok", {"pinned": reads_pinned_to_primary(request)})
+    
+    @app.post("/items")
+    def create_item(fail: bool = False):
+        if fail:
+            return error_response("Error creating item", RuntimeError("boom"), status_code=500)
+        return ok_response("ok", None)
+    
+    return TestClient(app)
+
+def test_write_pins_following_reads_to_primary():
+    """Test a successful write sets the cookie the next reads are routed by"""
+    client = make_client()
+    
+    before = client.get("/items")
+    write = client.post("/items")
+    after = client.get("/items")
+    
+    assert before.json()["data"] == {"pinned": False}
+    assert PRIMARY_READS_COOKIE in write.headers["set-cookie"]
+    assert "Max-Age=5" in write.headers["set-cookie"]
+    assert "set-cookie" not in after.headers
+    assert after.json()["data"] == {"pinned": True}
+    
+def test_failed_write_and_expired_pin_do_not_pin():
+    """Test errors set no cookie and an expired or garbled cookie is ignored"""
+    client = make_client()
+    
+    failed = client.post("/items?fail=true")
+    client.cookies.set(PRIMARY_READS_COOKIE, "1.0")
+    expired = client.get("/items")
+    client.cookies.set(PRIMARY_READS_COOKIE, "soon")
+    garbled = client.get("/items")
+    
+    assert "set-cookie" not in failed.headers
+    assert expired.json()["data"] == {"pinned": False}
+    assert garbled.json()["data"] == {"pinned": False}
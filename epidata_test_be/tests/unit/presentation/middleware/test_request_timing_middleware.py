@@ -0,0 +1,37 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.infrastructure.metrics.app_metrics import http_request_duration
+from app.infrastructure.metrics.request_timings import count_hydrated
+from app.presentation.middleware.request_timing_middleware import RequestTimingMiddleware
+from app.presentation.schemas.response_utils import ok_response
+
+def make_client(server_timing=True):
+    app = FastAPI()
+    app.add_middleware(RequestTimingMiddleware, server_timing=server_timing, slow_request_log=False, slow_request_threshold_ms=1000)
+    
+    @app.get("/items/{item_id}")
+    def get_item(item_id: int):
+        count_hydrated()
+        return ok_response("ok", {"id": item_id})
+    
+    return TestClient(app)
+
+def test_server_timing_header_from_sync_route():
+    """Test a sync route running in the threadpool reports into the request timings"""
+    response = make_client().get("/items/1")
+    
+    header = response.headers["server-timing"]
+    assert "serialize;dur=" in header
+    assert 'hydrate;desc="1 rows"' in header
+    
+def test_histogram_uses_route_template():
+    """Test requests to different ids share one per-route series"""
+    before = http_request_duration.count(method="GET", route="/items/{item_id}", status="200")
+    client = make_client(server_timing=False)
+    
+    response = client.get("/items/1")
+    client.get("/items/2")
+    
+    assert "server-timing" not in response.headers
+    assert http_request_duration.count(method="GET", route="/items/{item_id}", status="200") == before + 2
@@ -0,0 +1,51 @@
+from datetime import datetime, timezone
+from starlette.requests import Request
+
+from app.domain.models.task_entity import Task
+from app.domain.models.task_list_fingerprint import TaskListFingerprint
+from app.presentation.schemas.conditional_utils import task_etag, list_etag, is_not_modified, not_modified_response
+
+LAST_MODIFIED = datetime(2025, 1, 2, 3, 4, 5, 678000, tzinfo=timezone.utc)
+
+def make_request(**headers):
+    raw = [(k.replace("_", "-").encode("latin-1"), v.encode("latin-1")) for k, v in headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw})
+
+class TestConditionalUtils:
+    """Test cases for ETag / Last-Modified handling"""
+    
+    def test_etags(self):
+        """Test task and list ETags are strong and built from versions"""
+        assert task_etag(Task(id=1, title="Task", version=7)) == '"task-1-7"'
+        assert list_etag(TaskListFingerprint(max_version=9, count=3)) == '"tasks-9-3"'
+        
+    def test_if_none_match(self):
+        """Test If-None-Match matches any listed, weak or wildcard tag"""
+        etag = '"task-1-7"'
+        
+        assert is_not_modified(make_request(if_none_match='"task-1-6", W/"task-1-7"'), etag, None)
+        assert is_not_modified(make_request(if_none_match="*"), etag, None)
+        assert not is_not_modified(make_request(if_none_match='"task-1-6"'), etag, None)
+        
+    def test_if_none_match_takes_precedence(self):
+        """Test If-Modified-Since is ignored when If-None-Match is present"""
+        request = make_request(if_none_match='"other"', if_modified_since="Thu, 02 Jan 2025 03:04:05 GMT")
+        
+        assert not is_not_modified(request, '"task-1-7"', LAST_MODIFIED)
+        
+    def test_if_modified_since(self):
+        """Test If-Modified-Since compares at second precision"""
+        etag = '"task-1-7"'
+        
+        assert is_not_modified(make_request(if_modified_since="Thu, 02 Jan 2025 03:04:05 GMT"), etag, LAST_MODIFIED)
+        assert not is_not_modified(make_request(if_modified_since="Thu, 02 Jan 2025 03:04:04 GMT"), etag, LAST_MODIFIED)
+        assert not is_not_modified(make_request(if_modified_since="not a date"), etag, LAST_MODIFIED)
+        
+    def test_not_modified_response(self):
+        """Test 304 responses carry validators and no body"""
+        response = not_modified_response('"task-1-7"', LAST_MODIFIED)
+        
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["etag"] == '"task-1-7"'
+        assert response.headers["last-modified"] == "Thu, 02 Jan 2025 03:04:05 GMT"
@@ -0,0 +1,41 @@
+from datetime import datetime, timezone
+from app.domain.models.task_entity import Task
+from app.presentation.schemas.export_utils import ndjson_chunks, csv_chunks
+
+UPDATED_AT = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+TASKS = [
+    Task(id=1, title="Task 1", completed=False, version=1, updated_at=UPDATED_AT),
+    Task(id=2, title="Task, with comma", completed=True, version=3, updated_at=UPDATED_AT),
+    Task(id=3, title="Tarea ñ", completed=False, version=2, updated_at=UPDATED_AT)
+]
+
+class TestExportUtils:
+    """Test cases for the streaming export serializers"""
+    
+    def test_ndjson_chunks_one_line_per_task(self):
+        """Test NDJSON output is grouped in chunks with one task per line"""
+        chunks = list(ndjson_chunks(iter(TASKS), rows_per_chunk=2))
+        
+        assert len(chunks) == 2
+        assert b"".join(chunks).decode("utf-8").splitlines() == [
+            '{"id":1,"title":"Task 1","completed":false,"version":1,"updated_at":"2025-01-02T03:04:05+00:00"}',
+            '{"id":2,"title":"Task, with comma","completed":true,"version":3,"updated_at":"2025-01-02T03:04:05+00:00"}',
+            '{"id":3,"title":"Tarea ñ","completed":false,"version":2,"updated_at":"2025-01-02T03:04:05+00:00"}'
+        ]
+        
+    def test_csv_chunks_header_and_quoting(self):
+        """Test CSV output has a header and quotes titles when needed"""
+        chunks = list(csv_chunks(iter(TASKS), rows_per_chunk=2))
+        
+        assert len(chunks) == 2
+        assert "".join(chunks).splitlines() == [
+            "id,title,completed,version,updated_at",
+            "1,Task 1,false,1,2025-01-02T03:04:05+00:00",
+            '2,"Task, with comma",true,3,2025-01-02T03:04:05+00:00',
+            "3,Tarea ñ,false,2,2025-01-02T03:04:05+00:00"
+        ]
+        
+    def test_chunks_empty(self):
+        """Test exporting no tasks"""
+        assert list(ndjson_chunks(iter([]), rows_per_chunk=10)) == []
+        assert list(csv_chunks(iter([]), rows_per_chunk=10)) == ["id,title,completed,version,updated_at\r\n"]
@@ -0,0 +1,87 @@
+import orjson
+from unittest.mock import Mock
+
+from app.domain.models.idempotency_record import IdempotencyRecord
+from app.domain.repositories.idempotency_repository import IdempotencyRepository
+from app.infrastructure.db.models.task_model import utcnow
+from app.presentation.schemas.idempotency_utils import idempotent_response, request_hash
+from app.presentation.schemas.response_utils import ok_response, error_response
+from app.presentation.schemas.task_schema import TaskCreate
+
+PAYLOAD = TaskCreate(title="Task")
+
+def stored(status_code=200, body=b'{"stored":true}', payload=PAYLOAD):
+    return IdempotencyRecord("POST /tasks", "key", request_hash(payload), utcnow(), status_code, body)
+
+class TestIdempotentResponse:
+    """Test cases for running a handler once per Idempotency-Key"""
+    
+    def setup_method(self):
+        self.repo = Mock(spec=IdempotencyRepository)
+        self.handler = Mock(return_value=ok_response("Tarea creada", {"id": 1}))
+        
+    def test_without_key_runs_handler(self):
+        """Test requests without a key are not tracked"""
+        response = idempotent_response(self.repo, "POST /tasks", None, PAYLOAD, self.handler)
+        
+        assert response.status_code == 200
+        self.repo.find.assert_not_called()
+        
+    def test_first_request_stores_response(self):
+        """Test the first request runs the handler and stores its response"""
+        self.repo.find.return_value = None
+        self.repo.reserve.return_value = True
+        
+        response = idempotent_response(self.repo, "POST /tasks", "key", PAYLOAD, self.handler)
+        
+        self.handler.assert_called_once()
+        self.repo.complete.assert_called_once_with("POST /tasks", "key", 200, response.body)
+        
+    def test_replay_skips_handler(self):
+        """Test a retry returns the stored response without running the handler"""
+        self.repo.find.return_value = stored()
+        
+        response = idempotent_response(self.repo, "POST /tasks", "key", PAYLOAD, self.handler)
+        
+        self.handler.assert_not_called()
+        assert response.body == b'{"stored":true}'
+        assert response.headers["Idempotent-Replayed"] == "true"
+        
+    def test_concurrent_duplicate_replays_winner(self):
+        """Test losing the reservation race replays the winner's stored response"""
+        self.repo.find.side_effect = [None, stored()]
+        self.repo.reserve.return_value = False
+        
+        response = idempotent_response(self.repo, "POST /tasks", "key", PAYLOAD, self.handler)
+        
+        self.handler.assert_not_called()
+        assert response.body == b'{"stored":true}'
+        
+    def test_different_payload_is_rejected(self):
+        """Test reusing a key for another request body returns 422"""
+        self.repo.find.return_value = stored(payload=TaskCreate(title="Other"))
+        
+        response = idempotent_response(self.repo, "POST /tasks", "key", PAYLOAD, self.handler)
+        
+        assert response.status_code == 422
+        self.handler.assert_not_called()
+        
+    def test_in_progress_returns_conflict(self):
+        """Test a key without a stored response yet returns 409"""
+        self.repo.find.return_value = stored(status_code=None, body=None)
+        
+        response = idempotent_response(self.repo, "POST /tasks", "key", PAYLOAD, self.handler)
+        
+        assert response.status_code == 409
+        
+    def test_server_error_releases_key(self):
+        """Test a failed request frees its key so the retry runs again"""
+        self.repo.find.return_value = None
+        self.repo.reserve.return_value = True
+        self.handler.return_value = error_response("Error creating task", Exception("boom"), status_code=500)
+        
+        response = idempotent_response(self.repo, "POST /tasks", "key", PAYLOAD, self.handler)
+        
+        assert orjson.loads(response.body)["estado"] == "error"
+        self.repo.release.assert_called_once_with("POST /tasks", "key")
+        self.repo.complete.assert_not_called()
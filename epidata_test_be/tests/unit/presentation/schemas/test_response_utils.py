@@ -0,0 +1,39 @@
+import pytest
+from fastapi.responses import JSONResponse
+
+from app.domain.models.task_entity import Task
+from app.domain.models.task_page import TaskPage
+from app.presentation.schemas.base_response import ResponseSchema, PageResponseSchema
+from app.presentation.schemas.task_schema import TaskOut
+from app.presentation.schemas.response_utils import ok_response, ok_page_response, error_response
+
+TASKS = [Task(id=1, title="Tarea ñ \"uno\"", completed=False), Task(id=2, title="Task 2", completed=True)]
+
+def legacy_body(schema):
+    return JSONResponse(content=schema.model_dump()).body
+
+class TestResponseUtils:
+    """Test cases for the fast-path response helpers"""
+    
+    @pytest.mark.parametrize("data", [TASKS, TASKS[0], None, [], TaskOut(id=3, title="Out", completed=True)])
+    def test_ok_response_matches_legacy_bytes(self, data):
+        """Test ok_response keeps the JSON bytes ResponseSchema used to produce"""
+        response = ok_response("Tareas Obtenidas", data)
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.body == legacy_body(ResponseSchema(estado="ok", message="Tareas Obtenidas", data=data))
+        
+    def test_ok_page_response_matches_legacy_bytes(self):
+        """Test the paginated envelope keeps next_cursor after data"""
+        page = TaskPage(items=TASKS, next_cursor=2)
+        response = ok_page_response("Tareas Obtenidas", page.items, page.next_cursor)
+        
+        assert response.body == legacy_body(PageResponseSchema(estado="ok", message="Tareas Obtenidas", data=TASKS, next_cursor=2))
+        
+    def test_error_response_matches_legacy_bytes(self):
+        """Test error responses keep their status code and body"""
+        response = error_response("Error retrieving tasks", RuntimeError("boom"), status_code=500)
+        
+        assert response.status_code == 500
+        assert response.body == legacy_body(ResponseSchema(estado="error", message="Error retrieving tasks", data={"error": "boom"}))
@@ -0,0 +1,16 @@
+from unittest.mock import patch
+
+from app import serve
+
+def test_worker_count_defaults_to_cpus():
+    """Test one worker per available CPU, never fewer than two"""
+    with patch.object(serve.settings, "SERVER_WORKERS", None):
+        with patch.object(serve, "available_cpus", return_value=8):
+            assert serve.worker_count() == 8
+        with patch.object(serve, "available_cpus", return_value=1):
+            assert serve.worker_count() == 2
+            
+def test_worker_count_from_settings():
+    """Test SERVER_WORKERS overrides the CPU based default"""
+    with patch.object(serve.settings, "SERVER_WORKERS", 3):
+        assert serve.worker_count() == 3
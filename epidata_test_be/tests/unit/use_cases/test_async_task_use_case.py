@@ -0,0 +1,57 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+from app.domain.models.task_entity import Task
+from app.domain.models.task_page import TaskPage
+from app.domain.repositories.async_task_repository import AsyncTaskRepository
+from app.use_cases.async_task_use_case import AsyncTaskUseCase
+
+@pytest.fixture
+def mock_repository():
+    """Create an async mock repository for testing"""
+    return AsyncMock(spec=AsyncTaskRepository)
+
+@pytest.fixture
+def task_use_case(mock_repository):
+    """Create AsyncTaskUseCase instance with mocked repository"""
+    return AsyncTaskUseCase(mock_repository)
+
+class TestAsyncTaskUseCase:
+    """Test cases for AsyncTaskUseCase class"""
+    
+    def test_list_tasks_page_success(self, task_use_case, mock_repository):
+        """Test listing a page of tasks"""
+        expected_page = TaskPage(items=[Task(id=1, title="Task 1")], next_cursor=None)
+        mock_repository.list_page.return_value = expected_page
+        
+        result = asyncio.run(task_use_case.list_tasks_page(10, after=None, completed=False))
+        
+        assert result == expected_page
+        mock_repository.list_page.assert_awaited_once_with(10, None, False, None)
+        
+    def test_get_task_by_id_exception(self, task_use_case, mock_repository):
+        """Test getting a task by id when repository raises an exception"""
+        mock_repository.get_by_id.side_effect = ValueError("Task not found")
+        
+        with pytest.raises(ValueError, match="Task not found"):
+            asyncio.run(task_use_case.get_task_by_id(999))
+            
+    def test_use_case_methods_await_repository(self, task_use_case, mock_repository):
+        """Test that all use case methods delegate to repository correctly"""
+        task = Task(id=None, title="Test task", completed=False)
+        
+        async def scenario():
+            await task_use_case.list_tasks()
+            await task_use_case.get_task_by_id(1)
+            await task_use_case.create_task("Test task")
+            await task_use_case.update_task(1, task)
+            await task_use_case.mark_task_complete(1)
+            await task_use_case.delete_task(1)
+        asyncio.run(scenario())
+        
+        mock_repository.get_all.assert_awaited_once()
+        mock_repository.get_by_id.assert_awaited_once_with(1)
+        mock_repository.create.assert_awaited_once_with("Test task")
+        mock_repository.update.assert_awaited_once_with(1, task)
+        mock_repository.mark_complete.assert_awaited_once_with(1)
+        mock_repository.delete.assert_awaited_once_with(1)
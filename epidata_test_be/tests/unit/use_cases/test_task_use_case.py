@@ -1,6 +1,8 @@
 import pytest
 from unittest.mock import Mock
 from app.domain.models.task_entity import Task
+from app.domain.models.task_page import TaskPage
+from app.domain.models.bulk_result import BulkItemResult
 from app.domain.repositories.task_repository import TaskRepository
 from app.use_cases.task_use_case import TaskUseCase
 
@@ -42,6 +44,30 @@ class TestTaskUseCase:
         assert result == []
         mock_repository.get_all.assert_called_once()
     
+    def test_list_tasks_page_success(self, task_use_case, mock_repository):
+        """Test listing a page of tasks with filters"""
+        
+        expected_page = TaskPage(items=[Task(id=3, title="Task 3", completed=True)], next_cursor=3)
+        mock_repository.list_page.return_value = expected_page
+        
+        result = task_use_case.list_tasks_page(1, after=2, completed=True, title_prefix="Task")
+        
+        assert result == expected_page
+        mock_repository.list_page.assert_called_once_with(1, 2, True, "Task")
+        mock_repository.get_all.assert_not_called()
+    
+    def test_export_tasks_streams_from_repository(self, task_use_case, mock_repository):
+        """Test exporting tasks delegates to the streaming repository method"""
+        
+        expected_tasks = iter([Task(id=1, title="Task 1", completed=False)])
+        mock_repository.iter_all.return_value = expected_tasks
+        
+        result = task_use_case.export_tasks(500)
+        
+        assert result is expected_tasks
+        mock_repository.iter_all.assert_called_once_with(500)
+        mock_repository.get_all.assert_not_called()
+    
     def test_task_get_by_id_success(self, task_use_case, mock_repository):
         """Test getting a task by id successfully"""
         
@@ -147,6 +173,44 @@ class TestTaskUseCase:
         with pytest.raises(ValueError, match=("Task not found")):
             task_use_case.delete_task(task_id)
             
+    def test_bulk_methods_delegate_to_repository(self, task_use_case, mock_repository):
+        """Test bulk create, update and delete delegate to the bulk repository methods"""
+        tasks = [Task(id=1, title="Task 1", completed=True)]
+        mock_repository.create_many.return_value = [BulkItemResult(index=0, id=1, ok=True, task=tasks[0])]
+        mock_repository.delete_many.return_value = [BulkItemResult(index=0, id=2, ok=False, error="Task with ID 2 not found")]
+        
+        created = task_use_case.create_tasks(["Task 1"])
+        task_use_case.update_tasks(tasks)
+        deleted = task_use_case.delete_tasks([2])
+        
+        assert created[0].task == tasks[0]
+        assert not deleted[0].ok
+        mock_repository.create_many.assert_called_once_with(["Task 1"])
+        mock_repository.update_many.assert_called_once_with(tasks)
+        mock_repository.delete_many.assert_called_once_with([2])
+        mock_repository.create.assert_not_called()
+            
+    def test_list_changes_delegates_to_repository(self, task_use_case, mock_repository):
+        """Test listing changes since a version"""
+        from app.domain.models.task_changes import TaskChanges
+        expected = TaskChanges(tasks=[Task(id=1, title="Task 1", version=5)], next_since=5)
+        mock_repository.changes_since.return_value = expected
+        
+        result = task_use_case.list_changes(4, 100)
+        
+        assert result == expected
+        mock_repository.changes_since.assert_called_once_with(4, 100)
+            
+    def test_get_task_stats_delegates_to_repository(self, task_use_case, mock_repository):
+        """Test getting the task counts"""
+        from app.domain.models.task_stats import TaskStats
+        mock_repository.stats.return_value = TaskStats(total=3, completed=1, pending=2)
+        
+        result = task_use_case.get_task_stats()
+        
+        assert result == TaskStats(total=3, completed=1, pending=2)
+        mock_repository.stats.assert_called_once_with()
+            
     def test_use_case_methods_call_repository_correctly(self, task_use_case, mock_repository):
         """Test that all use case methods delegate to repository correctly"""
         task_id = 1
@@ -165,4 +229,32 @@ class TestTaskUseCase:
         assert mock_repository.create.call_count == 1
         assert mock_repository.update.call_count == 1
         assert mock_repository.mark_complete.call_count == 1
-        assert mock_repository.delete.call_count == 1
\ No newline at end of file
+        assert mock_repository.delete.call_count == 1
+        
+    def test_writes_publish_events(self, mock_repository):
+        """Test that successful writes publish one event per changed task"""
+        
+        events = Mock()
+        use_case = TaskUseCase(mock_repository, events)
+        mock_repository.create.return_value = Task(id=1, title="Task")
+        mock_repository.delete_many.return_value = [
+            BulkItemResult(index=0, id=2, ok=True),
+            BulkItemResult(index=1, id=3, ok=False, error="Task with ID 3 not found")
+        ]
+        
+        use_case.create_task("Task")
+        use_case.delete_tasks([2, 3])
+        
+        published = [call.args[0] for call in events.publish.call_args_list]
+        assert [(event.type, event.task_id) for event in published] == [("created", 1), ("deleted", 2)]
+        
+    def test_failed_write_publishes_nothing(self, mock_repository):
+        """Test that a write raising an error does not publish an event"""
+        
+        events = Mock()
+        mock_repository.update.side_effect = ValueError("Task with ID 1 not found")
+        
+        with pytest.raises(ValueError):
+            TaskUseCase(mock_repository, events).update_task(1, Task(id=1, title="Task"))
+            
+        events.publish.assert_not_called()
@@ -9,6 +9,7 @@ interface ApiResponse<T = unknown> {
   estado: string;
   message: string;
   data: T;
+  next_cursor?: number | null;
 }
 
 // Type guard to validate Task structure
@@ -38,10 +39,20 @@ export class TaskApiRepository implements TaskRepository {
     endpoint: string,
     options: RequestInit = {}
   ): Promise<T> {
+    const data = await this.makeEnvelopeRequest<T>(endpoint, options);
+    return data.data;
+  }
+
+  private async makeEnvelopeRequest<T>(
+    endpoint: string,
+    options: RequestInit = {}
+  ): Promise<ApiResponse<T>> {
     const response = await fetch(`${this.baseUrl}${endpoint}`, {
       headers: {
         "Content-Type": "application/json",
       },
+      // Carries the API's read-your-writes cookie, so reads after a write see it
+      credentials: "include",
       ...options,
     });
 
@@ -55,15 +66,23 @@ export class TaskApiRepository implements TaskRepository {
       throw new Error(data.message);
     }
 
-    return data.data;
+    return data;
   }
 
   async getAll(): Promise<Task[]> {
-    const data = await this.makeRequest<unknown>("/tasks");
-    if (!isTaskArray(data)) {
-      throw new Error("Invalid response format: expected Task array");
-    }
-    return data;
+    const tasks: Task[] = [];
+    let cursor: number | null | undefined = null;
+    do {
+      const query: string = cursor != null ? `?after=${cursor}` : "";
+      const page: ApiResponse<unknown> =
+        await this.makeEnvelopeRequest<unknown>(`/tasks${query}`);
+      if (!isTaskArray(page.data)) {
+        throw new Error("Invalid response format: expected Task array");
+      }
+      tasks.push(...page.data);
+      cursor = page.next_cursor;
+    } while (cursor != null);
+    return tasks;
   }
 
   async getById(id: number): Promise<Task> {